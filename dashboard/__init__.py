@@ -0,0 +1 @@
+"""Data, asset and page modules of the Streamlit dashboard (app.py)."""
@@ -0,0 +1,144 @@
+import os
+import argparse
+import threading
+from collections import OrderedDict
+import streamlit as st
+
+# --- CONFIGURATION ---
+ASSET_DIR = os.path.join("assets", "v2.0")
+VARIANT_DIR = os.path.join("assets", ".variants")  # generated, safe to delete
+VARIANT_WIDTHS = (480, 960, 1440)  # display widths (px) pre-generated per figure
+WEBP_QUALITY = 85
+PAGE_WIDTH = 1200  # approximate content width of the wide layout (px)
+PIXEL_RATIO = 1.5  # headroom for HiDPI screens
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024  # encoded variants kept in memory across reruns and sessions
+
+
+class BytesLRU:
+    """Thread-safe LRU bounded by total size rather than entry count (encoded images by default;
+    pass `sizeof` for other values, e.g. decoded frames)."""
+
+    def __init__(self, max_bytes=MEMORY_CACHE_BYTES, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._items:
+                self.bytes -= self.sizeof(self._items.pop(key))
+            self._items[key] = value
+            self.bytes += self.sizeof(value)
+            while self.bytes > self.max_bytes and len(self._items) > 1:
+                _, old = self._items.popitem(last=False)
+                self.bytes -= self.sizeof(old)
+
+
+@st.cache_resource
+def _memory():
+    return BytesLRU()
+
+
+def variant_path(filename, width):
+    return os.path.join(VARIANT_DIR, f"{os.path.splitext(filename)[0]}.{width}.webp")
+
+
+def build_variant(filename, width):
+    """Writes the WebP variant of one figure at `width` px (never upscaled). Returns its path."""
+    from PIL import Image  # only needed when a variant has to be (re)generated
+
+    src = os.path.join(ASSET_DIR, filename)
+    dst = variant_path(filename, width)
+    os.makedirs(VARIANT_DIR, exist_ok=True)
+    with Image.open(src) as img:
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        tmp = dst + ".tmp"
+        img.save(tmp, "WEBP", quality=WEBP_QUALITY, method=4)
+    os.replace(tmp, dst)
+    return dst
+
+
+def variant(filename, width):
+    """Path of an up-to-date variant, generated on first use or when the source figure changed."""
+    dst = variant_path(filename, width)
+    src_mtime = os.stat(os.path.join(ASSET_DIR, filename)).st_mtime
+    if not os.path.exists(dst) or os.stat(dst).st_mtime < src_mtime:
+        build_variant(filename, width)
+    return dst
+
+
+def pick_width(fraction=1.0):
+    """Smallest pre-generated width that fills a column spanning `fraction` of the page."""
+    target = PAGE_WIDTH * fraction * PIXEL_RATIO
+    return next((w for w in VARIANT_WIDTHS if w >= target), VARIANT_WIDTHS[-1])
+
+
+@st.cache_data(show_spinner=False)
+def _listing(version):
+    return frozenset(os.listdir(ASSET_DIR)) if os.path.isdir(ASSET_DIR) else frozenset()
+
+
+def available():
+    """Figure file names in ASSET_DIR, listed once per change of the folder."""
+    try:
+        version = os.stat(ASSET_DIR).st_mtime_ns
+    except OSError:
+        version = None
+    return _listing(version)
+
+
+def load(filename, width):
+    """Encoded WebP bytes of a figure at one display width, served from memory after the first use."""
+    key = (filename, width, os.stat(os.path.join(ASSET_DIR, filename)).st_mtime_ns)
+    cache = _memory()
+    data = cache.get(key)
+    if data is None:
+        with open(variant(filename, width), 'rb') as f:
+            data = f.read()
+        cache.put(key, data)
+    return data
+
+
+def show_asset(filenames, caption, fraction=1.0):
+    """Shows the first available figure of `filenames` (a name or fallback list), sized for a
+    column that spans `fraction` of the page width."""
+    names = [filenames] if isinstance(filenames, str) else list(filenames)
+    found = available()
+    name = next((n for n in names if n in found), None)
+    if name is None:
+        st.warning(f"Image placeholder: {names[0]}")
+        return
+    st.image(load(name, pick_width(fraction)), caption=caption, use_container_width=True)
+
+
+def build_all(widths=VARIANT_WIDTHS):
+    """Pre-generates every variant (e.g. at image build time). Returns (source bytes, variant bytes per width)."""
+    src_bytes, out_bytes = 0, {w: 0 for w in widths}
+    for name in sorted(os.listdir(ASSET_DIR)):
+        if not name.lower().endswith((".png", ".jpg", ".jpeg")):
+            continue
+        src_bytes += os.path.getsize(os.path.join(ASSET_DIR, name))
+        for w in widths:
+            out_bytes[w] += os.path.getsize(variant(name, w))
+    return src_bytes, out_bytes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-generates display-sized WebP variants of the dashboard figures.")
+    parser.parse_args()
+    src_bytes, out_bytes = build_all()
+    print(f"🖼️  Source figures: {src_bytes / 1e6:.1f} MB")
+    for w, size in out_bytes.items():
+        print(f"   {w:>5} px WebP: {size / 1e6:.1f} MB ({src_bytes / max(size, 1):.0f}x smaller)")
+    print(f"✅ Variants saved to {VARIANT_DIR}/")
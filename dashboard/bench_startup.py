@@ -0,0 +1,89 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import statistics
+
+from dashboard.pages import PAGES
+
+# --- CONFIGURATION ---
+APP_FILE = "app.py"
+RERUNS = 10
+RESULTS_FILE = os.path.join("runs", "dashboard_startup.json")
+
+
+def measure_page(label, reruns=RERUNS, app_file=APP_FILE):
+    """Times one page in this (fresh) process with Streamlit's headless AppTest runner.
+
+    harness_s: import of Streamlit and its test harness (paid by any app).
+    cold_start_s: first script run (default page) in the fresh process, i.e. the app's own share of
+                  time to first render after a restart.
+    first_visit_s: first run of `label` (its page module is imported here).
+    rerun_ms: median of `reruns` further runs of the same page, as a widget interaction would cause.
+    Also reports the top-level packages the first visit of the page had to import.
+    """
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(os.path.abspath(app_file), default_timeout=120)
+    harness = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    at.run()
+    cold_start = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(f"{label}: {at.exception[0].message}")
+    at_start = {name.split(".")[0] for name in sys.modules}
+
+    t0 = time.perf_counter()
+    at.sidebar.radio[0].set_value(label).run()
+    first_visit = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(f"{label}: {at.exception[0].message}")
+
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    return {"page": label, "harness_s": round(harness, 3), "cold_start_s": round(cold_start, 3), "first_visit_s": round(first_visit, 3),
+            "rerun_ms": round(1000 * statistics.median(times), 1),
+            "on_visit": sorted({name.split(".")[0] for name in sys.modules} - at_start)}
+
+
+def run(reruns=RERUNS, app_file=APP_FILE):
+    """Measures every page in its own Python process, so each one starts cold."""
+    rows = []
+    for label in PAGES:
+        out = subprocess.run([sys.executable, "-m", "dashboard.bench_startup", "--worker", label,
+                              "--reruns", str(reruns), "--app", app_file], capture_output=True, text=True)
+        if out.returncode != 0:
+            print(f"❌ {label}: {out.stderr.strip().splitlines()[-1] if out.stderr.strip() else 'failed'}")
+            continue
+        rows.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measures dashboard cold start and per-rerun time for every page.")
+    parser.add_argument("--reruns", type=int, default=RERUNS)
+    parser.add_argument("--app", default=APP_FILE, help="Streamlit script to measure (run from the repo root).")
+    parser.add_argument("--out", default=RESULTS_FILE, help="JSON file for the results.")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure_page(args.worker, args.reruns, args.app)))
+        sys.exit(0)
+
+    rows = run(args.reruns, args.app)
+    print(f"{'page':<28} {'harness':>8} {'cold start':>11} {'first visit':>12} {'rerun':>9}  imported on first visit")
+    for r in rows:
+        print(f"{r['page']:<28} {r['harness_s']:>7.2f}s {r['cold_start_s']:>10.2f}s {r['first_visit_s']:>11.2f}s "
+              f"{r['rerun_ms']:>7.1f}ms  "
+              f"{', '.join(r['on_visit']) or '-'}")
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(rows, f, indent=2)
+    print(f"⏱️  Startup report saved to {args.out}")
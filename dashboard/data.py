@@ -0,0 +1,210 @@
+import os
+import json
+import pandas as pd
+import streamlit as st
+
+# --- CONFIGURATION ---
+# Per-dataset folders, shared with the research scripts (main_benchmark.py --dataset, evaluate_results.py --dataset)
+DATASETS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "research codes", "configs", "datasets.json")
+with open(DATASETS_FILE, 'r') as f:
+    DATASETS = json.load(f)
+# Benchmark outputs per dataset (paths relative to the repo root, where the research scripts write them)
+DATASET_RESULTS = {name: paths["results"] for name, paths in DATASETS.items()}
+DATASET_TIMING = {name: os.path.join(paths["runs"], "timing.csv") for name, paths in DATASETS.items()}
+# Sequence folders (<seq>/img1/*.jpg) of each dataset, as downloaded for the benchmark runs
+DATASET_FRAMES = {name: paths["data"] for name, paths in DATASETS.items()}
+METRICS_FILE = "metrics.csv"
+SWEEPS_DIR = "sweeps"
+RENDERS_DIR = "renders"  # render_overlay.py's output: renders/<seq>/<tracker>/<key>.<mp4|webm>
+VIDEO_EXTENSIONS = (".mp4", ".webm")
+TRACKERS = ["StrongSORT", "DeepOCSORT", "ByteTrack"]
+
+# Published thesis results (A100), shown for any dataset without local benchmark output
+THESIS_RESULTS = {
+    "DanceTrack": {
+        'Tracker': ['StrongSORT', 'DeepOCSORT', 'ByteTrack'],
+        'HOTA': [42.2, 39.4, 38.2],
+        'IDF1': [40.4, 37.2, 39.5],
+        'DetA': [66.7, 65.7, 61.9],
+        'AssA': [27.0, 23.8, 23.8],
+        'IDSW': [2580, 1686, 2241],
+        'FPS':  [6.5, 18.5, 43.5]
+    },
+    "MOT17": {
+        'Tracker': ['StrongSORT', 'DeepOCSORT', 'ByteTrack'],
+        'HOTA': [42.8, 40.4, 39.7],
+        'IDF1': [51.3, 47.6, 46.9],
+        'DetA': [35.4, 34.1, 34.8],
+        'AssA': [52.0, 48.1, 45.6],
+        'IDSW': [2943, 2355, 2949],
+        'FPS':  [14.5, 22.0, 28.0]
+    },
+    "MOT20": {
+        'Tracker': ['StrongSORT', 'DeepOCSORT', 'ByteTrack'],
+        'HOTA': [14.5, 14.0, 14.3],
+        'IDF1': [14.7, 13.7, 14.7],
+        'DetA': [7.8, 7.0, 7.9],
+        'AssA': [27.0, 27.9, 25.9],
+        'IDSW': [2001, 1369, 1964],
+        'FPS':  [5.0, 8.5, 11.0]
+    }
+}
+THESIS_STABILITY_GAIN = 35  # % fewer ID switches than the baseline, as reported in the thesis
+
+
+# --- CACHED READERS ---
+# Every reader takes the file's mtime as an argument, so st.cache_data returns the parsed frame on
+# reruns and re-reads the file only after it changed. A stat per rerun is all a widget click costs.
+
+def file_version(path):
+    """Cache key part for a file: its mtime in ns, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _read_csv(path, version):
+    return pd.read_csv(path)
+
+
+def read_csv(path):
+    """Parsed CSV, re-read only when the file changes. None if it does not exist."""
+    version = file_version(path)
+    return None if version is None else _read_csv(path, version)
+
+
+# --- METRICS & TIMING ---
+
+def load_metrics(dataset):
+    """Per-sequence evaluation table of a dataset (evaluate_results.py's metrics.csv), or None."""
+    return read_csv(os.path.join(DATASET_RESULTS[dataset], METRICS_FILE))
+
+
+def load_timing(dataset):
+    """Timing report of a dataset's benchmark run (main_benchmark.py's timing.csv), or None."""
+    return read_csv(DATASET_TIMING[dataset])
+
+
+def pipeline_fps(timing):
+    """Measured end-to-end FPS per tracker (lower-cased name) from a timing report."""
+    rows = timing[(timing["seq"] == "ALL") & (timing["stage"] == "pipeline")]
+    return {str(t).lower(): fps for t, fps in zip(rows["tracker"], rows["fps"])}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _summary(dataset, metrics_version, timing_version):
+    metrics = load_metrics(dataset)
+    combined = metrics[metrics["seq"] == "COMBINED"]
+    timing = load_timing(dataset)
+    fps = pipeline_fps(timing) if timing is not None else {}
+    thesis_fps = dict(zip(THESIS_RESULTS[dataset]["Tracker"], THESIS_RESULTS[dataset]["FPS"]))
+
+    df = pd.DataFrame({
+        "Tracker": combined["tracker"].to_numpy(),
+        "HOTA": combined["HOTA"].round(1).to_numpy(),
+        "IDF1": combined["IDF1"].round(1).to_numpy(),
+        "DetA": combined["DetA"].round(1).to_numpy(),
+        "AssA": combined["AssA"].round(1).to_numpy(),
+        "IDSW": combined["IDSW"].astype(int).to_numpy(),
+    })
+    df["FPS"] = [round(fps[t.lower()], 1) if t.lower() in fps else thesis_fps.get(t) for t in df["Tracker"]]
+    return df.sort_values("HOTA", ascending=False, ignore_index=True)
+
+
+def dataset_summary(dataset):
+    """One row per tracker (Tracker, HOTA, IDF1, DetA, AssA, IDSW, FPS) and whether it was measured.
+
+    Uses the dataset's benchmark output when present (FPS from the timing report, else the thesis
+    value), otherwise the published thesis numbers.
+    """
+    metrics_version = file_version(os.path.join(DATASET_RESULTS[dataset], METRICS_FILE))
+    if metrics_version is None:
+        return pd.DataFrame(THESIS_RESULTS[dataset]), False
+    return _summary(dataset, metrics_version, file_version(DATASET_TIMING[dataset])), True
+
+
+def sequence_breakdown(dataset, metric="HOTA"):
+    """Per-sequence values of one metric (rows: sequences, columns: trackers), or None."""
+    metrics = load_metrics(dataset)
+    if metrics is None:
+        return None
+    per_seq = metrics[metrics["seq"] != "COMBINED"]
+    return per_seq.pivot(index="seq", columns="tracker", values=metric)
+
+
+def grandmaster_table():
+    """Cross-dataset comparison: HOTA per dataset, DanceTrack IDF1 and FPS, and IDSW averaged over datasets.
+
+    Returns the table and {dataset: measured}, since each dataset falls back to the thesis numbers on its own.
+    """
+    summaries, measured = {}, {}
+    for ds in THESIS_RESULTS:
+        df, measured[ds] = dataset_summary(ds)
+        summaries[ds] = df.set_index("Tracker")
+    trackers = [t for t in TRACKERS if all(t in s.index for s in summaries.values())]
+    return pd.DataFrame({
+        "Tracker": trackers,
+        "Dance HOTA": [summaries["DanceTrack"].at[t, "HOTA"] for t in trackers],
+        "MOT17 HOTA": [summaries["MOT17"].at[t, "HOTA"] for t in trackers],
+        "MOT20 HOTA": [summaries["MOT20"].at[t, "HOTA"] for t in trackers],
+        "Dance IDF1": [summaries["DanceTrack"].at[t, "IDF1"] for t in trackers],
+        "Dance FPS": [summaries["DanceTrack"].at[t, "FPS"] for t in trackers],
+        "Avg IDSW": [int(round(sum(s.at[t, "IDSW"] for s in summaries.values()) / len(summaries))) for t in trackers],
+    }), measured
+
+
+def headline_metrics(dataset="DanceTrack", tracker="DeepOCSORT", baseline="ByteTrack"):
+    """Overview page numbers: the recommended tracker's FPS and its ID-switch reduction vs the baseline."""
+    df, measured = dataset_summary(dataset)
+    df = df.set_index("Tracker")
+    gain = THESIS_STABILITY_GAIN
+    if measured and tracker in df.index and baseline in df.index and df.at[baseline, "IDSW"]:
+        gain = int(round(100 * (df.at[baseline, "IDSW"] - df.at[tracker, "IDSW"]) / df.at[baseline, "IDSW"]))
+    fps = df.at[tracker, "FPS"] if tracker in df.index else None
+    return {"datasets": len(THESIS_RESULTS), "stability_gain": gain,
+            "fps": None if pd.isna(fps) else fps, "measured": measured}
+
+
+# --- SWEEPS ---
+
+def list_sweeps():
+    """Names of sweeps with a results table (sweep.py's sweeps/<name>/results.csv)."""
+    if not os.path.isdir(SWEEPS_DIR):
+        return []
+    return sorted(d for d in os.listdir(SWEEPS_DIR) if os.path.exists(os.path.join(SWEEPS_DIR, d, "results.csv")))
+
+
+def load_sweep(name):
+    """Speed + accuracy table of one sweep."""
+    return read_csv(os.path.join(SWEEPS_DIR, name, "results.csv"))
+
+
+# --- OVERLAY RENDERS ---
+
+def list_renders():
+    """Newest local overlay render per sequence and tracker: {seq: {tracker: path}}.
+
+    A handful of directory listings, so it is cheap enough to run on every rerun and picks up new
+    renders without a restart.
+    """
+    renders = {}
+    if not os.path.isdir(RENDERS_DIR):
+        return renders
+    for seq in sorted(os.listdir(RENDERS_DIR)):
+        seq_dir = os.path.join(RENDERS_DIR, seq)
+        if not os.path.isdir(seq_dir):
+            continue
+        for tracker in sorted(os.listdir(seq_dir)):
+            tracker_dir = os.path.join(seq_dir, tracker)
+            if not os.path.isdir(tracker_dir):
+                continue
+            # Renders in progress (or left by a crash) are hidden files, e.g. .<key>.partial.mp4
+            videos = [e for e in os.scandir(tracker_dir) if e.name.endswith(VIDEO_EXTENSIONS)
+                      and not e.name.startswith(".") and ".tmp." not in e.name]
+            if videos:
+                newest = max(videos, key=lambda e: e.stat().st_mtime_ns)
+                renders.setdefault(seq, {})[tracker] = newest.path
+    return renders
@@ -0,0 +1,17 @@
+import importlib
+
+# Navigation label -> page module. A page module (and whatever it imports, e.g. plotly or pandas) is
+# only imported when its page is first visited, and stays loaded for every later rerun.
+PAGES = {
+    "1. Abstract & Overview": "overview",
+    "2. Methodology": "methodology",
+    "3. Visual Analysis": "visual",
+    "4. Frame Scrubber": "scrubber",
+    "5. Benchmarks (3 Datasets)": "benchmarks",
+    "6. Conclusion": "conclusion",
+}
+
+
+def load(label):
+    """The page module behind a navigation label."""
+    return importlib.import_module(f"{__name__}.{PAGES[label]}")
@@ -0,0 +1,71 @@
+# PAGE 5: BENCHMARKS
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import assets, data
+from dashboard.assets import show_asset
+
+
+def render():
+    st.markdown("## 📊 Comprehensive Results")
+
+    # Dataset Selector for Data
+    target_ds = st.radio("Select Benchmark Dataset:", ["DanceTrack", "MOT17", "MOT20"], horizontal=True)
+    df_curr, measured = data.dataset_summary(target_ds)
+    if not measured:
+        st.caption(f"No local {target_ds} run found; showing the published thesis results.")
+
+    # Row 1: Charts
+    col_bar, col_radar = st.columns([1.5, 1])
+
+    with col_bar:
+        st.markdown(f"### {target_ds} Performance")
+        fig = px.bar(df_curr, x='Tracker', y=['HOTA', 'DetA', 'AssA'], barmode='group',
+                     color_discrete_sequence=['#ff0055', '#00d2ff', '#00ffaa'], template="plotly_dark")
+        fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col_radar:
+        st.markdown("### Holistic Profile")
+        categories = ['HOTA', 'IDF1', 'DetA', 'AssA']
+        fig_radar = go.Figure()
+        colors = ['#ff0055', '#00d2ff', '#00ffaa']
+
+        for i, t in enumerate(df_curr['Tracker']):
+            vals = df_curr.loc[df_curr['Tracker'] == t, categories].values.flatten().tolist()
+            vals += vals[:1]
+            fig_radar.add_trace(go.Scatterpolar(r=vals, theta=categories+[categories[0]], fill='toself', name=t, line_color=colors[i % len(colors)]))
+
+        fig_radar.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 70])),
+                                paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                                font=dict(color="white"), showlegend=False)
+        st.plotly_chart(fig_radar, use_container_width=True)
+
+    # Row 2: Deep Dive Figures
+    st.markdown("### 📉 Stability & Error Analysis")
+    col_err, col_seq = st.columns(2)
+    with col_err:
+        show_asset("Figure_9_Error_Donut.png", "Error Distribution (Log Scale)", fraction=0.5)
+    with col_seq:
+        # Check if 7 exists, otherwise show 12 or others
+        if "Figure_7_ID_Switches.png" in assets.available():
+             show_asset("Figure_7_ID_Switches.png", "ID Switches Comparison", fraction=0.5)
+        else:
+             show_asset("Figure_12_Efficiency_Frontier.png", "Efficiency Analysis", fraction=0.5)
+
+    # Row 3: Per-sequence breakdown (only available for local runs)
+    if measured:
+        with st.expander("🔎 Per-Sequence Breakdown"):
+            metric = st.selectbox("Metric:", ["HOTA", "DetA", "AssA", "IDF1", "MOTA", "IDSW"])
+            breakdown = data.sequence_breakdown(target_ds, metric)
+            fig_seq = px.bar(breakdown.reset_index().melt(id_vars="seq", var_name="Tracker", value_name=metric),
+                             x="seq", y=metric, color="Tracker", barmode="group", template="plotly_dark")
+            fig_seq.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis_title=None)
+            st.plotly_chart(fig_seq, use_container_width=True)
+
+    sweeps = data.list_sweeps()
+    if sweeps:
+        with st.expander("🧪 Hyperparameter Sweeps"):
+            sweep_choice = st.selectbox("Sweep:", sweeps)
+            st.dataframe(data.load_sweep(sweep_choice), hide_index=True, use_container_width=True)
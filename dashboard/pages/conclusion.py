@@ -0,0 +1,92 @@
+# PAGE 6: CONCLUSION
+import streamlit as st
+
+from dashboard import data
+from dashboard.assets import show_asset
+
+
+def render():
+    st.markdown("# 🏆 Final Verdict & Global Benchmark")
+
+    # 1. VISUAL VERDICT CARDS
+    col_winner, col_runner, col_speed = st.columns(3)
+
+    with col_winner:
+        st.markdown('<div class="glass-card" style="border-top: 4px solid #F43F5E;">', unsafe_allow_html=True)
+        st.markdown("### 🥇 Accuracy King")
+        st.markdown("## StrongSORT")
+        st.write("Best for **Offline Processing**.")
+        st.caption("Dominated DanceTrack & MOT17 in HOTA scores. Best identity preservation (ReID).")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with col_runner:
+        st.markdown('<div class="glass-card" style="border-top: 4px solid #3B82F6;">', unsafe_allow_html=True)
+        st.markdown("### 🥈 The Balanced Choice")
+        st.markdown("## DeepOCSORT")
+        st.write("Best for **Real-Time Apps**.")
+        st.caption("Only ~2% accuracy drop vs StrongSORT but **3x Faster**. Best ID Stability.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with col_speed:
+        st.markdown('<div class="glass-card" style="border-top: 4px solid #10B981;">', unsafe_allow_html=True)
+        st.markdown("### ⚡ Speed Demon")
+        st.markdown("## ByteTrack")
+        st.write("Best for **Embedded Devices**.")
+        st.caption("Incredibly fast (40+ FPS) but fails catastrophically in heavy occlusion.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # 2. THE GRANDMASTER TABLE
+    st.markdown("### 📊 The Grandmaster Comparison Table")
+    st.write("Side-by-side performance metrics across all three datasets.")
+
+    # Constructing the Mega Dataframe
+    # We want rows to be Trackers, Columns to be metrics per dataset
+
+    df_mega, measured = data.grandmaster_table()
+    local = [ds for ds, m in measured.items() if m]
+    published = [ds for ds, m in measured.items() if not m]
+    if not local:
+        st.caption("No local runs found; showing the published thesis results.")
+    elif published:
+        st.caption(f"Measured locally: {', '.join(local)}. Published thesis results: {', '.join(published)}. "
+                   "Avg IDSW mixes both sources.")
+
+    # Configuring the Styled Dataframe
+    st.dataframe(
+        df_mega,
+        column_config={
+            "Tracker": st.column_config.TextColumn("Algorithm", width="medium"),
+            "Dance HOTA": st.column_config.ProgressColumn("DanceTrack HOTA", format="%.1f%%", min_value=0, max_value=50),
+            "MOT17 HOTA": st.column_config.ProgressColumn("MOT17 HOTA", format="%.1f%%", min_value=0, max_value=50),
+            "MOT20 HOTA": st.column_config.ProgressColumn("MOT20 HOTA", format="%.1f%%", min_value=0, max_value=20),
+            "Dance IDF1": st.column_config.NumberColumn("Dance IDF1", format="%.1f"),
+            "Dance FPS": st.column_config.NumberColumn("Speed (FPS)", format="%.1f ⚡"),
+            "Avg IDSW": st.column_config.NumberColumn("ID Switches", format="%d 📉"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+    st.markdown("---")
+
+    # 3. FINAL RECOMMENDATION
+    col_rec_img, col_rec_txt = st.columns([1, 2])
+
+    with col_rec_img:
+        show_asset(["Figure_4_Speed_vs_Accuracy.png", "Figure_12_Efficiency_Frontier.png"], "Efficiency Frontier",
+                   fraction=0.33)
+
+    with col_rec_txt:
+        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
+        st.markdown("### 🎯 Thesis Recommendation")
+        st.info("""
+        Based on the comparative analysis of 25 DanceTrack sequences, 7 MOT17 sequences, and 4 MOT20 sequences:
+
+        **We recommend DeepOCSORT for general-purpose deployment.**
+
+        While StrongSORT offers marginally better accuracy (HOTA +2.8%), the computational cost is too high for live applications.
+        DeepOCSORT provides the critical "sweet spot" — robust enough to handle the dance occlusions, fast enough to run live.
+        """)
+        st.markdown("</div>", unsafe_allow_html=True)
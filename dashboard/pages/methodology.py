@@ -0,0 +1,39 @@
+# PAGE 2: METHODOLOGY
+import streamlit as st
+
+from dashboard.assets import show_asset
+
+
+def render():
+    st.markdown("## 🔬 Methodology & Architecture")
+
+    tab1, tab2 = st.tabs(["Pipeline", "Equations"])
+
+    with tab1:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown('<div class="glass-card">', unsafe_allow_html=True)
+            st.markdown("### 🛠️ Experimental Setup")
+            st.markdown("""
+            * **Detection:** YOLOv8x (Conf: 0.3)
+            * **Tracking:** BoxMOT Framework
+            * **Hardware:** NVIDIA A100-SXM4 (40GB)
+            * **Datasets:**
+                1. **DanceTrack:** Non-linear motion & uniforms.
+                2. **MOT17:** Standard street surveillance.
+                3. **MOT20:** Extreme crowd density.
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+        with col2:
+            show_asset("Figure_15_Methodology_Pipeline.png", "Fig 2: The Comparative Tracking Pipeline", fraction=0.5)
+
+    with tab2:
+        col_eq1, col_eq2 = st.columns(2)
+        with col_eq1:
+            st.info("**HOTA (Higher Order Tracking Accuracy)**")
+            st.latex(r'''HOTA = \sqrt{DetA \cdot AssA}''')
+            st.write("Balances Detection (finding the box) and Association (keeping the ID).")
+        with col_eq2:
+            st.info("**IDF1 (ID F1 Score)**")
+            st.latex(r'''IDF1 = \frac{2IDTP}{2IDTP + IDFP + IDFN}''')
+            st.write("Measures tracking stability. High IDF1 means fewer ID switches.")
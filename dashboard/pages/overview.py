@@ -0,0 +1,36 @@
+# PAGE 1: OVERVIEW
+import streamlit as st
+
+from dashboard import data
+from dashboard.assets import show_asset
+
+
+def render():
+    st.markdown("# Robust Multi-Object Tracking Under Heavy Occlusion")
+    st.markdown("### A Comparative Analysis of DeepOCSORT, StrongSORT, and ByteTrack")
+
+    col_ab, col_vis = st.columns([1.5, 1])
+
+    with col_ab:
+        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
+        st.markdown("#### 📄 Abstract")
+        st.write("""
+        Tracking objects in chaotic environments is a critical challenge in computer vision.
+        Standard algorithms fail when targets undergo **non-linear motion** (e.g., dancing) or **heavy occlusion** (e.g., crowds).
+
+        This thesis presents a comprehensive benchmark of three SOTA trackers across **three datasets** (DanceTrack, MOT17, MOT20).
+        We demonstrate that **DeepOCSORT** provides the optimal balance of stability and efficiency.
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        # High Level Metrics
+        headline = data.headline_metrics()
+        k1, k2, k3 = st.columns(3)
+        k1.metric("Datasets Tested", str(headline["datasets"]), "Dance, Street, Crowd")
+        k2.metric("Stability Gain", f"{headline['stability_gain']:+d}%", "vs Baseline")
+        k3.metric("Inference Speed", f"{headline['fps']} FPS" if headline["fps"] is not None else "n/a",
+                  "Real-Time Capable")
+
+    with col_vis:
+        show_asset("Figure_5_Qualitative_Filmstrip.png", "Fig 1: DeepOCSORT maintaining identity through occlusion.",
+                   fraction=0.4)
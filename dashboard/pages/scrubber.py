@@ -0,0 +1,99 @@
+# PAGE 4: FRAME SCRUBBER
+import os
+import time
+import colorsys
+import streamlit as st
+from PIL import Image, ImageDraw
+
+from dashboard import track_index
+from dashboard.data import DATASET_RESULTS, TRACKERS
+
+FRAME_KEY = "scrubber_frame"
+# Box colours when all trackers are drawn on one frame (RGB)
+TRACKER_COLORS = {"StrongSORT": (255, 0, 85), "DeepOCSORT": (0, 210, 255), "ByteTrack": (0, 255, 170)}
+
+
+def id_color(track_id):
+    """Stable, well-separated RGB colour per track ID (golden-ratio hue steps)."""
+    r, g, b = colorsys.hsv_to_rgb(track_id * 0.618033988749895 % 1.0, 0.85, 1.0)
+    return int(255 * r), int(255 * g), int(255 * b)
+
+
+def draw_boxes(img, rows, scale, color=None, label=None):
+    """Draws one tracker's boxes and IDs onto a PIL image (colour per ID unless `color` is given)."""
+    draw = ImageDraw.Draw(img)
+    for row in rows:
+        tid = int(row[1])
+        x, y, w, h = (float(v) * scale for v in row[2:6])
+        c = color or id_color(tid)
+        draw.rectangle((x, y, x + w, y + h), outline=c, width=2)
+        draw.text((x + 2, y - 12), str(tid) if label is None else f"{label[0]}{tid}", fill=c)
+
+
+def step(delta, first, last):
+    st.session_state[FRAME_KEY] = min(max(st.session_state[FRAME_KEY] + delta, first), last)
+
+
+def render():
+    st.markdown("## 🎞️ Frame Scrubber")
+    st.write("Step through a sequence frame by frame and compare every tracker's boxes on the same frame.")
+
+    dataset = st.radio("Dataset:", list(DATASET_RESULTS), horizontal=True)
+    available = track_index.list_trackers(dataset)
+    sequences = track_index.list_sequences(dataset, available)
+    if not sequences:
+        st.info(f"No {dataset} tracker results with frames on disk. Run the benchmark on the "
+                f"{dataset} sequences (results in '{DATASET_RESULTS[dataset]}/') to scrub them here.")
+        return
+
+    col_seq, col_trk, col_mode = st.columns([1, 2, 1])
+    with col_seq:
+        seq = st.selectbox("Sequence:", sequences)
+    with col_trk:
+        default = [t for t in TRACKERS if t in available] or available[:3]
+        trackers = st.multiselect("Trackers:", available, default=default)
+    with col_mode:
+        mode = st.radio("Layout:", ["Side by side", "Overlaid"], horizontal=True)
+
+    frames = track_index.frame_files(dataset, seq)
+    if not frames:  # images removed since the sequence list was built
+        st.info(f"No frame images found for {seq}.")
+        return
+    first, last = min(frames), max(frames)
+    # The frame is kept when switching sequences, clamped to the new sequence's range
+    st.session_state[FRAME_KEY] = min(max(st.session_state.get(FRAME_KEY, first), first), last)
+    col_prev, col_slider, col_next = st.columns([1, 12, 1])
+    with col_prev:
+        st.button("◀", on_click=step, args=(-1, first, last), use_container_width=True)
+    with col_slider:
+        fid = st.slider("Frame:", first, last, key=FRAME_KEY, label_visibility="collapsed")
+    with col_next:
+        st.button("▶", on_click=step, args=(1, first, last), use_container_width=True)
+
+    # Seek: one lookup per tracker in its frame index plus one (usually cached) decoded frame
+    t0 = time.perf_counter()
+    rows = {t: track_index.open_index(dataset, t, seq).frame(fid)
+            for t in trackers if os.path.exists(track_index.result_file(dataset, t, seq))}
+    loaded = track_index.load_frame(dataset, seq, fid)
+    seek_ms = 1000 * (time.perf_counter() - t0)
+    if loaded is None:
+        st.warning(f"Frame {fid} of {seq} is missing on disk.")
+        return
+    array, scale = loaded
+
+    if mode == "Overlaid" or not rows:
+        img = Image.fromarray(array)
+        for t, r in rows.items():
+            draw_boxes(img, r, scale, color=TRACKER_COLORS.get(t, (255, 255, 255)), label=t)
+        st.image(img, output_format="JPEG", use_container_width=True)
+        st.caption(" · ".join(f"{t}: {len(r)} boxes" for t, r in rows.items()))
+    else:
+        cols = st.columns(len(rows))
+        for col, (t, r) in zip(cols, rows.items()):
+            img = Image.fromarray(array)
+            draw_boxes(img, r, scale)
+            with col:
+                st.image(img, output_format="JPEG", use_container_width=True)
+                st.caption(f"{t}: {len(r)} boxes")
+    st.caption(f"{seq} · frame {fid}/{last} · seek {seek_ms:.1f} ms")
+
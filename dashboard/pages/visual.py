@@ -0,0 +1,135 @@
+# PAGE 3: VISUAL ANALYSIS
+import streamlit as st
+
+from dashboard.data import RENDERS_DIR, list_renders
+
+# VIDEO DATABASE
+VIDEO_DB = {
+    "DanceTrack (Non-Linear Motion)": {
+        "ByteTrack": {
+            "Seq 04: Heavy Occlusion": "https://youtu.be/fbwpWQks8og", # Assuming this one is correct based on prev context, or replace if specific byte link exists
+            "ByteTrack Playlist 1": "https://youtu.be/kjJemGMhZoE",
+            "ByteTrack Playlist 2": "https://youtu.be/vULe68-KiKU",
+            "ByteTrack Playlist 3": "https://youtu.be/PMH7_GYXMhA",
+            "ByteTrack Playlist 4": "https://youtu.be/CCMz_C4B2Yc",
+            "ByteTrack Playlist 5": "https://youtu.be/zAaNYtqc7h0"
+        },
+        "DeepOCSORT": {
+             "DeepTrack Playlist 1": "https://youtu.be/PZUw_-a-xYw",
+             "DeepTrack Playlist 2": "https://youtu.be/hI_33oCsFFQ",
+             "DeepTrack Playlist 3": "https://youtu.be/QYORhr6mR58",
+             "DeepTrack Playlist 4": "https://youtu.be/qTP5WZbMUXQ",
+             "DeepTrack Playlist 5": "https://youtu.be/hpxe59Pax9s"
+        },
+        "StrongSORT": {
+             "StrongSORT Playlist 1": "https://youtu.be/_R5aXEy_gsw",
+             "StrongSORT Playlist 2": "https://youtu.be/urKx9npTrqI",
+             "StrongSORT Playlist 3": "https://youtu.be/9zgvI5MX7M4",
+             "StrongSORT Playlist 4": "https://youtu.be/GaDQKKdsRBU",
+             "StrongSORT Playlist 5": "https://youtu.be/D4PZo9tzEaY"
+        }
+    },
+    "MOT17 (Street Scenes)": {
+        "ByteTrack": {
+             "ByteTrack Playlist 1": "https://youtu.be/dyebzXCk6U4",
+             "ByteTrack Playlist 2": "https://youtu.be/g5vKq6HDorY",
+             "ByteTrack Playlist 3": "https://youtu.be/J4qWY9tCcAM",
+             "ByteTrack Playlist 4": "https://youtu.be/WC9uqvzXv0M",
+             "ByteTrack Playlist 5": "https://youtu.be/zH8p6OQDzuM"
+        },
+        "DeepOCSORT": {
+             "DeepOCSORT Playlist 1": "https://youtu.be/hdYlkSdGUDg",
+             "DeepOCSORT Playlist 2": "https://youtu.be/atDdNtv7sIM",
+             "DeepOCSORT Playlist 3": "https://youtu.be/uU4D2QhBjAM",
+             "DeepOCSORT Playlist 4": "https://youtu.be/Tbi0PGN1bOE",
+             "DeepOCSORT Playlist 5": "https://youtu.be/PdCet9NbLFw"
+        },
+        "StrongSORT": {
+             "StrongSORT Playlist 1": "https://youtu.be/jUyDMUkPp2k",
+             "StrongSORT Playlist 2": "https://youtu.be/8EKhf1kfN7k",
+             "StrongSORT Playlist 3": "https://youtu.be/KbRQu5KwH64",
+             "StrongSORT Playlist 4": "https://youtu.be/W364cn6km7I",
+             "StrongSORT Playlist 5": "https://youtu.be/LK-VOa5VuGo"
+        }
+    },
+    "MOT20 (Extreme Crowds)": {
+        "ByteTrack": {
+             "ByteTrack Playlist 1": "https://youtu.be/-GBZP34VVMY",
+             "ByteTrack Playlist 2": "https://youtu.be/g6nvFKrjRFE",
+             "ByteTrack Playlist 3": "https://youtu.be/TqWX5Gglce4",
+             "ByteTrack Playlist 4": "https://youtu.be/wkA2Bdo--Yw"
+        },
+        "DeepOCSORT": {
+             "DeepOCSORT Playlist 1": "https://youtu.be/OHON2YiXwnM",
+             "DeepOCSORT Playlist 2": "https://youtu.be/BVMIBzfWCGo",
+             "DeepOCSORT Playlist 3": "https://youtu.be/NuZEmdG2e0w",
+             "DeepOCSORT Playlist 4": "https://youtu.be/s3wQ0gUr0Hc"
+        },
+        "StrongSORT": {
+             "StrongSORT Playlist 1": "https://youtu.be/CK7eRYm4qkw",
+             "StrongSORT Playlist 2": "https://youtu.be/xVDLKGd5wL4",
+             "StrongSORT Playlist 3": "https://youtu.be/-O3vqBjKhEM",
+             "StrongSORT Playlist 4": "https://youtu.be/45uF8YhjgH8"
+        }
+    }
+}
+
+
+def render_local(renders):
+    """Side-by-side playback of local overlay renders (research codes/render_overlay.py)."""
+    seq = st.selectbox("Select Sequence:", list(renders))
+    available = list(renders[seq])
+    trackers = st.multiselect("Trackers:", available, default=available[:3])
+    if not trackers:
+        st.info("Select at least one tracker.")
+        return
+
+    cols = st.columns(len(trackers))
+    for col, tracker in zip(cols, trackers):
+        with col:
+            st.video(renders[seq][tracker])
+            st.caption(f"{seq} | Tracker: {tracker}")
+    st.caption("Start all players together to compare identities frame by frame.")
+
+
+def render_playlists():
+    # Select Dataset
+    dataset_choice = st.selectbox("Select Dataset:", list(VIDEO_DB.keys()))
+
+    # Select Tracker
+    tracker_choice = st.selectbox("Select Tracker:", list(VIDEO_DB[dataset_choice].keys()))
+
+    # Select Video
+    video_choice = st.selectbox("Select Sequence:", list(VIDEO_DB[dataset_choice][tracker_choice].keys()))
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        video_url = VIDEO_DB[dataset_choice][tracker_choice][video_choice]
+        if "placeholder" in video_url:
+             st.warning("Video not available yet.")
+        else:
+             st.video(video_url)
+             st.caption(f"{video_choice} | Tracker: {tracker_choice}")
+
+    with col2:
+        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
+        st.markdown("### 🔍 Analysis")
+        st.write("Observe the tracking consistency and identity retention.")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render():
+    st.markdown("## 🎥 Visual Qualitative Analysis")
+    st.write("Explore how the trackers perform across different datasets.")
+
+    # Local renders (if any) play from disk, side by side; the published playlists are always available
+    renders = list_renders()
+    sources = (["Local renders"] if renders else []) + ["Thesis playlists (YouTube)"]
+    source = st.radio("Source:", sources, horizontal=True)
+    if source == "Local renders":
+        render_local(renders)
+    else:
+        render_playlists()
+        if not renders:
+            st.caption(f"Render your own runs with `render_overlay.py` to compare them here ({RENDERS_DIR}/).")
@@ -0,0 +1,94 @@
+# --- ADVANCED CSS (Dark Glassmorphism) ---
+# Built once per process; app.py emits it on every rerun
+CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&display=swap');
+
+    /* Global Theme */
+    .stApp {
+        background-color: #000000;
+        background-image: radial-gradient(at 0% 0%, rgba(16, 23, 42, 1) 0, transparent 50%), 
+                          radial-gradient(at 100% 0%, rgba(15, 23, 42, 1) 0, transparent 50%);
+        color: #E2E8F0;
+        font-family: 'Inter', sans-serif;
+    }
+    
+    /* Headers */
+    h1, h2, h3 {
+        color: #F8FAFC !important;
+        font-weight: 700;
+        letter-spacing: -0.025em;
+    }
+    h1 {
+        background: linear-gradient(to right, #60A5FA, #A78BFA);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+
+    /* Glass Cards */
+    .glass-card {
+        background: rgba(30, 41, 59, 0.4);
+        backdrop-filter: blur(12px);
+        -webkit-backdrop-filter: blur(12px);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        border-radius: 16px;
+        padding: 24px;
+        margin-bottom: 24px;
+        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.2);
+    }
+    
+    /* Sidebar */
+    section[data-testid="stSidebar"] {
+        background-color: #020617;
+        border-right: 1px solid #1E293B;
+    }
+    
+    /* Metrics */
+    div[data-testid="metric-container"] {
+        background: rgba(15, 23, 42, 0.6);
+        border: 1px solid #334155;
+        border-radius: 12px;
+        transition: all 0.3s ease;
+    }
+    div[data-testid="metric-container"]:hover {
+        border-color: #60A5FA;
+        transform: translateY(-2px);
+    }
+    div[data-testid="stMetricValue"] {
+        color: #60A5FA !important;
+    }
+    
+    /* Tabs */
+    .stTabs [data-baseweb="tab"] {
+        color: #94A3B8;
+        font-weight: 600;
+    }
+    .stTabs [aria-selected="true"] {
+        color: #60A5FA !important;
+        border-bottom-color: #60A5FA !important;
+    }
+    
+    /* Footer */
+    .footer {
+        position: fixed; bottom: 0; left: 0; width: 100%;
+        background: #020617; color: #64748B;
+        text-align: center; padding: 12px;
+        border-top: 1px solid #1E293B; font-size: 0.85rem;
+        z-index: 999;
+    }
+    .footer a { color: #60A5FA; text-decoration: none; }
+    
+    /* Expander */
+    .streamlit-expanderHeader {
+        background-color: rgba(30, 41, 59, 0.5);
+        color: white;
+        border-radius: 8px;
+    }
+</style>
+"""
+
+FOOTER = """
+<div class="footer">
+    <p>Developed by <a href="https://www.linkedin.com/in/smri29/" target="_blank">Shah Mohammad Rizvi</a> | IUBAT B.Sc. Thesis 2025</p>
+</div>
+"""
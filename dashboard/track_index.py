@@ -0,0 +1,238 @@
+import os
+import json
+import time
+import random
+import argparse
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dashboard.assets import BytesLRU
+from dashboard.data import DATASET_FRAMES, DATASET_RESULTS
+
+# --- CONFIGURATION ---
+TRACK_INDEX_DIR = "track_index"  # generated, safe to delete
+INDEX_VERSION = 1  # bump when the stored layout changes
+TRACK_COLUMNS = ("frame", "id", "x", "y", "w", "h", "conf")
+FRAME_WIDTH = 960  # JPEGs are decoded at the smallest DCT scale that is at least this wide
+FRAME_CACHE_BYTES = 256 * 1024 * 1024  # decoded frames kept in memory across reruns and sessions
+IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+
+
+# --- TRACK INDEX ---
+# One folder per (results dir, tracker, sequence) with the result file's rows sorted by frame
+# (tracks.npy, memory-mapped on open) and offsets.npy, so rows of frame f are
+# tracks[offsets[f]:offsets[f + 1]]. A seek is two array lookups; the text file is parsed once.
+
+def result_file(dataset, tracker, seq):
+    """MOTChallenge result file of one (tracker, sequence): <results dir>/<tracker>/data/<seq>.txt"""
+    return os.path.join(DATASET_RESULTS[dataset], tracker, "data", f"{seq}.txt")
+
+
+def index_dir(dataset, tracker, seq):
+    return os.path.join(TRACK_INDEX_DIR, DATASET_RESULTS[dataset], tracker, seq)
+
+
+def source_signature(path):
+    """Size and mtime of a result file; the index is rebuilt whenever it changes."""
+    stat = os.stat(path)
+    return {"version": INDEX_VERSION, "source": [stat.st_size, stat.st_mtime_ns]}
+
+
+def parse_result_file(path):
+    """Reads a MOTChallenge result file into an (N, 7) float32 array of TRACK_COLUMNS."""
+    try:
+        rows = pd.read_csv(path, header=None, sep=",", usecols=range(len(TRACK_COLUMNS)),
+                           dtype=np.float64).to_numpy()
+    except pd.errors.EmptyDataError:
+        rows = np.zeros((0, len(TRACK_COLUMNS)))
+    return rows.astype(np.float32)
+
+
+def build_index(dataset, tracker, seq):
+    """Parses one result file into the frame index. Returns its folder."""
+    src = result_file(dataset, tracker, seq)
+    out_dir = index_dir(dataset, tracker, seq)
+    os.makedirs(out_dir, exist_ok=True)
+    signature = source_signature(src)
+
+    rows = parse_result_file(src)
+    frames = rows[:, 0].astype(np.int64)
+    order = np.argsort(frames, kind="stable")
+    rows, frames = rows[order], frames[order]
+    last = int(frames[-1]) if len(frames) else 0
+    offsets = np.searchsorted(frames, np.arange(0, last + 2))
+
+    # Write to temp files first so readers never see a half-written index
+    for name, array in (("tracks", rows), ("offsets", offsets)):
+        tmp_path = os.path.join(out_dir, f"{name}.tmp.npy")
+        np.save(tmp_path, array)
+        os.replace(tmp_path, os.path.join(out_dir, f"{name}.npy"))
+    tmp_path = os.path.join(out_dir, "info.json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({"columns": list(TRACK_COLUMNS), "rows": len(rows), "last_frame": last,
+                   "signature": signature}, f, indent=2)
+    os.replace(tmp_path, os.path.join(out_dir, "info.json"))
+    return out_dir
+
+
+def is_current(dataset, tracker, seq):
+    info_path = os.path.join(index_dir(dataset, tracker, seq), "info.json")
+    if not os.path.exists(info_path):
+        return False
+    with open(info_path, 'r') as f:
+        stored = json.load(f).get("signature")
+    return stored == source_signature(result_file(dataset, tracker, seq))
+
+
+class TrackIndex:
+    """Frame-indexed, memory-mapped view of one tracker's results on one sequence."""
+
+    def __init__(self, out_dir):
+        self.tracks = np.load(os.path.join(out_dir, "tracks.npy"), mmap_mode='r')
+        self.offsets = np.load(os.path.join(out_dir, "offsets.npy"))
+
+    @property
+    def last_frame(self):
+        return len(self.offsets) - 2
+
+    def frame(self, fid):
+        """Rows (TRACK_COLUMNS) of one frame."""
+        if not 0 <= fid < len(self.offsets) - 1:
+            return self.tracks[:0]
+        return self.tracks[self.offsets[fid]:self.offsets[fid + 1]]
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _open_index(dataset, tracker, seq, version):
+    if not is_current(dataset, tracker, seq):
+        build_index(dataset, tracker, seq)
+    return TrackIndex(index_dir(dataset, tracker, seq))
+
+
+def open_index(dataset, tracker, seq):
+    """Track index of one (tracker, sequence), built on first use and rebuilt when the result file
+    changes. Open indexes are shared across reruns and sessions, so a seek costs one stat."""
+    version = os.stat(result_file(dataset, tracker, seq)).st_mtime_ns
+    return _open_index(dataset, tracker, seq, version)
+
+
+# --- FRAMES ---
+
+def sequence_dir(dataset, seq):
+    return os.path.join(DATASET_FRAMES[dataset], seq)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _frame_files(img_dir, version):
+    files = {}
+    for name in os.listdir(img_dir):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() in IMAGE_EXTS and stem.isdigit():
+            files[int(stem)] = os.path.join(img_dir, name)
+    return files
+
+
+def frame_files(dataset, seq):
+    """{frame id: image path} of a sequence's img1/ folder, listed once per change of the folder."""
+    img_dir = os.path.join(sequence_dir(dataset, seq), "img1")
+    try:
+        version = os.stat(img_dir).st_mtime_ns
+    except OSError:
+        return {}
+    return _frame_files(img_dir, version)
+
+
+@st.cache_resource
+def _frame_cache():
+    return BytesLRU(FRAME_CACHE_BYTES, sizeof=lambda item: item[0].nbytes)
+
+
+def decode_frame(path, width=FRAME_WIDTH):
+    """RGB array of an image decoded at reduced resolution, and its scale relative to the file."""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        full_width = img.width
+        # JPEG only: lets libjpeg decode at 1/2, 1/4 or 1/8 scale instead of decoding and resizing
+        img.draft("RGB", (width, round(img.height * width / img.width)))
+        array = np.asarray(img.convert("RGB"))
+    return array, array.shape[1] / full_width
+
+
+def load_frame(dataset, seq, fid):
+    """(RGB array, scale) of one frame, served from the decoded-frame LRU after the first visit.
+    None if the frame image does not exist."""
+    path = frame_files(dataset, seq).get(fid)
+    if path is None:
+        return None
+    cache = _frame_cache()
+    key = (path, FRAME_WIDTH)
+    item = cache.get(key)
+    if item is None:
+        item = decode_frame(path)
+        cache.put(key, item)
+    return item
+
+
+# --- DISCOVERY ---
+
+def list_trackers(dataset):
+    """Tracker folders with MOTChallenge results for a dataset."""
+    root = DATASET_RESULTS[dataset]
+    if not os.path.isdir(root):
+        return []
+    return sorted(t for t in os.listdir(root) if os.path.isdir(os.path.join(root, t, "data")))
+
+
+def list_sequences(dataset, trackers):
+    """Sequences with numbered frame images on disk and results from at least one of `trackers`."""
+    seqs = set()
+    for tracker in trackers:
+        data_dir = os.path.join(DATASET_RESULTS[dataset], tracker, "data")
+        seqs.update(os.path.splitext(f)[0] for f in os.listdir(data_dir) if f.endswith(".txt"))
+    return sorted(s for s in seqs if frame_files(dataset, s))
+
+
+def bench_seeks(dataset, seeks=200):
+    """Builds every index of a dataset, then times random (sequence, frame) seeks: index lookups of
+    all trackers plus the frame, cold (decoded) and warm (from the LRU). Returns medians in ms."""
+    trackers = list_trackers(dataset)
+    seqs = list_sequences(dataset, trackers)
+    t0 = time.perf_counter()
+    targets = []
+    for seq in seqs:
+        indexes = [open_index(dataset, t, seq) for t in trackers if os.path.exists(result_file(dataset, t, seq))]
+        targets += [(seq, fid, indexes) for fid in frame_files(dataset, seq)]
+    build_s = time.perf_counter() - t0
+    if not targets:
+        return None
+
+    # Each random seek is repeated at once: the first visit decodes, the second (stepping back and
+    # forth around a frame) is served from the LRU
+    sample = random.Random(0).sample(targets, min(seeks, len(targets)))
+    timings = {"cold": [], "warm": []}
+    for seq, fid, indexes in sample:
+        for phase in ("cold", "warm"):
+            t0 = time.perf_counter()
+            for index in indexes:
+                np.asarray(index.frame(fid))
+            load_frame(dataset, seq, fid)
+            timings[phase].append(1000 * (time.perf_counter() - t0))
+    return {"sequences": len(seqs), "trackers": len(trackers), "index_s": round(build_s, 2), "seeks": len(sample),
+            "cold_ms": round(float(np.median(timings["cold"])), 2), "warm_ms": round(float(np.median(timings["warm"])), 3)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds the frame scrubber's track indexes and times random seeks.")
+    parser.add_argument("--datasets", nargs="+", default=list(DATASET_RESULTS))
+    parser.add_argument("--seeks", type=int, default=200)
+    args = parser.parse_args()
+    for dataset in args.datasets:
+        res = bench_seeks(dataset, args.seeks)
+        if res is None:
+            print(f"⚠️  {dataset}: no results with frames on disk, skipped")
+            continue
+        print(f"🎞️  {dataset}: {res['trackers']} trackers x {res['sequences']} sequences indexed in {res['index_s']:.2f}s; "
+              f"{res['seeks']} random seeks: {res['cold_ms']:.1f} ms decoding, {res['warm_ms']:.2f} ms cached")
+    print(f"✅ Indexes saved to {TRACK_INDEX_DIR}/")
@@ -0,0 +1,265 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import numpy as np
+import pandas as pd
+
+import tracker_registry
+from eval_cache import file_digest
+from run_manifest import config_hash
+from stage_timer import summarize
+
+# --- CONFIGURATION ---
+BENCH_DIR = os.path.join("runs", "bench")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+# Fixed workload (synthetic_workload.py): changing it invalidates every stored baseline
+WORKLOAD = {"objects": [20, 80], "frames": 300, "seed": 0}
+REPEATS = 5  # fresh processes per tracker; their spread is the noise estimate
+THREADS = 1
+NOISE_K = 3.0  # a change must exceed this many combined robust SDs (MAD-based) of the two runs ...
+MAD_SCALE = 1.4826  # MAD -> SD for normally distributed noise
+# ... and this relative change / absolute floor: metric -> (direction, relative, absolute);
+# direction +1 means higher is better
+METRICS = {
+    "fps":             (+1, 0.10, 0.0),
+    "detect_p50_ms":   (-1, 0.10, 0.02),
+    "track_p50_ms":    (-1, 0.10, 0.05),
+    "track_p95_ms":    (-1, 0.10, 0.05),
+    "track_p99_ms":    (-1, 0.15, 0.10),
+    "write_p50_ms":    (-1, 0.10, 0.02),
+    "pipeline_p95_ms": (-1, 0.10, 0.05),
+    "eval_s":          (-1, 0.10, 0.05),
+    "peak_rss_mb":     (-1, 0.10, 5.0),
+    "HOTA":            (+1, 0.0, 0.1),  # the workload is deterministic: any real drop is a behaviour change
+}
+# Installed versions recorded with every run, so a comparison shows which library update it covers
+PACKAGES = ("boxmot", "torch", "numpy", "scipy", "lap", "filterpy", "opencv-python", "pandas")
+
+
+def prepare_workload(data_dir):
+    """Generates the fixed synthetic sequences (kept if unchanged). Returns (names, workload key).
+
+    The key covers the generated data itself (GT, detections, embeddings), not only the generator
+    parameters, so a changed generator or RNG yields a different key even with the same settings.
+    """
+    import synthetic_workload
+
+    names = synthetic_workload.generate(WORKLOAD["objects"], data_dir, frames=WORKLOAD["frames"], seed=WORKLOAD["seed"])
+    digests = {}
+    for name in names:
+        for rel in ("gt/gt.txt", "det/det.npy", "det/emb.npy"):
+            path = os.path.join(data_dir, name, *rel.split("/"))
+            if os.path.exists(path):
+                digests[f"{name}/{rel}"] = file_digest(path)
+    return names, config_hash(digests)
+
+
+def environment():
+    from importlib.metadata import version, PackageNotFoundError
+
+    packages = {}
+    for name in PACKAGES:
+        try:
+            packages[name] = version(name)
+        except PackageNotFoundError:
+            packages[name] = None
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+            "cpus": os.cpu_count(), "packages": packages}
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where the resource module is missing)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB on Linux
+
+
+def measure(tracker, data_dir, sequences, config=tracker_registry.TRACKERS_FILE, threads=THREADS):
+    """One pass of the workload through detection replay -> track -> write -> evaluate for one tracker,
+    in this process. Returns {metric: value} for METRICS."""
+    import torch
+    import hota_eval
+    import mot_io
+    from scaling_benchmark import replay
+
+    torch.set_num_threads(threads)
+    spec = tracker_registry.load_registry(config)[tracker]
+    results_dir = os.path.join(BENCH_DIR, "results")
+
+    samples, evaluated, eval_s = {}, [], 0.0
+    for seq in sequences:
+        seq_samples, _, params = replay(spec, os.path.join(data_dir, seq), results_dir)
+        for stage, values in seq_samples.items():
+            samples.setdefault(stage, []).extend(values)
+        t0 = time.perf_counter()
+        evaluated.append(hota_eval.evaluate_sequence(os.path.join(data_dir, seq, "gt", "gt.txt"),
+                                                     mot_io.result_file(spec["folder"], seq, results_dir),
+                                                     params["frames"]))
+        eval_s += time.perf_counter() - t0
+
+    stats = {row["stage"]: row for row in summarize(samples, len(samples["track"]))}
+    return {
+        "fps": stats["pipeline"]["fps"],
+        "detect_p50_ms": stats["detect"]["p50_ms"],
+        "track_p50_ms": stats["track"]["p50_ms"],
+        "track_p95_ms": stats["track"]["p95_ms"],
+        "track_p99_ms": stats["track"]["p99_ms"],
+        "write_p50_ms": stats["write"]["p50_ms"],
+        "pipeline_p95_ms": stats["pipeline"]["p95_ms"],
+        "eval_s": round(eval_s, 4),
+        "peak_rss_mb": peak_rss_mb(),
+        "HOTA": round(hota_eval.summary_fields(hota_eval.combine_sequences(evaluated))["HOTA"], 3),
+    }
+
+
+def robust_stats(values):
+    """(median, MAD-based SD) of a metric's repeats, ignoring missing values."""
+    values = np.asarray([v for v in values if v is not None], dtype=np.float64)
+    if len(values) == 0:
+        return None, None
+    median = float(np.median(values))
+    return median, float(MAD_SCALE * np.median(np.abs(values - median)))
+
+
+def run(trackers=None, repeats=REPEATS, data_dir=None, config=tracker_registry.TRACKERS_FILE, threads=THREADS,
+        workload=None):
+    """Runs the workload `repeats` times per tracker, each in a fresh process (clean peak memory,
+    no warm caches carried over). `workload` is prepare_workload's result if already prepared.
+    Returns the run record stored as a baseline."""
+    data_dir = data_dir or os.path.join(BENCH_DIR, "workload")
+    sequences, workload_key = workload or prepare_workload(data_dir)
+    registry = tracker_registry.load_registry(config)
+    specs = [registry[name] for name in (trackers or registry)]
+    if any(tracker_registry.uses_reid(spec) for spec in specs) and not tracker_registry.REID_WEIGHTS.exists():
+        import main_benchmark  # appearance trackers load their ReID weights even when fed embeddings
+        main_benchmark.download_weights()
+    print(f"⏱️  Bench: {len(specs)} trackers x {repeats} repeats on {len(sequences)} sequences "
+          f"(workload {workload_key}, {threads} thread(s))")
+
+    record = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "workload": {**WORKLOAD, "key": workload_key},
+              "repeats": repeats, "threads": threads, "environment": environment(), "trackers": {}}
+    for spec in specs:
+        runs = []
+        for i in range(repeats):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", spec["name"],
+                                  "--data-dir", data_dir, "--config", config, "--threads", str(threads),
+                                  "--sequences", *sequences], capture_output=True, text=True)
+            if out.returncode != 0:
+                lines = out.stderr.strip().splitlines()
+                raise RuntimeError(f"{spec['name']} repeat {i + 1} failed: {lines[-1] if lines else 'no output'}")
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        values = {metric: [r.get(metric) for r in runs] for metric in METRICS}
+        stats = {metric: robust_stats(v) for metric, v in values.items()}
+        record["trackers"][spec["name"]] = {
+            "config": config_hash({"class": spec["class"], "args": spec["args"]}),
+            "values": values,
+            "median": {m: s[0] for m, s in stats.items()},
+            "noise": {m: s[1] for m, s in stats.items()},
+        }
+        med = record["trackers"][spec["name"]]["median"]
+        print(f"   {spec['name']:<12} {med['fps']:>9.1f} FPS, track p95 {med['track_p95_ms']:.2f} ms, "
+              f"peak {med['peak_rss_mb'] or 0:.0f} MB, HOTA {med['HOTA']:.2f}")
+    return record
+
+
+def compare(baseline, current, noise_k=NOISE_K, rel_scale=1.0):
+    """Metric-by-metric comparison of two run records.
+
+    A metric regresses when its median moved in the bad direction by more than the largest of:
+    its relative tolerance (scaled by `rel_scale`), `noise_k` combined robust SDs of the two runs,
+    and its absolute floor. Returns a DataFrame with one row per (tracker, metric).
+    """
+    rows = []
+    for tracker, cur in current["trackers"].items():
+        base = baseline["trackers"].get(tracker)
+        if base is None:
+            rows.append({"tracker": tracker, "metric": "-", "status": "new"})
+            continue
+        for metric, (direction, rel, floor) in METRICS.items():
+            b, c = base["median"].get(metric), cur["median"].get(metric)
+            if b is None or c is None:
+                continue
+            noise = np.hypot(base["noise"].get(metric) or 0.0, cur["noise"].get(metric) or 0.0)
+            tolerance = max(rel * rel_scale * abs(b), noise_k * noise, floor)
+            worse = (b - c) * direction  # > 0: moved in the bad direction
+            status = "regression" if worse > tolerance else "improved" if -worse > tolerance else "ok"
+            rows.append({"tracker": tracker, "metric": metric, "baseline": round(b, 4), "current": round(c, 4),
+                         "change_%": round(100 * (c - b) / b, 1) if b else None,
+                         "tolerance": round(tolerance, 4), "status": status})
+        if base.get("config") != cur.get("config"):
+            rows.append({"tracker": tracker, "metric": "config", "status": "changed"})
+    return pd.DataFrame(rows)
+
+
+def environment_changes(baseline, current):
+    """['numpy 1.26.4 -> 2.0.1', ...] for every recorded environment field that differs."""
+    before, after = baseline.get("environment", {}), current["environment"]
+    changes = [f"{k} {before.get(k)} -> {after[k]}" for k in ("python", "platform", "cpus") if before.get(k) != after[k]]
+    old_pkgs = before.get("packages", {})
+    changes += [f"{p} {old_pkgs.get(p)} -> {v}" for p, v in after["packages"].items() if old_pkgs.get(p) != v]
+    return changes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Performance regression gate: records a baseline of a fixed "
+                                                 "replay -> track -> evaluate workload and compares later runs to it.")
+    parser.add_argument("mode", nargs="?", choices=["record", "compare"],
+                        help="record: store a new baseline. compare: run and exit 1 on regressions.")
+    parser.add_argument("--trackers", nargs="+", help="Registry names (default: all in --config; compare: the baseline's).")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--config", default=tracker_registry.TRACKERS_FILE)
+    parser.add_argument("--threads", type=int, default=THREADS, help="torch CPU threads.")
+    parser.add_argument("--data-dir", help=f"Workload folder (default: {BENCH_DIR}/workload).")
+    parser.add_argument("--noise-k", type=float, default=NOISE_K)
+    parser.add_argument("--rel-scale", type=float, default=1.0, help="Multiplies every relative tolerance.")
+    parser.add_argument("--out", default=os.path.join(BENCH_DIR, "compare.csv"), help="compare: report file.")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--sequences", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.data_dir, args.sequences, args.config, args.threads)))
+        sys.exit(0)
+    if args.mode is None:
+        parser.error("choose a mode: record or compare")
+
+    if args.mode == "record":
+        record = run(args.trackers, args.repeats, args.data_dir, args.config, args.threads)
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(record, f, indent=2)
+        print(f"✅ Baseline saved to {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"❌ No baseline at {args.baseline}; run 'python bench.py record' first.")
+        sys.exit(2)
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    workload = prepare_workload(args.data_dir or os.path.join(BENCH_DIR, "workload"))
+    if workload[1] != baseline["workload"]["key"]:
+        print("❌ The workload data differs from the baseline's (WORKLOAD, synthetic_workload.py or numpy's RNG "
+              "changed); record a new baseline.")
+        sys.exit(2)
+    current = run(args.trackers or list(baseline["trackers"]), args.repeats, args.data_dir, args.config,
+                  baseline.get("threads", args.threads), workload)
+    for change in environment_changes(baseline, current):
+        print(f"   🔄 {change}")
+
+    table = compare(baseline, current, args.noise_k, args.rel_scale)
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    table.to_csv(args.out, index=False)
+    print(table.to_string(index=False))
+    regressions = table[table["status"] == "regression"]
+    if len(regressions):
+        print(f"❌ {len(regressions)} regression(s) beyond the noise thresholds (report: {args.out})")
+        sys.exit(1)
+    print(f"✅ No regressions against the baseline of {baseline['created']} (report: {args.out})")
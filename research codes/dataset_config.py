@@ -0,0 +1,22 @@
+import os
+import json
+
+# --- CONFIGURATION ---
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs")
+DATASETS_FILE = os.path.join(CONFIG_DIR, "datasets.json")  # also read by the dashboard (dashboard/data.py)
+DEFAULT_DATASET = "DanceTrack"
+
+
+def load_datasets(path=DATASETS_FILE):
+    """Loads the per-dataset paths shared by the benchmark, the evaluator, the figures and the dashboard.
+
+    Each entry has "benchmark" (evaluator class handling), "data" (sequence folders with img1/ and
+    gt/), "seqmap" (seqmap name), "results" (MOTChallenge results and metrics.csv) and "runs" (run
+    manifest and timing report), relative to the repo root; "timing" and "seqmap_file" are derived.
+    """
+    with open(path, 'r') as f:
+        datasets = json.load(f)
+    for paths in datasets.values():
+        paths["timing"] = os.path.join(paths["runs"], "timing.csv")
+        paths["seqmap_file"] = os.path.join(paths["results"], "seqmaps", paths["seqmap"])
+    return datasets
@@ -0,0 +1,161 @@
+import os
+import json
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+
+from frame_source import read_seqinfo
+
+# --- CONFIGURATION ---
+DATASET_INDEX_DIR = "dataset_index"
+INDEX_VERSION = 1  # bump when the stored layout changes
+
+# Column layout of an indexed GT array (MOTChallenge gt.txt, sorted by frame)
+# Format: frame, id, bb_left, bb_top, bb_width, bb_height, conf (zero-marked flag), class, visibility
+GT_COLUMNS = ("frame", "id", "x", "y", "w", "h", "conf", "cls", "vis")
+
+
+def parse_mot_text(path):
+    """Reads a MOTChallenge text file (comma or whitespace separated) into an (N, C) float array."""
+    try:
+        return pd.read_csv(path, header=None, sep=",", dtype=np.float64).to_numpy()
+    except pd.errors.EmptyDataError:
+        return np.zeros((0, 10))
+    except ValueError:
+        return pd.read_csv(path, header=None, sep=r"\s+", dtype=np.float64).to_numpy()
+
+
+def index_root(dataset_dir, index_dir=DATASET_INDEX_DIR):
+    """Index folder of one dataset folder (DanceTrack split, MOT17/train, MOT20/train, ...)."""
+    path = os.path.abspath(dataset_dir)
+    return os.path.join(index_dir, f"{os.path.basename(path)}-{hashlib.sha1(path.encode()).hexdigest()[:8]}")
+
+
+def list_sequences(dataset_dir):
+    """Sequence folders of a MOTChallenge-style dataset (those with a seqinfo.ini or gt/gt.txt)."""
+    return sorted(d for d in os.listdir(dataset_dir)
+                  if os.path.exists(os.path.join(dataset_dir, d, "seqinfo.ini"))
+                  or os.path.exists(os.path.join(dataset_dir, d, "gt", "gt.txt")))
+
+
+def source_signature(seq_dir):
+    """Size and mtime of a sequence's source files; the index is rebuilt whenever it changes."""
+    signature = {"version": INDEX_VERSION}
+    for name, rel_path in (("gt", os.path.join("gt", "gt.txt")), ("seqinfo", "seqinfo.ini")):
+        path = os.path.join(seq_dir, rel_path)
+        if os.path.exists(path):
+            st = os.stat(path)
+            signature[name] = [st.st_size, st.st_mtime_ns]
+        else:
+            signature[name] = None
+    return signature
+
+
+class SequenceIndex:
+    """Indexed view of one sequence: parsed seqinfo plus the memory-mapped, frame-sorted GT.
+
+    Rows of frame f are gt[offsets[f]:offsets[f + 1]].
+    """
+
+    def __init__(self, out_dir):
+        self.dir = out_dir
+        with open(os.path.join(out_dir, "info.json"), 'r') as f:
+            meta = json.load(f)
+        self.info = meta["seqinfo"]
+        self.num_timesteps = meta["num_timesteps"]
+        self.gt_file = os.path.join(out_dir, "gt.npy") if meta["has_gt"] else None
+        self._gt = None
+        self._offsets = None
+
+    @property
+    def resolution(self):
+        return self.info.get("imWidth"), self.info.get("imHeight")
+
+    @property
+    def gt(self):
+        if self._gt is None and self.gt_file is not None:
+            self._gt = np.load(self.gt_file, mmap_mode='r')
+        return self._gt
+
+    @property
+    def offsets(self):
+        if self._offsets is None and self.gt_file is not None:
+            self._offsets = np.load(os.path.join(self.dir, "offsets.npy"))
+        return self._offsets
+
+    def frame(self, fid):
+        """GT rows of one frame."""
+        if self.gt is None or not 0 <= fid < len(self.offsets) - 1:
+            return np.empty((0, len(GT_COLUMNS)))
+        return self.gt[self.offsets[fid]:self.offsets[fid + 1]]
+
+
+def index_sequence(dataset_dir, seq, index_dir=DATASET_INDEX_DIR):
+    """Parses one sequence's seqinfo.ini and gt/gt.txt into the binary index. Returns its folder."""
+    seq_dir = os.path.join(dataset_dir, seq)
+    out_dir = os.path.join(index_root(dataset_dir, index_dir), seq)
+    os.makedirs(out_dir, exist_ok=True)
+    signature = source_signature(seq_dir)
+    info = read_seqinfo(seq_dir)
+
+    num_timesteps = int(info.get("seqLength", 0))
+    gt_path = os.path.join(seq_dir, "gt", "gt.txt")
+    has_gt = os.path.exists(gt_path)
+    if has_gt:
+        gt = parse_mot_text(gt_path)
+        frames = gt[:, 0].astype(np.int64) if len(gt) else np.zeros(0, dtype=np.int64)
+        order = np.argsort(frames, kind="stable")  # keep file order within a frame
+        gt, frames = gt[order], frames[order]
+        if not num_timesteps and len(frames):
+            num_timesteps = int(frames[-1])
+        offsets = np.searchsorted(frames, np.arange(0, max(num_timesteps, int(frames[-1]) if len(frames) else 0) + 2))
+
+        # Write to temp files first so readers never see a half-written index
+        for name, array in (("gt", gt), ("offsets", offsets)):
+            tmp_path = os.path.join(out_dir, f"{name}.tmp.npy")
+            np.save(tmp_path, array)
+            os.replace(tmp_path, os.path.join(out_dir, f"{name}.npy"))
+
+    tmp_path = os.path.join(out_dir, "info.json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({"seqinfo": info, "num_timesteps": num_timesteps, "has_gt": has_gt,
+                   "columns": list(GT_COLUMNS), "signature": signature}, f, indent=2)
+    os.replace(tmp_path, os.path.join(out_dir, "info.json"))
+    return out_dir
+
+
+def is_current(dataset_dir, seq, index_dir=DATASET_INDEX_DIR):
+    info_path = os.path.join(index_root(dataset_dir, index_dir), seq, "info.json")
+    if not os.path.exists(info_path):
+        return False
+    with open(info_path, 'r') as f:
+        stored = json.load(f).get("signature")
+    return stored == source_signature(os.path.join(dataset_dir, seq))
+
+
+def open_sequence(dataset_dir, seq, index_dir=DATASET_INDEX_DIR):
+    """Indexed sequence, (re)built first if it is missing or its source files changed."""
+    if not is_current(dataset_dir, seq, index_dir):
+        index_sequence(dataset_dir, seq, index_dir)
+    return SequenceIndex(os.path.join(index_root(dataset_dir, index_dir), seq))
+
+
+def build_index(dataset_dir, sequences=None, index_dir=DATASET_INDEX_DIR):
+    """Brings the index of a dataset up to date. Returns {seq: SequenceIndex}."""
+    sequences = list_sequences(dataset_dir) if sequences is None else sequences
+    stale = [seq for seq in sequences if not is_current(dataset_dir, seq, index_dir)]
+    for seq in stale:
+        index_sequence(dataset_dir, seq, index_dir)
+    if stale:
+        print(f"🗂️  Dataset index '{dataset_dir}': {len(sequences) - len(stale)} up to date, {len(stale)} rebuilt")
+    return {seq: SequenceIndex(os.path.join(index_root(dataset_dir, index_dir), seq)) for seq in sequences}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Indexes GT and seqinfo of MOTChallenge-style datasets.")
+    parser.add_argument("datasets", nargs="+", help="Dataset folders, e.g. dancetrack_val_local MOT17/train MOT20/train")
+    args = parser.parse_args()
+    for dataset in args.datasets:
+        index = build_index(dataset)
+        print(f"✅ {dataset}: {len(index)} sequences indexed under {index_root(dataset)}")
@@ -0,0 +1,182 @@
+import os
+import json
+import hashlib
+import time
+import numpy as np
+import torch
+from tqdm import tqdm
+
+from eval_cache import file_digest
+from frame_source import PrefetchFrameSource
+
+# --- CONFIGURATION ---
+DET_CACHE_DIR = "det_cache"
+
+# Column layout of a cached sequence array (one row per detection, sorted by frame)
+# Format: frame, x1, y1, x2, y2, conf, class_id
+CACHE_COLUMNS = ("frame", "x1", "y1", "x2", "y2", "conf", "cls")
+
+
+def ultralytics_version():
+    try:
+        from importlib.metadata import version
+        return version("ultralytics")
+    except Exception:
+        return "unknown"
+
+
+def weights_digest(weights):
+    """Content digest of the weights file, None if it is not on disk yet (the detector downloads it)."""
+    return file_digest(weights) if os.path.isfile(weights) else None
+
+
+def cache_key(weights, conf, classes):
+    """Short hash identifying one detector setup (weights file contents, conf threshold, class filter)
+    and the ultralytics version, which also changes the predictions."""
+    payload = json.dumps({
+        "weights": os.path.basename(str(weights)),
+        "weights_sha256": weights_digest(weights),
+        "conf": float(conf),
+        "classes": sorted(int(c) for c in classes),
+        "ultralytics": ultralytics_version(),
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+def cache_file(seq, key, cache_dir=DET_CACHE_DIR):
+    """Path of the cached detection array for one sequence."""
+    return os.path.join(cache_dir, key, f"{seq}.npy")
+
+
+def _to_dets(results):
+    """Ultralytics result -> (M, 6) [x1, y1, x2, y2, conf, cls] float32 array."""
+    if results.boxes:
+        return results.boxes.data.cpu().numpy()[:, :6].astype(np.float32)
+    return np.empty((0, 6), dtype=np.float32)
+
+
+def predict_batch(model, frames, device, conf, classes):
+    """Runs the detector on several frames in one call.
+
+    `frames` is a list of HxWx3 BGR images or a decoded (B, H, W, 3) uint8 array. Returns one
+    detection array per frame, in input order. If the accelerator runs out of memory the batch
+    is split in half and retried, and a single frame that still does not fit falls back to CPU.
+    """
+    if isinstance(frames, np.ndarray):
+        frames = list(frames)
+    if not frames:
+        return []
+
+    try:
+        results = model.predict(frames, classes=classes, verbose=False, conf=conf, device=device)
+    except torch.cuda.OutOfMemoryError:
+        torch.cuda.empty_cache()
+        if len(frames) == 1:
+            print("⚠️ Out of GPU memory on a single frame, falling back to CPU.")
+            return predict_batch(model, frames, "cpu", conf, classes)
+        mid = len(frames) // 2
+        return (predict_batch(model, frames[:mid], device, conf, classes)
+                + predict_batch(model, frames[mid:], device, conf, classes))
+
+    return [_to_dets(r) for r in results]
+
+
+def timing_file(seq, key, cache_dir=DET_CACHE_DIR):
+    """Path of the per-frame detector latency recorded when the cache entry was built."""
+    return os.path.join(cache_dir, key, f"{seq}.timing.npy")
+
+
+def detect_sequence(model, seq_dir, device, conf, classes, batch_size=1):
+    """Runs the detector over every frame of a sequence.
+
+    Returns one (N, 7) float32 detection array and the per-frame detector latency in seconds
+    (batch time split evenly across the frames of the batch).
+    """
+    rows = []
+    timings = []
+    batch_ids, batch_imgs = [], []
+
+    def flush():
+        if not batch_imgs:
+            return
+        t0 = time.perf_counter()
+        batch_dets = predict_batch(model, batch_imgs, device, conf, classes)
+        timings.extend([(time.perf_counter() - t0) / len(batch_imgs)] * len(batch_imgs))
+        for fid, dets in zip(batch_ids, batch_dets):
+            if len(dets) > 0:
+                rows.append(np.hstack([np.full((len(dets), 1), fid, dtype=np.float32), dets]))
+        batch_ids.clear()
+        batch_imgs.clear()
+
+    # Frames are decoded ahead on worker threads while the detector runs
+    for fid, _, img in PrefetchFrameSource(seq_dir, depth=2 * batch_size):
+        batch_ids.append(fid)
+        batch_imgs.append(img)
+        if len(batch_imgs) == batch_size:
+            flush()
+    flush()
+
+    timings = np.asarray(timings, dtype=np.float32)
+    if rows:
+        return np.vstack(rows), timings
+    return np.empty((0, len(CACHE_COLUMNS)), dtype=np.float32), timings
+
+
+def build_cache(model, data_dir, sequences, device, weights, conf, classes, batch_size=1,
+                cache_dir=DET_CACHE_DIR):
+    """Detection stage: runs the detector once per sequence and stores the result on disk.
+
+    Sequences that already have a cache entry for this detector setup are skipped, so the
+    cache is reused across later runs. Returns the cache key.
+    """
+    key = cache_key(weights, conf, classes)
+    key_dir = os.path.join(cache_dir, key)
+    os.makedirs(key_dir, exist_ok=True)
+
+    meta_path = os.path.join(key_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        with open(meta_path, 'w') as f:
+            json.dump({"weights": str(weights), "weights_sha256": weights_digest(weights), "conf": conf,
+                       "classes": list(classes), "ultralytics": ultralytics_version(),
+                       "columns": list(CACHE_COLUMNS)}, f, indent=2)
+
+    todo = [seq for seq in sequences if not os.path.exists(cache_file(seq, key, cache_dir))]
+    print(f"🗃️  Detection cache '{key}': {len(sequences) - len(todo)} cached, {len(todo)} to detect")
+
+    for seq in tqdm(todo, desc="Detecting"):
+        dets, timings = detect_sequence(model, os.path.join(data_dir, seq), device, conf, classes, batch_size)
+        np.save(timing_file(seq, key, cache_dir), timings)
+
+        # Write to a temp file first so an interrupted run never leaves a truncated cache entry
+        out_path = cache_file(seq, key, cache_dir)
+        tmp_path = out_path + ".tmp.npy"
+        np.save(tmp_path, dets)
+        os.replace(tmp_path, out_path)
+
+    return key
+
+
+def load_detections(seq, key, cache_dir=DET_CACHE_DIR):
+    """Memory-maps the cached detections of one sequence."""
+    return np.load(cache_file(seq, key, cache_dir), mmap_mode='r')
+
+
+def load_detect_timing(seq, key, cache_dir=DET_CACHE_DIR):
+    """Per-frame detector latency (seconds) of one sequence, or None if it was never recorded."""
+    path = timing_file(seq, key, cache_dir)
+    return np.load(path) if os.path.exists(path) else None
+
+
+def frame_index(dets):
+    """Maps frame number -> (start, end) row range of a frame-sorted detection array."""
+    frames = np.asarray(dets[:, 0]).astype(np.int64)
+    ids, starts, counts = np.unique(frames, return_index=True, return_counts=True)
+    return {int(f): (int(s), int(s + c)) for f, s, c in zip(ids, starts, counts)}
+
+
+def frame_detections(dets, index, fid):
+    """Returns the (M, 6) [x1, y1, x2, y2, conf, cls] detections of one frame."""
+    if fid not in index:
+        return np.empty((0, 6), dtype=np.float32)
+    lo, hi = index[fid]
+    return np.array(dets[lo:hi, 1:], dtype=np.float32)
@@ -0,0 +1,117 @@
+import os
+import hashlib
+import numpy as np
+
+# --- CONFIGURATION ---
+EVAL_CACHE_DIR = "eval_cache"
+EVAL_CACHE_MAX_BYTES = 512 * 1024 * 1024  # least recently used entries are evicted beyond this
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _flatten(result):
+    """{'HOTA': {'AssA': array, ...}, ...} -> {'HOTA/AssA': array, ...}"""
+    return {f"{metric}/{field}": np.asarray(value) for metric, fields in result.items() for field, value in fields.items()}
+
+
+def _unflatten(arrays):
+    result = {}
+    for key in arrays.files:
+        metric, field = key.split("/", 1)
+        value = arrays[key]
+        result.setdefault(metric, {})[field] = value.item() if value.ndim == 0 else value
+    return result
+
+
+class EvalCache:
+    """On-disk cache of per-sequence evaluation results, keyed by content.
+
+    A key covers the bytes of the GT file and the result file plus everything else that changes
+    the metrics (sequence length, benchmark, evaluator version), so renamed or touched files still
+    hit and any edit misses. Entries are .npz files of the per-sequence sufficient statistics; the
+    least recently used ones are evicted once the cache grows past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir=EVAL_CACHE_DIR, max_bytes=EVAL_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._digests = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def digest(self, path):
+        """Content hash of a file, computed once per cache instance and file state."""
+        st = os.stat(path)
+        memo_key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        if memo_key not in self._digests:
+            self._digests[memo_key] = file_digest(path)
+        return self._digests[memo_key]
+
+    def key(self, gt_file, tracker_file, *extra):
+        h = hashlib.sha256()
+        for part in (self.digest(gt_file), self.digest(tracker_file), *extra):
+            h.update(str(part).encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npz")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path) as arrays:
+                result = _unflatten(arrays)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, **_flatten(result))
+        os.replace(tmp_path, path)
+
+    def entries(self):
+        """(path, size, last use) of every cached entry, oldest first."""
+        found = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".npz") and not name.endswith(".tmp.npz"):
+                    path = os.path.join(root, name)
+                    st = os.stat(path)
+                    found.append((path, st.st_size, st.st_mtime))
+        return sorted(found, key=lambda e: e[2])
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in `max_bytes`."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.evictions += 1
+        return total
+
+    def stats(self):
+        entries = self.entries()
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions, "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries), "max_bytes": self.max_bytes}
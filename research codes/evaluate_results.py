@@ -1,10 +1,26 @@
 import os
+import argparse
 import shutil
 import subprocess
 import sys
 
-def setup_eval():
-    """Clones and patches the TrackEval library for compatibility."""
+import dataset_config
+import hota_eval
+import mot_io
+import results_store
+from eval_cache import EVAL_CACHE_MAX_BYTES, EvalCache
+
+METRICS_FILE = "metrics.csv"  # per-(tracker, sequence) table written next to the results
+SCALING_FILE = "eval_scaling.csv"
+SUMMARY_KEYS = ["HOTA", "DetA", "AssA", "LocA", "IDF1", "MOTA", "IDSW"]
+
+def setup_eval(force=False):
+    """Clones and patches the TrackEval library for compatibility (only needed for --backend trackeval)."""
+    patched_file = 'TrackEval/trackeval/datasets/mot_challenge_2d_box.py'
+    if os.path.exists(patched_file) and not force:
+        with open(patched_file, 'r') as f:
+            if "isinstance(seqmap_file, list)" in f.read():
+                return True
     if os.path.exists("TrackEval"):
         shutil.rmtree("TrackEval")
     
@@ -37,26 +53,54 @@ def setup_eval():
         return False
     return True
 
-def run_eval():
-    """Runs the HOTA evaluation script."""
+def run_eval(tracker_results_folder="tracker_results", trackers=("DeepOCSORT", "StrongSORT", "ByteTrack"),
+             seqmap_file=None, gt_folder="dancetrack_val_local", backend="builtin", benchmark="DanceTrack",
+             workers=1, cache=True, cache_max_bytes=EVAL_CACHE_MAX_BYTES):
+    """Runs the HOTA evaluation.
+
+    The built-in backend (hota_eval.py) evaluates (tracker, sequence) units on `workers`
+    processes and returns the per-sequence table; the 'trackeval' backend runs the cloned
+    TrackEval scripts instead (in parallel when `workers` > 1). Both write
+    <tracker>/pedestrian_summary.txt (see read_summary).
+
+    With `cache` the built-in backend reuses per-sequence results of unchanged (GT, result)
+    file pairs from eval_cache/ and only evaluates the sequences that changed. Its per-sequence
+    table also goes to the 'metrics' table of the results store.
+    """
     print("🏆 Calculating HOTA Scores...")
     
     # Define evaluation parameters
-    tracker_results_folder = "tracker_results"
-    gt_folder = "dancetrack_val_local"
-    seqmap_file = os.path.join(tracker_results_folder, "seqmaps", "dancetrack-val.txt")
+    if seqmap_file is None:
+        seqmap_file = os.path.join(tracker_results_folder, "seqmaps", mot_io.SEQMAP_NAME)
 
     if not os.path.exists(seqmap_file):
         print(f"❌ Seqmap file not found at {seqmap_file}. Did you run stitch_results.py?")
         return
 
+    if backend == "builtin":
+        eval_cache = EvalCache(max_bytes=cache_max_bytes) if cache else None
+        table = hota_eval.evaluate(gt_folder, tracker_results_folder, list(trackers),
+                                   hota_eval.read_seqmap(seqmap_file), benchmark, workers=workers, cache=eval_cache)
+        if eval_cache is not None:
+            stats = eval_cache.stats()
+            print(f"🗃️  Eval cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evicted "
+                  f"({stats['entries']} entries, {stats['bytes'] / 1e6:.1f} MB)")
+        table.to_csv(os.path.join(tracker_results_folder, METRICS_FILE), index=False)
+        results_store.write_metrics(table)
+        combined = table[table["seq"] == "COMBINED"]
+        print(combined[["tracker"] + SUMMARY_KEYS].to_string(index=False))
+        return table
+
+    if not setup_eval():
+        return
+
     cmd = (
         f"{sys.executable} TrackEval/scripts/run_mot_challenge.py "
-        "--BENCHMARK DanceTrack "
+        f"--BENCHMARK {benchmark} "
         "--SPLIT_TO_EVAL val "
-        "--TRACKERS_TO_EVAL DeepOCSORT StrongSORT ByteTrack "
-        "--METRICS HOTA Identity "
-        "--USE_PARALLEL False "
+        f"--TRACKERS_TO_EVAL {' '.join(trackers)} "
+        "--METRICS HOTA CLEAR Identity "
+        f"--USE_PARALLEL {workers > 1} --NUM_PARALLEL_CORES {max(1, workers)} "
         f"--GT_FOLDER {gt_folder} "
         f"--TRACKERS_FOLDER {tracker_results_folder} "
         "--GT_LOC_FORMAT '{gt_folder}/{seq}/gt/gt.txt' "
@@ -73,6 +117,90 @@ def run_eval():
     except Exception as e:
         print(f"❌ Error running evaluation: {e}")
 
+def read_summary(tracker_results_folder, tracker):
+    """Combined metrics TrackEval wrote for one tracker (pedestrian_summary.txt) as a dict."""
+    summary_file = os.path.join(tracker_results_folder, tracker, "pedestrian_summary.txt")
+    if not os.path.exists(summary_file):
+        return None
+    with open(summary_file, 'r') as f:
+        keys = f.readline().split()
+        values = f.readline().split()
+    return {k: float(v) for k, v in zip(keys, values)}
+
+def validate(tracker_results_folder="tracker_results", trackers=("DeepOCSORT", "StrongSORT", "ByteTrack"),
+             seqmap_file=None, gt_folder="dancetrack_val_local", benchmark="DanceTrack"):
+    """Checks the built-in evaluator against TrackEval on the same results.
+
+    Both summaries are compared at TrackEval's printed precision (5 significant digits).
+    Returns True if every shared metric matches for every tracker.
+    """
+    if seqmap_file is None:
+        seqmap_file = os.path.join(tracker_results_folder, "seqmaps", mot_io.SEQMAP_NAME)
+    table = hota_eval.evaluate(gt_folder, tracker_results_folder, list(trackers),
+                               hota_eval.read_seqmap(seqmap_file), benchmark, write_summaries=False)
+    run_eval(tracker_results_folder, trackers, seqmap_file, gt_folder, backend="trackeval", benchmark=benchmark)
+
+    ok = True
+    for tracker in trackers:
+        reference = read_summary(tracker_results_folder, tracker)
+        if reference is None:
+            print(f"❌ TrackEval wrote no summary for {tracker}.")
+            ok = False
+            continue
+        ours = table[(table["tracker"] == tracker) & (table["seq"] == "COMBINED")].iloc[0]
+        mismatches = [k for k, v in reference.items()
+                      if k in ours and float("{0:1.5g}".format(ours[k])) != v]
+        for k in mismatches:
+            print(f"❌ {tracker} {k}: built-in {ours[k]:.5g} vs TrackEval {reference[k]:.5g}")
+        if not mismatches:
+            print(f"✅ {tracker}: all {len(reference)} metrics match TrackEval.")
+        ok = ok and not mismatches
+    return ok
+
+def scaling(tracker_results_folder="tracker_results", trackers=("DeepOCSORT", "StrongSORT", "ByteTrack"),
+            seqmap_file=None, gt_folder="dancetrack_val_local", worker_counts=(1, 2, 4, 8), benchmark="DanceTrack"):
+    """Scaling report of the built-in evaluator, saved to <tracker_results_folder>/eval_scaling.csv."""
+    if seqmap_file is None:
+        seqmap_file = os.path.join(tracker_results_folder, "seqmaps", mot_io.SEQMAP_NAME)
+    report = hota_eval.scaling_report(gt_folder, tracker_results_folder, list(trackers),
+                                      hota_eval.read_seqmap(seqmap_file), worker_counts, benchmark)
+    report.to_csv(os.path.join(tracker_results_folder, SCALING_FILE), index=False)
+    return report
+
 if __name__ == "__main__":
-    if setup_eval():
-        run_eval()
\ No newline at end of file
+    datasets = dataset_config.load_datasets()
+    parser = argparse.ArgumentParser(description="Evaluates tracker results (HOTA, CLEAR, Identity).")
+    parser.add_argument("--backend", choices=["builtin", "trackeval"], default="builtin",
+                        help="builtin: in-process evaluator (hota_eval.py); trackeval: clone and run TrackEval.")
+    parser.add_argument("--dataset", choices=sorted(datasets), default=dataset_config.DEFAULT_DATASET,
+                        help="Dataset whose folders from configs/datasets.json are evaluated (same as main_benchmark.py).")
+    parser.add_argument("--benchmark", help="Class handling (default: the dataset's); MOT20 enables its extra distractor class.")
+    parser.add_argument("--gt-folder", help="Dataset folder with <seq>/gt/gt.txt (default: the dataset's data folder).")
+    parser.add_argument("--trackers-folder",
+                        help="Results folder of main_benchmark.py (<tracker>/data/<seq>.txt); metrics.csv goes here "
+                             "(default: the dataset's results folder).")
+    parser.add_argument("--seqmap", help="Sequences to evaluate (default: <trackers-folder>/seqmaps/<dataset's seqmap>).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Processes for (tracker, sequence) evaluation units.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-evaluate every sequence instead of reusing eval_cache/ results.")
+    parser.add_argument("--cache-max-mb", type=float, default=EVAL_CACHE_MAX_BYTES / 1e6,
+                        help="Size bound of eval_cache/; least recently used entries are evicted beyond it.")
+    parser.add_argument("--scaling", metavar="N1,N2,...",
+                        help="Time the built-in evaluation at these worker counts and write eval_scaling.csv.")
+    parser.add_argument("--validate", action="store_true",
+                        help="Run both backends and check that the built-in metrics match TrackEval.")
+    args = parser.parse_args()
+    dataset = datasets[args.dataset]
+    trackers_folder = args.trackers_folder or dataset["results"]
+    folders = {"tracker_results_folder": trackers_folder, "gt_folder": args.gt_folder or dataset["data"],
+               "seqmap_file": args.seqmap or os.path.join(trackers_folder, "seqmaps", dataset["seqmap"])}
+    benchmark = args.benchmark or dataset["benchmark"]
+    if args.validate:
+        sys.exit(0 if validate(**folders, benchmark=benchmark) else 1)
+    if args.scaling:
+        report = scaling(**folders, worker_counts=[int(w) for w in args.scaling.split(",")], benchmark=benchmark)
+        print(report.to_string(index=False))
+        sys.exit(0)
+    run_eval(**folders, backend=args.backend, benchmark=benchmark, workers=args.workers,
+             cache=not args.no_cache, cache_max_bytes=int(args.cache_max_mb * 1e6))
\ No newline at end of file
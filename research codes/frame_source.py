@@ -0,0 +1,383 @@
+import os
+import time
+import queue
+import socket
+import struct
+import argparse
+import threading
+import configparser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import cv2
+import numpy as np
+
+# --- CONFIGURATION ---
+PREFETCH_DEPTH = 8  # max frames decoded ahead of the consumer
+DECODE_WORKERS = 2  # cv2 releases the GIL while decoding, so threads run in parallel
+VIDEO_EXTS = (".mp4", ".avi", ".mkv", ".mov", ".webm")
+STREAM_TIMEOUT = 10.0  # seconds a stream may stall before the reader gives up
+
+# Stream wire format: per frame a (frame_id, payload_bytes) header followed by the JPEG payload.
+# A zero-length payload ends the stream.
+STREAM_HEADER = struct.Struct("!II")
+
+# JPEG decoders can downscale by 2/4/8 during decode, which is much cheaper than resizing after
+REDUCED_DECODE = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2,
+                  4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+
+
+def frame_id(frame_name):
+    """Frame number from an img1/ filename (e.g. '00000042.jpg' -> 42)."""
+    return int(os.path.splitext(frame_name)[0])
+
+
+def list_frames(img_dir):
+    """Sorted .jpg frame names of an img1/ directory."""
+    return sorted([f for f in os.listdir(img_dir) if f.endswith('.jpg')])
+
+
+def read_seqinfo(seq_dir):
+    """Parses a sequence's seqinfo.ini into a dict with typed values (empty if missing)."""
+    ini_path = os.path.join(seq_dir, "seqinfo.ini")
+    if not os.path.exists(ini_path):
+        return {}
+
+    config = configparser.ConfigParser()
+    config.optionxform = str  # keep camelCase keys such as imWidth
+    config.read(ini_path)
+    if 'Sequence' not in config:
+        return {}
+
+    info = {}
+    for k, v in config['Sequence'].items():
+        try:
+            info[k] = int(v)
+        except ValueError:
+            try:
+                info[k] = float(v)
+            except ValueError:
+                info[k] = v
+    return info
+
+
+def decode_flag(scale):
+    """imread/imdecode flag that decodes a JPEG directly at `scale` (1, 1/2, 1/4 or 1/8), else None."""
+    factor = int(round(1.0 / scale))
+    if abs(factor * scale - 1.0) < 1e-6:
+        return REDUCED_DECODE.get(factor)
+    return None
+
+
+def resize(img, scale):
+    """Downscales a decoded frame (no-op at scale 1)."""
+    if img is None or scale == 1.0:
+        return img
+    return cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+class FrameSource:
+    """Base class of the frame sources: iterating yields (frame_id, frame_name, image) in order.
+
+    `stride` keeps every stride-th frame of the input and `scale` sets the decode resolution
+    relative to the input. Frame ids always refer to the full-rate input, so tracks can be written
+    against the original frame numbers. Decode work is counted in `stats()`.
+    """
+    kind = "frames"
+
+    def __init__(self, uri, stride=1, scale=1.0, depth=PREFETCH_DEPTH):
+        self.uri = str(uri)
+        self.stride = max(1, int(stride))
+        self.scale = float(scale)
+        self.depth = max(1, depth)
+        self.info = {}
+        self.decoded = 0
+        self.dropped = 0
+        self.decode_s = 0.0
+        self._lock = threading.Lock()
+
+    def _record(self, t0, decoded=True):
+        with self._lock:
+            self.decode_s += time.perf_counter() - t0
+            if decoded:
+                self.decoded += 1
+            else:
+                self.dropped += 1
+
+    def stats(self):
+        """Decode throughput: frames decoded per second of decode work (per decoding thread)."""
+        return {"source": self.kind, "uri": self.uri, "stride": self.stride, "scale": self.scale,
+                "frames": self.decoded, "dropped": self.dropped, "decode_s": round(self.decode_s, 4),
+                "decode_fps": round(self.decoded / self.decode_s, 2) if self.decode_s > 0 else None}
+
+
+class ImageDirSource(FrameSource):
+    """Streams the frames of a sequence's img1/ directory (or any folder of .jpg frames), decoding
+    ahead on worker threads.
+
+    At most `depth` frames are in flight at once, so memory stays bounded while JPEG decode
+    overlaps with detection and tracking on the main thread. Frames are always yielded in order
+    as (frame_id, frame_name, image). Frames up to and including `after_frame` are skipped without
+    being decoded. With `with_info=True` the parsed seqinfo.ini is available as `source.info`.
+    """
+    kind = "images"
+
+    def __init__(self, seq_dir, depth=PREFETCH_DEPTH, workers=DECODE_WORKERS, with_info=False, after_frame=0,
+                 stride=1, scale=1.0):
+        super().__init__(seq_dir, stride, scale, depth)
+        self.seq_dir = seq_dir
+        img_dir = os.path.join(seq_dir, "img1")
+        self.img_dir = img_dir if os.path.isdir(img_dir) else seq_dir
+        self.workers = max(1, workers)
+        all_frames = list_frames(self.img_dir)
+        self.frames = [f for f in all_frames[::self.stride] if frame_id(f) > after_frame]
+        self.skipped = sum(1 for f in all_frames if frame_id(f) <= after_frame)
+        self.dropped = len(all_frames) - self.skipped - len(self.frames)
+        self.info = read_seqinfo(seq_dir) if with_info else None
+        self._flag = decode_flag(self.scale)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def _decode(self, frame_name):
+        t0 = time.perf_counter()
+        path = os.path.join(self.img_dir, frame_name)
+        if self._flag is not None:
+            img = cv2.imread(path, self._flag)
+        else:
+            img = resize(cv2.imread(path), self.scale)
+        self._record(t0)
+        return img
+
+    def __iter__(self):
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        pending = deque()
+        names = iter(self.frames)
+        try:
+            for name in names:
+                pending.append((name, pool.submit(self._decode, name)))
+                if len(pending) >= self.depth:
+                    break
+
+            while pending:
+                name, future = pending.popleft()
+                next_name = next(names, None)
+                if next_name is not None:
+                    pending.append((next_name, pool.submit(self._decode, next_name)))
+                yield frame_id(name), name, future.result()
+        finally:
+            # Consumer stopped early: drop whatever is still queued
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+
+# Kept for existing callers
+PrefetchFrameSource = ImageDirSource
+
+
+class SequentialSource(FrameSource):
+    """Base class for inputs that can only be read front to back (video files, live streams).
+
+    One reader thread decodes into a bounded queue of `depth` frames, so decode still overlaps
+    with detection and tracking. Subclasses implement `_read()`.
+    """
+    _END = object()
+
+    def _read(self):
+        raise NotImplementedError
+
+    def __iter__(self):
+        frames = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for item in self._read():
+                    if not put(item):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(self._END)
+
+        reader = threading.Thread(target=produce, daemon=True)
+        reader.start()
+        try:
+            while True:
+                item = frames.get()
+                if item is self._END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            reader.join()
+
+
+class VideoFileSource(SequentialSource):
+    """Decodes a local video file with cv2.VideoCapture. Frame ids are 1-based frame numbers.
+
+    Frames dropped by `stride` are only grabbed, never retrieved, which skips their colour
+    conversion and copy.
+    """
+    kind = "video"
+
+    def __init__(self, path, stride=1, scale=1.0, depth=PREFETCH_DEPTH):
+        super().__init__(path, stride, scale, depth)
+        cap = cv2.VideoCapture(self.uri)
+        if not cap.isOpened():
+            raise IOError(f"Cannot open video: {path}")
+        self.info = {"name": os.path.splitext(os.path.basename(self.uri))[0],
+                     "frameRate": cap.get(cv2.CAP_PROP_FPS),
+                     "seqLength": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                     "imWidth": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                     "imHeight": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))}
+        cap.release()
+
+    def __len__(self):
+        return len(range(0, self.info["seqLength"], self.stride))
+
+    def _read(self):
+        cap = cv2.VideoCapture(self.uri)
+        try:
+            index = 0
+            while True:
+                t0 = time.perf_counter()
+                index += 1
+                if (index - 1) % self.stride:
+                    if not cap.grab():
+                        break
+                    self._record(t0, decoded=False)
+                    continue
+                ok, img = cap.read()
+                if not ok:
+                    break
+                img = resize(img, self.scale)
+                self._record(t0)
+                yield index, f"{index:08d}.jpg", img
+        finally:
+            cap.release()
+
+
+class StreamSource(SequentialSource):
+    """Reads a live stream of JPEG frames from tcp://host:port (see `serve_stream`).
+
+    Frames dropped by `stride` are received but never decoded. Reduced resolutions of 1/2, 1/4
+    and 1/8 are decoded directly by the JPEG decoder.
+    """
+    kind = "stream"
+
+    def __init__(self, uri, stride=1, scale=1.0, depth=PREFETCH_DEPTH, timeout=STREAM_TIMEOUT):
+        super().__init__(uri, stride, scale, depth)
+        parts = urlsplit(self.uri)
+        self.host, self.port = parts.hostname or "127.0.0.1", parts.port
+        self.timeout = timeout
+        self.info = {"name": f"stream_{self.host}_{self.port}"}
+        self._flag = decode_flag(self.scale)
+
+    def _read(self):
+        with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+            stream = sock.makefile('rb')
+            received = 0
+            while True:
+                header = stream.read(STREAM_HEADER.size)
+                if len(header) < STREAM_HEADER.size:
+                    break
+                fid, size = STREAM_HEADER.unpack(header)
+                if size == 0:
+                    break
+                payload = stream.read(size)
+                if len(payload) < size:
+                    break
+                received += 1
+                if (received - 1) % self.stride:
+                    self.dropped += 1
+                    continue
+
+                t0 = time.perf_counter()
+                buf = np.frombuffer(payload, dtype=np.uint8)
+                if self._flag is not None:
+                    img = cv2.imdecode(buf, self._flag)
+                else:
+                    img = resize(cv2.imdecode(buf, cv2.IMREAD_COLOR), self.scale)
+                self._record(t0)
+                yield fid, f"{fid:08d}.jpg", img
+
+
+def open_source(uri, stride=1, scale=1.0, **kwargs):
+    """Opens a frame source from a tcp:// URL, a video file or a frame directory."""
+    uri = str(uri)
+    if uri.startswith("tcp://"):
+        return StreamSource(uri, stride=stride, scale=scale, **kwargs)
+    if os.path.isdir(uri):
+        return ImageDirSource(uri, stride=stride, scale=scale, **kwargs)
+    if os.path.isfile(uri) and uri.lower().endswith(VIDEO_EXTS):
+        return VideoFileSource(uri, stride=stride, scale=scale, **kwargs)
+    raise ValueError(f"Unsupported frame source: {uri}")
+
+
+def serve_stream(path, port, host="127.0.0.1", fps=0):
+    """Publishes an image directory or video file as a tcp:// frame stream to one client.
+
+    Stand-in for a live camera when testing StreamSource. `fps` > 0 paces frames in real time.
+    """
+    source = open_source(path)
+    with socket.create_server((host, port)) as server:
+        print(f"📡 Serving {path} on tcp://{host}:{port}")
+        conn, _ = server.accept()
+        with conn:
+            for fid, name, img in source:
+                if isinstance(source, ImageDirSource):
+                    with open(os.path.join(source.img_dir, name), 'rb') as f:
+                        payload = f.read()
+                else:
+                    payload = cv2.imencode(".jpg", img)[1].tobytes()
+                conn.sendall(STREAM_HEADER.pack(fid, len(payload)) + payload)
+                if fps > 0:
+                    time.sleep(1.0 / fps)
+            conn.sendall(STREAM_HEADER.pack(0, 0))
+
+
+def measure_decode(uri, stride=1, scale=1.0):
+    """Reads a whole source without any downstream work and returns its decode stats."""
+    source = open_source(uri, stride=stride, scale=scale)
+    t0 = time.perf_counter()
+    for _ in source:
+        pass
+    stats = source.stats()
+    wall_s = time.perf_counter() - t0
+    stats["wall_fps"] = round(stats["frames"] / wall_s, 2) if wall_s > 0 else None
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frame source utilities.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="Publish frames as a tcp:// stream.")
+    serve.add_argument("path", help="Sequence/image directory or video file.")
+    serve.add_argument("--port", type=int, default=5000)
+    serve.add_argument("--fps", type=float, default=0, help="Pace frames in real time (0 = as fast as possible).")
+    bench = sub.add_parser("bench", help="Measure decode throughput of a source.")
+    bench.add_argument("uri", help="Directory, video file or tcp://host:port.")
+    bench.add_argument("--stride", type=int, default=1)
+    bench.add_argument("--scale", type=float, default=1.0)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve_stream(args.path, args.port, fps=args.fps)
+    else:
+        stats = measure_decode(args.uri, args.stride, args.scale)
+        print(f"🎞️  {stats['source']} {stats['uri']}: {stats['frames']} frames "
+              f"(stride {stats['stride']}, scale {stats['scale']}), "
+              f"decode {stats['decode_fps']} fps, end-to-end {stats['wall_fps']} fps")
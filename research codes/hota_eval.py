@@ -0,0 +1,549 @@
+import os
+import time
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+import dataset_index
+
+# --- CONFIGURATION ---
+# Same conventions as TrackEval's MotChallenge2DBox dataset and HOTA / CLEAR / Identity metrics
+ALPHAS = np.arange(0.05, 0.99, 0.05)  # HOTA localization thresholds
+MATCH_THRESHOLD = 0.5  # IoU threshold of CLEAR and Identity
+PEDESTRIAN_CLASS = 1
+DISTRACTOR_CLASSES = [2, 7, 8, 12]  # person_on_vehicle, static_person, distractor, reflection
+MOT20_DISTRACTOR_CLASSES = DISTRACTOR_CLASSES + [6]  # + non_mot_vehicle
+VALID_CLASSES = list(range(1, 14))
+EPS = np.finfo('float').eps
+EVALUATOR_VERSION = 2  # part of evaluation cache keys; bump whenever metric results change
+
+# Column order of TrackEval's <class>_summary.txt
+SUMMARY_ORDER = ['HOTA', 'DetA', 'AssA', 'DetRe', 'DetPr', 'AssRe', 'AssPr', 'LocA', 'OWTA', 'HOTA(0)', 'LocA(0)',
+                 'HOTALocA(0)', 'MOTA', 'MOTP', 'MODA', 'CLR_Re', 'CLR_Pr', 'MTR', 'PTR', 'MLR', 'CLR_TP', 'CLR_FN',
+                 'CLR_FP', 'IDSW', 'MT', 'PT', 'ML', 'Frag', 'sMOTA', 'IDF1', 'IDR', 'IDP', 'IDTP', 'IDFN', 'IDFP',
+                 'Dets', 'GT_Dets', 'IDs', 'GT_IDs']
+INTEGER_FIELDS = {'CLR_TP', 'CLR_FN', 'CLR_FP', 'IDSW', 'MT', 'PT', 'ML', 'Frag',
+                  'IDTP', 'IDFN', 'IDFP', 'Dets', 'GT_Dets', 'IDs', 'GT_IDs'}
+
+
+# --- LOADING & PREPROCESSING ---
+
+def load_mot_file(path):
+    """Reads a MOTChallenge text file or an indexed GT array (dataset_index) into an (N, C) float array."""
+    if path.endswith(".npy"):
+        return np.load(path)
+    return dataset_index.parse_mot_text(path)
+
+
+def split_frames(data, num_timesteps, path):
+    """Splits rows into one array per timestep (frame 1 -> timestep 0), keeping file order."""
+    frames = data[:, 0].astype(int) if len(data) else np.zeros(0, dtype=int)
+    if len(frames) and (frames.min() < 1 or frames.max() > num_timesteps):
+        raise ValueError(f"{path} has data for frames outside 1..{num_timesteps}")
+    order = np.argsort(frames, kind="stable")
+    bounds = np.searchsorted(frames[order], np.arange(1, num_timesteps + 2))
+    return [data[order[lo:hi]] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def box_ious(boxes1, boxes2):
+    """IoU matrix between two sets of (x, y, w, h) boxes, with TrackEval's handling of empty boxes."""
+    b1 = boxes1.copy()
+    b2 = boxes2.copy()
+    b1[:, 2:4] += b1[:, 0:2]
+    b2[:, 2:4] += b2[:, 0:2]
+    min_ = np.minimum(b1[:, np.newaxis, :], b2[np.newaxis, :, :])
+    max_ = np.maximum(b1[:, np.newaxis, :], b2[np.newaxis, :, :])
+    intersection = np.maximum(min_[..., 2] - max_[..., 0], 0) * np.maximum(min_[..., 3] - max_[..., 1], 0)
+    area1 = (b1[..., 2] - b1[..., 0]) * (b1[..., 3] - b1[..., 1])
+    area2 = (b2[..., 2] - b2[..., 0]) * (b2[..., 3] - b2[..., 1])
+    union = area1[:, np.newaxis] + area2[np.newaxis, :] - intersection
+    intersection[area1 <= 0 + EPS, :] = 0
+    intersection[:, area2 <= 0 + EPS] = 0
+    intersection[union <= 0 + EPS] = 0
+    union[union <= 0 + EPS] = 1
+    return intersection / union
+
+
+def _relabel(ids_per_t):
+    """Maps the IDs present in a sequence to 0..K-1. Returns (relabelled ids per timestep, K)."""
+    present = [ids for ids in ids_per_t if len(ids)]
+    if not present:
+        return ids_per_t, 0
+    unique = np.unique(np.concatenate(present))
+    return [np.searchsorted(unique, ids) for ids in ids_per_t], len(unique)
+
+
+def load_sequence(gt_file, tracker_file, num_timesteps, benchmark="DanceTrack"):
+    """Loads and preprocesses one (ground truth, tracker) sequence pair for the pedestrian class.
+
+    Mirrors TrackEval's MOTChallenge preprocessing: tracker boxes matched (IoU >= 0.5) to a GT
+    box of a distractor class are removed, then GT boxes that are zero-marked or not pedestrians
+    are dropped, and IDs are relabelled to be contiguous.
+    """
+    gt = split_frames(load_mot_file(gt_file), num_timesteps, gt_file)
+    tr = split_frames(load_mot_file(tracker_file), num_timesteps, tracker_file)
+    distractors = MOT20_DISTRACTOR_CLASSES if benchmark == "MOT20" else DISTRACTOR_CLASSES
+
+    gt_ids, tracker_ids, similarity_scores = [], [], []
+    num_gt_dets = num_tracker_dets = 0
+    for t, (gt_t, tr_t) in enumerate(zip(gt, tr)):
+        g_ids = gt_t[:, 1].astype(int)
+        g_zero_marked = gt_t[:, 6].astype(int)
+        g_classes = gt_t[:, 7].astype(int)
+        t_ids = tr_t[:, 1].astype(int)
+        # TrackEval: evaluation is only valid for the pedestrian class
+        if tr_t.shape[1] >= 8 and len(tr_t) and tr_t[:, 7].astype(int).max() > PEDESTRIAN_CLASS:
+            raise ValueError(f"{tracker_file} contains non-pedestrian class ids (frame {t + 1}); "
+                             "evaluation is only valid for the pedestrian class")
+        similarity = box_ious(gt_t[:, 2:6], tr_t[:, 2:6])
+
+        # Remove tracker dets matched to distractor-class GT
+        if len(g_ids) and len(t_ids):
+            if len(np.setdiff1d(np.unique(g_classes), VALID_CLASSES)):
+                raise ValueError(f"{gt_file} contains invalid class ids")
+            matching_scores = similarity.copy()
+            matching_scores[matching_scores < 0.5 - EPS] = 0
+            match_rows, match_cols = linear_sum_assignment(-matching_scores)
+            matched = matching_scores[match_rows, match_cols] > 0 + EPS
+            match_rows, match_cols = match_rows[matched], match_cols[matched]
+            to_remove = match_cols[np.isin(g_classes[match_rows], distractors)]
+            t_ids = np.delete(t_ids, to_remove)
+            similarity = np.delete(similarity, to_remove, axis=1)
+
+        keep = (g_zero_marked != 0) & (g_classes == PEDESTRIAN_CLASS)
+        gt_ids.append(g_ids[keep])
+        tracker_ids.append(t_ids)
+        similarity_scores.append(similarity[keep])
+        num_gt_dets += int(keep.sum())
+        num_tracker_dets += len(t_ids)
+
+    gt_ids, num_gt_ids = _relabel(gt_ids)
+    tracker_ids, num_tracker_ids = _relabel(tracker_ids)
+    for t, (g_ids, t_ids) in enumerate(zip(gt_ids, tracker_ids)):
+        if len(np.unique(t_ids)) != len(t_ids):
+            raise ValueError(f"{tracker_file}: tracker predicts the same ID more than once in frame {t + 1}")
+        if len(np.unique(g_ids)) != len(g_ids):
+            raise ValueError(f"{gt_file}: ground truth has the same ID more than once in frame {t + 1}")
+
+    return {"gt_ids": gt_ids, "tracker_ids": tracker_ids, "similarity_scores": similarity_scores,
+            "num_gt_ids": num_gt_ids, "num_tracker_ids": num_tracker_ids,
+            "num_gt_dets": num_gt_dets, "num_tracker_dets": num_tracker_dets, "num_timesteps": num_timesteps}
+
+
+# --- HOTA ---
+
+def _hota_final(res):
+    res['DetRe'] = res['HOTA_TP'] / np.maximum(1, res['HOTA_TP'] + res['HOTA_FN'])
+    res['DetPr'] = res['HOTA_TP'] / np.maximum(1, res['HOTA_TP'] + res['HOTA_FP'])
+    res['DetA'] = res['HOTA_TP'] / np.maximum(1, res['HOTA_TP'] + res['HOTA_FN'] + res['HOTA_FP'])
+    res['HOTA'] = np.sqrt(res['DetA'] * res['AssA'])
+    res['OWTA'] = np.sqrt(res['DetRe'] * res['AssA'])
+    res['HOTA(0)'] = res['HOTA'][0]
+    res['LocA(0)'] = res['LocA'][0]
+    res['HOTALocA(0)'] = res['HOTA(0)'] * res['LocA(0)']
+    return res
+
+
+def eval_hota(data):
+    """HOTA, DetA, AssA, LocA (and their components) at every alpha for one sequence."""
+    n_alpha = len(ALPHAS)
+    res = {f: np.zeros(n_alpha) for f in ['HOTA_TP', 'HOTA_FN', 'HOTA_FP', 'AssA', 'AssRe', 'AssPr', 'LocA']}
+    if data['num_tracker_dets'] == 0 or data['num_gt_dets'] == 0:
+        if data['num_tracker_dets'] == 0:
+            res['HOTA_FN'][:] = data['num_gt_dets']
+        else:
+            res['HOTA_FP'][:] = data['num_tracker_dets']
+        res['LocA'][:] = 1.0
+        return _hota_final(res)
+
+    # Global alignment between IDs, weighted by the per-frame normalised similarity
+    potential_matches_count = np.zeros((data['num_gt_ids'], data['num_tracker_ids']))
+    gt_id_count = np.zeros((data['num_gt_ids'], 1))
+    tracker_id_count = np.zeros((1, data['num_tracker_ids']))
+    for gt_ids_t, tracker_ids_t, similarity in zip(data['gt_ids'], data['tracker_ids'], data['similarity_scores']):
+        sim_iou_denom = similarity.sum(0)[np.newaxis, :] + similarity.sum(1)[:, np.newaxis] - similarity
+        sim_iou = np.zeros_like(similarity)
+        sim_iou_mask = sim_iou_denom > 0 + EPS
+        sim_iou[sim_iou_mask] = similarity[sim_iou_mask] / sim_iou_denom[sim_iou_mask]
+        potential_matches_count[gt_ids_t[:, np.newaxis], tracker_ids_t[np.newaxis, :]] += sim_iou
+        gt_id_count[gt_ids_t] += 1
+        tracker_id_count[0, tracker_ids_t] += 1
+    global_alignment_score = potential_matches_count / (gt_id_count + tracker_id_count - potential_matches_count)
+
+    # Per-frame matching; each match is kept for the alphas its similarity reaches, so matches are
+    # stored once with the number of alphas they count for instead of one dense matrix per alpha
+    match_gt, match_tr, match_levels = [], [], []
+    for gt_ids_t, tracker_ids_t, similarity in zip(data['gt_ids'], data['tracker_ids'], data['similarity_scores']):
+        if len(gt_ids_t) == 0 or len(tracker_ids_t) == 0:
+            res['HOTA_FP'] += len(tracker_ids_t)
+            res['HOTA_FN'] += len(gt_ids_t)
+            continue
+        score_mat = global_alignment_score[gt_ids_t[:, np.newaxis], tracker_ids_t[np.newaxis, :]] * similarity
+        match_rows, match_cols = linear_sum_assignment(-score_mat)
+        sims = similarity[match_rows, match_cols]
+        matched = sims[np.newaxis, :] >= ALPHAS[:, np.newaxis] - EPS  # (alphas, matches)
+        num_matches = matched.sum(1)
+        res['HOTA_TP'] += num_matches
+        res['HOTA_FN'] += len(gt_ids_t) - num_matches
+        res['HOTA_FP'] += len(tracker_ids_t) - num_matches
+        res['LocA'] += (matched * sims[np.newaxis, :]).sum(1)
+        levels = matched.sum(0)
+        hit = levels > 0
+        match_gt.append(gt_ids_t[match_rows[hit]])
+        match_tr.append(tracker_ids_t[match_cols[hit]])
+        match_levels.append(levels[hit])
+
+    # Association scores from the (gt id, tracker id) match counts at each alpha
+    if match_gt:
+        pairs = np.concatenate(match_gt) * data['num_tracker_ids'] + np.concatenate(match_tr)
+        unique_pairs, inverse = np.unique(pairs, return_inverse=True)
+        hist = np.zeros((len(unique_pairs), n_alpha + 1))
+        np.add.at(hist, (inverse, np.concatenate(match_levels)), 1)
+        matches_count = np.cumsum(hist[:, ::-1], axis=1)[:, ::-1][:, 1:]  # (pairs, alphas)
+        gt_count = gt_id_count[unique_pairs // data['num_tracker_ids'], 0][:, np.newaxis]
+        tr_count = tracker_id_count[0, unique_pairs % data['num_tracker_ids']][:, np.newaxis]
+        tp = np.maximum(1, res['HOTA_TP'])
+        res['AssA'] = np.sum(matches_count * matches_count / np.maximum(1, gt_count + tr_count - matches_count), 0) / tp
+        res['AssRe'] = np.sum(matches_count * matches_count / np.maximum(1, gt_count), 0) / tp
+        res['AssPr'] = np.sum(matches_count * matches_count / np.maximum(1, tr_count), 0) / tp
+
+    res['LocA'] = np.maximum(1e-10, res['LocA']) / np.maximum(1e-10, res['HOTA_TP'])
+    return _hota_final(res)
+
+
+def combine_hota(all_res):
+    res = {f: sum(r[f] for r in all_res) for f in ['HOTA_TP', 'HOTA_FN', 'HOTA_FP']}
+    for f in ['AssRe', 'AssPr', 'AssA']:
+        res[f] = sum(r[f] * r['HOTA_TP'] for r in all_res) / np.maximum(1.0, res['HOTA_TP'])
+    loca_weighted_sum = sum(r['LocA'] * r['HOTA_TP'] for r in all_res)
+    res['LocA'] = np.maximum(1e-10, loca_weighted_sum) / np.maximum(1e-10, res['HOTA_TP'])
+    return _hota_final(res)
+
+
+# --- CLEAR (MOTA, IDSW) ---
+
+def _clear_final(res):
+    num_gt_ids = res['MT'] + res['ML'] + res['PT']
+    res['MTR'] = res['MT'] / np.maximum(1.0, num_gt_ids)
+    res['MLR'] = res['ML'] / np.maximum(1.0, num_gt_ids)
+    res['PTR'] = res['PT'] / np.maximum(1.0, num_gt_ids)
+    res['CLR_Re'] = res['CLR_TP'] / np.maximum(1.0, res['CLR_TP'] + res['CLR_FN'])
+    res['CLR_Pr'] = res['CLR_TP'] / np.maximum(1.0, res['CLR_TP'] + res['CLR_FP'])
+    res['MODA'] = (res['CLR_TP'] - res['CLR_FP']) / np.maximum(1.0, res['CLR_TP'] + res['CLR_FN'])
+    res['MOTA'] = (res['CLR_TP'] - res['CLR_FP'] - res['IDSW']) / np.maximum(1.0, res['CLR_TP'] + res['CLR_FN'])
+    res['MOTP'] = res['MOTP_sum'] / np.maximum(1.0, res['CLR_TP'])
+    res['sMOTA'] = (res['MOTP_sum'] - res['CLR_FP'] - res['IDSW']) / np.maximum(1.0, res['CLR_TP'] + res['CLR_FN'])
+    return res
+
+
+def eval_clear(data):
+    """CLEAR MOT metrics (MOTA, MOTP, IDSW, MT/PT/ML, Frag) for one sequence."""
+    res = {f: 0 for f in ['CLR_TP', 'CLR_FN', 'CLR_FP', 'IDSW', 'MT', 'PT', 'ML', 'Frag', 'CLR_Frames', 'MOTP_sum',
+                          'MOTA', 'MOTP', 'MODA', 'CLR_Re', 'CLR_Pr', 'MTR', 'PTR', 'MLR', 'sMOTA']}
+    # Empty sequences keep zero rates (as in TrackEval); only their counts enter the combined result
+    if data['num_tracker_dets'] == 0:
+        res['CLR_FN'] = data['num_gt_dets']
+        res['ML'] = data['num_gt_ids']
+        res['MLR'] = 1.0
+        return res
+    if data['num_gt_dets'] == 0:
+        res['CLR_FP'] = data['num_tracker_dets']
+        res['MLR'] = 1.0
+        return res
+
+    num_gt_ids = data['num_gt_ids']
+    gt_id_count = np.zeros(num_gt_ids)
+    gt_matched_count = np.zeros(num_gt_ids)
+    gt_frag_count = np.zeros(num_gt_ids)
+    # IDSWs are scored against the last tracker id a gt was matched to, but matching only prefers
+    # continuing the tracker id of the previous timestep
+    prev_tracker_id = np.nan * np.zeros(num_gt_ids)
+    prev_timestep_tracker_id = np.nan * np.zeros(num_gt_ids)
+
+    for gt_ids_t, tracker_ids_t, similarity in zip(data['gt_ids'], data['tracker_ids'], data['similarity_scores']):
+        if len(gt_ids_t) == 0:
+            res['CLR_FP'] += len(tracker_ids_t)
+            continue
+        if len(tracker_ids_t) == 0:
+            res['CLR_FN'] += len(gt_ids_t)
+            gt_id_count[gt_ids_t] += 1
+            continue
+
+        score_mat = (tracker_ids_t[np.newaxis, :] == prev_timestep_tracker_id[gt_ids_t[:, np.newaxis]])
+        score_mat = 1000 * score_mat + similarity
+        score_mat[similarity < MATCH_THRESHOLD - EPS] = 0
+        match_rows, match_cols = linear_sum_assignment(-score_mat)
+        matched = score_mat[match_rows, match_cols] > 0 + EPS
+        match_rows, match_cols = match_rows[matched], match_cols[matched]
+        matched_gt_ids = gt_ids_t[match_rows]
+        matched_tracker_ids = tracker_ids_t[match_cols]
+
+        prev_matched_tracker_ids = prev_tracker_id[matched_gt_ids]
+        is_idsw = np.logical_not(np.isnan(prev_matched_tracker_ids)) & \
+            np.not_equal(matched_tracker_ids, prev_matched_tracker_ids)
+        res['IDSW'] += int(np.sum(is_idsw))
+
+        gt_id_count[gt_ids_t] += 1
+        gt_matched_count[matched_gt_ids] += 1
+        not_previously_tracked = np.isnan(prev_timestep_tracker_id)
+        prev_tracker_id[matched_gt_ids] = matched_tracker_ids
+        prev_timestep_tracker_id[:] = np.nan
+        prev_timestep_tracker_id[matched_gt_ids] = matched_tracker_ids
+        currently_tracked = np.logical_not(np.isnan(prev_timestep_tracker_id))
+        gt_frag_count += np.logical_and(not_previously_tracked, currently_tracked)
+
+        num_matches = len(matched_gt_ids)
+        res['CLR_TP'] += num_matches
+        res['CLR_FN'] += len(gt_ids_t) - num_matches
+        res['CLR_FP'] += len(tracker_ids_t) - num_matches
+        if num_matches > 0:
+            res['MOTP_sum'] += float(np.sum(similarity[match_rows, match_cols]))
+
+    tracked_ratio = gt_matched_count[gt_id_count > 0] / gt_id_count[gt_id_count > 0]
+    res['MT'] = int(np.sum(np.greater(tracked_ratio, 0.8)))
+    res['PT'] = int(np.sum(np.greater_equal(tracked_ratio, 0.2))) - res['MT']
+    res['ML'] = num_gt_ids - res['MT'] - res['PT']
+    res['Frag'] = int(np.sum(np.subtract(gt_frag_count[gt_frag_count > 0], 1)))
+    res['CLR_Frames'] = data['num_timesteps']
+    return _clear_final(res)
+
+
+def combine_clear(all_res):
+    fields = ['CLR_TP', 'CLR_FN', 'CLR_FP', 'IDSW', 'MT', 'PT', 'ML', 'Frag', 'CLR_Frames', 'MOTP_sum']
+    return _clear_final({f: sum(r[f] for r in all_res) for f in fields})
+
+
+# --- IDENTITY (IDF1) ---
+
+def _identity_final(res):
+    res['IDR'] = res['IDTP'] / np.maximum(1.0, res['IDTP'] + res['IDFN'])
+    res['IDP'] = res['IDTP'] / np.maximum(1.0, res['IDTP'] + res['IDFP'])
+    res['IDF1'] = res['IDTP'] / np.maximum(1.0, res['IDTP'] + 0.5 * res['IDFP'] + 0.5 * res['IDFN'])
+    return res
+
+
+def eval_identity(data):
+    """IDF1, IDR, IDP from the optimal one-to-one assignment of gt and tracker IDs."""
+    res = {'IDTP': 0, 'IDFN': 0, 'IDFP': 0}
+    if data['num_tracker_dets'] == 0:
+        res['IDFN'] = data['num_gt_dets']
+        return _identity_final(res)
+    if data['num_gt_dets'] == 0:
+        res['IDFP'] = data['num_tracker_dets']
+        return _identity_final(res)
+
+    num_gt_ids, num_tracker_ids = data['num_gt_ids'], data['num_tracker_ids']
+    potential_matches_count = np.zeros((num_gt_ids, num_tracker_ids))
+    gt_id_count = np.zeros(num_gt_ids)
+    tracker_id_count = np.zeros(num_tracker_ids)
+    for gt_ids_t, tracker_ids_t, similarity in zip(data['gt_ids'], data['tracker_ids'], data['similarity_scores']):
+        match_idx_gt, match_idx_tracker = np.nonzero(np.greater_equal(similarity, MATCH_THRESHOLD))
+        potential_matches_count[gt_ids_t[match_idx_gt], tracker_ids_t[match_idx_tracker]] += 1
+        gt_id_count[gt_ids_t] += 1
+        tracker_id_count[tracker_ids_t] += 1
+
+    # Cost of every gt/tracker pairing, plus dummy rows/columns for leaving an ID unmatched
+    n = num_gt_ids + num_tracker_ids
+    fp_mat = np.zeros((n, n))
+    fn_mat = np.zeros((n, n))
+    fp_mat[num_gt_ids:, :num_tracker_ids] = 1e10
+    fn_mat[:num_gt_ids, num_tracker_ids:] = 1e10
+    fn_mat[:num_gt_ids, :num_tracker_ids] = gt_id_count[:, np.newaxis]
+    fn_mat[np.arange(num_gt_ids), num_tracker_ids + np.arange(num_gt_ids)] = gt_id_count
+    fp_mat[:num_gt_ids, :num_tracker_ids] = tracker_id_count[np.newaxis, :]
+    fp_mat[num_gt_ids + np.arange(num_tracker_ids), np.arange(num_tracker_ids)] = tracker_id_count
+    fn_mat[:num_gt_ids, :num_tracker_ids] -= potential_matches_count
+    fp_mat[:num_gt_ids, :num_tracker_ids] -= potential_matches_count
+
+    match_rows, match_cols = linear_sum_assignment(fn_mat + fp_mat)
+    res['IDFN'] = int(fn_mat[match_rows, match_cols].sum())
+    res['IDFP'] = int(fp_mat[match_rows, match_cols].sum())
+    res['IDTP'] = int(gt_id_count.sum()) - res['IDFN']
+    return _identity_final(res)
+
+
+def combine_identity(all_res):
+    return _identity_final({f: sum(r[f] for r in all_res) for f in ['IDTP', 'IDFN', 'IDFP']})
+
+
+# --- SEQUENCE / BENCHMARK EVALUATION ---
+
+def eval_counts(data):
+    return {'Dets': data['num_tracker_dets'], 'GT_Dets': data['num_gt_dets'],
+            'IDs': data['num_tracker_ids'], 'GT_IDs': data['num_gt_ids']}
+
+
+def combine_counts(all_res):
+    return {f: sum(r[f] for r in all_res) for f in ['Dets', 'GT_Dets', 'IDs', 'GT_IDs']}
+
+
+def summary_fields(res):
+    """Flattens one result ({'HOTA': ..., 'CLEAR': ..., 'Identity': ..., 'Count': ...}) into TrackEval's
+    summary columns: alpha-array metrics averaged over alphas, rates in percent, counts as ints."""
+    out = OrderedDict()
+    hota, clear, identity, count = res['HOTA'], res['CLEAR'], res['Identity'], res['Count']
+    merged = {**{k: v for k, v in hota.items() if k not in ('HOTA_TP', 'HOTA_FN', 'HOTA_FP')},
+              **clear, **identity, **count}
+    for field in SUMMARY_ORDER:
+        value = merged[field]
+        if field in INTEGER_FIELDS:
+            out[field] = int(value)
+        else:
+            out[field] = 100 * float(np.mean(value))
+    return out
+
+
+def evaluate_sequence(gt_file, tracker_file, num_timesteps, benchmark="DanceTrack"):
+    """All metrics of one tracker on one sequence (raw, un-averaged results)."""
+    data = load_sequence(gt_file, tracker_file, num_timesteps, benchmark)
+    return {'HOTA': eval_hota(data), 'CLEAR': eval_clear(data),
+            'Identity': eval_identity(data), 'Count': eval_counts(data)}
+
+
+def combine_sequences(seq_results):
+    """Dataset-level results from a list of per-sequence results (TrackEval's COMBINED_SEQ)."""
+    return {'HOTA': combine_hota([r['HOTA'] for r in seq_results]),
+            'CLEAR': combine_clear([r['CLEAR'] for r in seq_results]),
+            'Identity': combine_identity([r['Identity'] for r in seq_results]),
+            'Count': combine_counts([r['Count'] for r in seq_results])}
+
+
+def read_seqmap(seqmap_file):
+    """Sequence names listed in a TrackEval seqmap (first line is the 'name' header)."""
+    with open(seqmap_file, 'r') as f:
+        lines = [line.strip() for line in f if line.strip()]
+    return lines[1:] if lines and lines[0] == "name" else lines
+
+
+def num_timesteps(gt_folder, seq):
+    """Sequence length from seqinfo.ini, else the last annotated frame (read from the dataset index)."""
+    return dataset_index.open_sequence(gt_folder, seq).num_timesteps
+
+
+def write_summary(summary, out_dir, cls="pedestrian"):
+    """Writes <out_dir>/<cls>_summary.txt in TrackEval's format (read by evaluate_results.read_summary)."""
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, f"{cls}_summary.txt"), 'w') as f:
+        f.write(" ".join(summary.keys()) + "\n")
+        f.write(" ".join(str(v) if isinstance(v, int) else "{0:1.5g}".format(v) for v in summary.values()) + "\n")
+
+
+def _eval_job(job):
+    return evaluate_sequence(*job)
+
+
+def evaluate_units(jobs, workers=1):
+    """Evaluates independent units ({key: (gt_file, tracker_file, num_timesteps, benchmark)}).
+
+    With `workers` > 1 the units are spread over a process pool. Each unit only produces its own
+    per-sequence sufficient statistics, so results do not depend on scheduling. Returns {key: result}.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return {key: evaluate_sequence(*job) for key, job in jobs.items()}
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_eval_job, job): key for key, job in jobs.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def evaluate(gt_folder, trackers_folder, trackers, sequences, benchmark="DanceTrack",
+             tracker_sub_folder="data", write_summaries=True, workers=1, cache=None):
+    """Evaluates trackers on a set of sequences.
+
+    Expects TrackEval's layout: <gt_folder>/<seq>/gt/gt.txt and
+    <trackers_folder>/<tracker>/<tracker_sub_folder>/<seq>.txt. Returns a DataFrame with one row
+    per (tracker, seq) plus a 'COMBINED' row per tracker, in TrackEval's summary units. With
+    `write_summaries` each tracker's combined row is also written to
+    <trackers_folder>/<tracker>/pedestrian_summary.txt.
+
+    (tracker, sequence) units run on `workers` processes. Combined metrics are always merged
+    from the per-sequence results in sorted sequence order, so they are bit-identical to a
+    serial run.
+
+    GT is read from the binary dataset index (rebuilt automatically when gt.txt or seqinfo.ini
+    change), so workers only memory-load pre-sorted arrays instead of parsing text.
+
+    With an eval_cache.EvalCache, units whose GT and result files are unchanged are read from
+    the cache and only the rest are evaluated; the combined rows are re-aggregated either way.
+    """
+    sequences = sorted(sequences)
+    index = dataset_index.build_index(gt_folder, sequences)
+    gt_files = {seq: index[seq].gt_file or os.path.join(gt_folder, seq, "gt", "gt.txt") for seq in sequences}
+    jobs = {(tracker, seq): (gt_files[seq],
+                             os.path.join(trackers_folder, tracker, tracker_sub_folder, f"{seq}.txt"),
+                             index[seq].num_timesteps, benchmark)
+            for tracker in trackers for seq in sequences}
+    results, keys = {}, {}
+    if cache is not None:
+        for unit, job in jobs.items():
+            keys[unit] = cache.key(job[0], job[1], job[2], job[3], EVALUATOR_VERSION)
+            cached = cache.get(keys[unit])
+            if cached is not None:
+                results[unit] = cached
+
+    computed = evaluate_units({unit: job for unit, job in jobs.items() if unit not in results}, workers)
+    if cache is not None:
+        for unit, res in computed.items():
+            cache.put(keys[unit], res)
+        cache.evict()
+    results.update(computed)
+
+    rows = []
+    for tracker in trackers:
+        seq_results = [results[(tracker, seq)] for seq in sequences]
+        for seq, res in zip(sequences, seq_results):
+            rows.append({"tracker": tracker, "seq": seq, **summary_fields(res)})
+
+        combined = summary_fields(combine_sequences(seq_results))
+        rows.append({"tracker": tracker, "seq": "COMBINED", **combined})
+        if write_summaries:
+            write_summary(combined, os.path.join(trackers_folder, tracker))
+    return pd.DataFrame(rows)
+
+
+def scaling_report(gt_folder, trackers_folder, trackers, sequences, worker_counts, benchmark="DanceTrack"):
+    """Times a full evaluation at several worker counts.
+
+    Returns one row per worker count with wall time, units per second, speedup and parallel
+    efficiency relative to the first count, and whether the metrics equal the first run's.
+    """
+    rows, reference = [], None
+    n_units = len(trackers) * len(sequences)
+    for workers in worker_counts:
+        t0 = time.perf_counter()
+        table = evaluate(gt_folder, trackers_folder, trackers, sequences, benchmark,
+                         write_summaries=False, workers=workers)
+        seconds = time.perf_counter() - t0
+        if reference is None:
+            reference = (table, seconds, workers)
+        base_seconds, base_workers = reference[1], reference[2]
+        speedup = base_seconds / seconds if seconds > 0 else None
+        rows.append({"workers": workers, "units": n_units, "seconds": round(seconds, 3),
+                     "units_per_s": round(n_units / seconds, 2) if seconds > 0 else None,
+                     "speedup": round(speedup, 2) if speedup else None,
+                     "efficiency": round(speedup * base_workers / workers, 2) if speedup else None,
+                     "identical": bool(table.equals(reference[0]))})
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="In-process HOTA / CLEAR / Identity evaluation of MOTChallenge files.")
+    parser.add_argument("--gt-folder", default="dancetrack_val_local")
+    parser.add_argument("--trackers-folder", default="tracker_results")
+    parser.add_argument("--trackers", nargs="+", default=["DeepOCSORT", "StrongSORT", "ByteTrack"])
+    parser.add_argument("--seqmap", default=None, help="Seqmap file (default: <trackers-folder>/seqmaps/dancetrack-val.txt)")
+    parser.add_argument("--benchmark", default="DanceTrack", help="MOT20 enables its extra distractor class.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes for (tracker, sequence) units.")
+    args = parser.parse_args()
+
+    seqmap = args.seqmap or os.path.join(args.trackers_folder, "seqmaps", "dancetrack-val.txt")
+    table = evaluate(args.gt_folder, args.trackers_folder, args.trackers, read_seqmap(seqmap), args.benchmark,
+                     workers=args.workers)
+    combined = table[table["seq"] == "COMBINED"]
+    print(combined[["tracker", "HOTA", "DetA", "AssA", "LocA", "IDF1", "MOTA", "IDSW"]].to_string(index=False))
@@ -1,33 +1,42 @@
 import os
+import argparse
+import multiprocessing
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import cv2
 import numpy as np
 import torch
-from pathlib import Path
 from tqdm import tqdm
 from ultralytics import YOLO
 
-# --- DYNAMIC IMPORTS ---
-try:
-    from boxmot.trackers.bytetrack.bytetrack import ByteTrack
-    from boxmot.trackers.deepocsort.deepocsort import DeepOcSort
-    from boxmot.trackers.strongsort.strongsort import StrongSort
-except ImportError:
-    print("⚠️ Standard import failed. Trying fallback to top-level boxmot...")
-    try:
-        from boxmot import ByteTrack, DeepOcSort, StrongSort
-    except ImportError:
-         print("❌ Critical: Could not import trackers from boxmot. Ensure 'boxmot' is installed.")
-         sys.exit(1)
+import dataset_config
+import detection_cache
+import mem_monitor
+import mot_io
+import reid_cache
+import results_store
+import run_manifest
+import tracker_registry
+from frame_source import PrefetchFrameSource, open_source
+from stage_timer import STAGES, StageTimer, build_report, load_result, save_result, timed, write_report
 
 # --- CONFIGURATION ---
+DATASETS = dataset_config.load_datasets()  # per-dataset data, results and run folders (configs/datasets.json)
 # NOTE: Ensure you have downloaded the DanceTrack validation set into 'dancetrack_val_local'
-VAL_DATA_DIR = "dancetrack_val_local"
-OUTPUT_DIR = "runs"
+VAL_DATA_DIR = DATASETS[dataset_config.DEFAULT_DATASET]["data"]
+OUTPUT_DIR = DATASETS[dataset_config.DEFAULT_DATASET]["runs"]
+RESULTS_DIR = mot_io.RESULTS_DIR  # MOTChallenge files, one per (tracker, sequence)
 MODEL_WEIGHTS = "yolov8x.pt"
-REID_WEIGHTS = Path("weights/osnet_x0_25_msmt17.pt")
+DET_CONF = 0.3
+DET_CLASSES = [0]  # pedestrians only
+DET_BATCH_SIZE = 16  # frames per detector call on GPU
+DET_BATCH_SIZE_CPU = 4  # smaller batches keep CPU-only runs within RAM
+REID_WEIGHTS = tracker_registry.REID_WEIGHTS
+REID_HALF = True  # same precision as the appearance trackers in configs/trackers.json
+SOURCE_RESULTS_DIR = os.path.join(OUTPUT_DIR, "source_results")  # MOT files of --source runs
 
 def download_weights():
     """Downloads ReID weights if they don't exist."""
@@ -41,93 +50,493 @@ def download_weights():
             print(f"❌ Failed to download weights: {e}")
             sys.exit(1)
 
-def run_benchmark():
-    """Runs the tracking benchmark."""
+def boxmot_version():
+    try:
+        from importlib.metadata import version
+        return version("boxmot")
+    except Exception:
+        return "unknown"
+
+def unit_hash(spec, det_key, legacy_labels, reid_name=None):
+    """Config hash of one (tracker, sequence) unit: tracker setup, detections, embeddings and output format."""
+    return run_manifest.config_hash({
+        "class": spec["class"], "args": spec["args"], "det_key": det_key, "reid": reid_name,
+        "legacy_labels": legacy_labels, "boxmot": boxmot_version(),
+    })
+
+def unit_paths(spec, seq, legacy_labels, run_dir=OUTPUT_DIR, results_dir=RESULTS_DIR):
+    """(final output, in-progress output, checkpoint) paths of one (tracker, sequence) unit."""
+    if legacy_labels:
+        labels_dir = os.path.join(run_dir, spec["name"], seq, "labels")
+        return labels_dir, labels_dir, os.path.join(run_dir, spec["name"], seq, "checkpoint.pkl")
+    out_file = mot_io.result_file(spec["folder"], seq, results_dir)
+    return out_file, out_file + ".partial", out_file + ".ckpt"
+
+def timing_path(run_dir, unit_name, seq):
+    return os.path.join(run_dir, "timing", unit_name, f"{seq}.json")
+
+def write_labels(save_dir, frame_name, tracks, img):
+    """Legacy layout: one normalized YOLO-style label file per frame (converted by stitch_results.py)."""
+    out_file = os.path.join(save_dir, f"{frame_name.replace('.jpg', '.txt')}")
+    h, w, _ = img.shape
+    with open(out_file, 'w') as f:
+        for t in tracks:
+            # Format: x1, y1, x2, y2, id, conf, class_id, ...
+            x1, y1, x2, y2 = t[:4]
+            tid = int(t[4])
+            
+            # Normalize for intermediate storage (optional, but consistent with your previous flow)
+            x_c = ((x1 + x2)/2) / w
+            y_c = ((y1 + y2)/2) / h
+            w_n = (x2 - x1) / w
+            h_n = (y2 - y1) / h
+            
+            # class_id is usually 0 for pedestrian
+            f.write(f"0 {x_c:.6f} {y_c:.6f} {w_n:.6f} {h_n:.6f} {tid}\n")
+
+def tracking_loop(tracker, source, timer, get_dets, write, on_frame=None):
+    """Decode -> detect -> track -> write loop of one tracker over one frame source.
+
+    `get_dets(pos, fid, img)` returns the frame's (detections, embeddings or None), `write(fid, frame_name, tracks, img)`
+    stores non-empty tracker output and `on_frame(n_frames, fid)` runs after each frame.
+    Returns the number of frames processed.
+    """
+    n_frames = 0
+    frames = iter(source)
+    while True:
+        t0 = time.perf_counter()
+        item = next(frames, None)
+        if item is None:
+            break
+        timer.add("decode", time.perf_counter() - t0)
+        fid, frame_name, img = item
+
+        dets, embs = get_dets(n_frames, fid, img)
+
+        # Update Tracker
+        # BoxMOT trackers expect dets and the image (plus precomputed ReID embeddings if cached)
+        with timer.time("track"):
+            if embs is None:
+                tracks = tracker.update(dets, img)
+            else:
+                tracks = tracker.update(dets, img, embs=embs)
+
+        # Save Results
+        with timer.time("write"):
+            if len(tracks) > 0:
+                write(fid, frame_name, tracks, img)
+
+        timer.end_frame()
+        n_frames += 1
+        if on_frame is not None:
+            on_frame(n_frames, fid)
+    return n_frames
+
+def track_sequence(spec, seq, det_key, device, legacy_labels=False, chash=None,
+                   run_dir=OUTPUT_DIR, results_dir=RESULTS_DIR, reid_name=None, profile_memory=False,
+                   data_dir=VAL_DATA_DIR):
+    """Runs one tracker over one sequence (a folder of `data_dir`) from cached detections.
+
+    Tracks are streamed into one MOTChallenge file per (tracker, sequence) under `results_dir`, in
+    absolute pixels with the tracker's confidences. With `legacy_labels` the old per-frame
+    <run_dir>/<tracker>/<seq>/labels/ layout is written instead.
+
+    Output goes to an in-progress file that only replaces the final one when the sequence is done.
+    The tracker state is checkpointed every CHECKPOINT_EVERY frames, so an interrupted sequence
+    with the same config hash resumes after the last checkpoint instead of from frame 1.
+
+    Returns the sequence's per-frame stage timings: decode (time spent waiting on the prefetch
+    queue), detect (detector latency recorded when the cache was built), embed (ReID feature
+    extraction inside the tracker), track (the rest of the tracker update) and write.
+
+    With `reid_name`, appearance trackers are fed embeddings from the ReID cache instead of
+    cropping and embedding the image themselves; embed is then the latency recorded when the
+    cache was built, and the tracker's own ReID model stays idle on the CPU.
+
+    With `profile_memory` the result also carries a "memory" summary (mem_monitor.MemoryMonitor):
+    RSS sampled after every frame with the live tracks and detections, from before the tracker is built.
+    """
+    monitor = mem_monitor.MemoryMonitor(device) if profile_memory else None
+    use_embs = reid_name is not None and tracker_registry.uses_reid(spec)
+
+    # Re-initialize tracker for each sequence to clear memory/state
+    tracker = tracker_registry.build_tracker(spec, "cpu" if use_embs else device)
+    tracker_registry.reset_track_ids()
+    
+    out_path, partial_path, ckpt_path = unit_paths(spec, seq, legacy_labels, run_dir, results_dir)
+    resume = None
+    if chash is not None and os.path.exists(partial_path):
+        resume = run_manifest.load_checkpoint(ckpt_path, tracker, chash)
+    last_frame, offset = resume if resume else (0, None)
+
+    if legacy_labels:
+        save_dir = out_path
+        if resume is None and os.path.exists(save_dir):
+            shutil.rmtree(save_dir)
+        os.makedirs(save_dir, exist_ok=True)
+    elif resume is not None:
+        # Drop rows written after the checkpoint, then keep appending
+        with open(partial_path, 'r+b') as f:
+            f.truncate(offset)
+        writer = mot_io.MOTWriter(partial_path, mode='a')
+    else:
+        writer = mot_io.MOTWriter(partial_path)
+    checkpointing = chash is not None
+    
+    seq_dets = detection_cache.load_detections(seq, det_key)
+    det_index = detection_cache.frame_index(seq_dets)
+    detect_times = detection_cache.load_detect_timing(seq, det_key)
+    if use_embs:
+        seq_embs = reid_cache.load_embeddings(seq, det_key, reid_name)
+        embed_times = reid_cache.load_embed_timing(seq, det_key, reid_name)
+        # Trackers drop low-confidence detections before embedding; filter first so rows stay aligned
+        det_thresh = getattr(tracker, "det_thresh", None)
+
+    # Appearance trackers expose their ReID backend as `tracker.model`
+    reid = getattr(tracker, "model", None)
+    has_reid = hasattr(reid, "get_features")
+    stages = [s for s in STAGES if (s != "detect" or detect_times is not None) and (s != "embed" or has_reid)]
+    timer = StageTimer(stages=stages, nested={} if use_embs else {"embed": "track"})
+    if has_reid and not use_embs:
+        reid.get_features = timed(reid.get_features, timer, "embed")
+    
+    # Replay cached detections (and embeddings)
+    n_dets = 0
+    def get_dets(pos, fid, img):
+        nonlocal n_dets
+        dets, embs = replay_dets(pos, fid)
+        n_dets = len(dets)
+        return dets, embs
+
+    def replay_dets(pos, fid):
+        pos += source.skipped
+        if detect_times is not None and pos < len(detect_times):
+            timer.add("detect", float(detect_times[pos]))
+        dets = detection_cache.frame_detections(seq_dets, det_index, fid)
+        if not use_embs:
+            return dets, None
+        if embed_times is not None and pos < len(embed_times):
+            timer.add("embed", float(embed_times[pos]))
+        embs = reid_cache.frame_embeddings(seq_embs, det_index, fid)
+        if det_thresh is not None:
+            keep = dets[:, 4] > det_thresh
+            dets, embs = dets[keep], embs[keep]
+        return dets, embs
+
+    def write(fid, frame_name, tracks, img):
+        if legacy_labels:
+            write_labels(save_dir, frame_name, tracks, img)
+        else:
+            writer.write_frame(fid, tracks)
+
+    def on_frame(n_frames, fid):
+        nonlocal checkpointing
+        if monitor is not None:
+            monitor.sample(n_frames, fid, mem_monitor.live_tracks(tracker), n_dets)
+        if checkpointing and n_frames % run_manifest.CHECKPOINT_EVERY == 0:
+            offset = None if legacy_labels else writer.offset()
+            if not run_manifest.save_checkpoint(ckpt_path, tracker, chash, fid, offset):
+                print(f"⚠️ {spec['name']} state cannot be checkpointed, {seq} will restart if interrupted.")
+                checkpointing = False
+
+    t_start = time.perf_counter()
+    # Frames are decoded on background threads while the tracker runs
+    source = PrefetchFrameSource(os.path.join(data_dir, seq), after_frame=last_frame)
+    n_frames = tracking_loop(tracker, source, timer, get_dets, write, on_frame)
+
+    if not legacy_labels:
+        writer.close()
+        os.replace(partial_path, out_path)
+        # Columnar copy for analysis; each unit writes its own partition
+        results_store.write_tracks(spec["folder"], chash, seq, out_path)
+    if os.path.exists(ckpt_path):
+        os.remove(ckpt_path)
+
+    result = {"tracker": spec["name"], "seq": seq, "frames": n_frames,
+              "wall_s": time.perf_counter() - t_start, "samples": timer.samples, "source": source.stats()}
+    if monitor is not None:
+        result["memory"] = monitor.summary()
+    return result
+
+def track_source(specs, uri, model, device, stride=1, scale=1.0, results_dir=SOURCE_RESULTS_DIR):
+    """Runs trackers with online detection over any frame source (frame directory, video file or
+    tcp:// stream), keeping every `stride`-th frame decoded at `scale` of full resolution.
+
+    The source is opened and decoded once and every frame, with its detections, is handed to each
+    tracker in turn, so a live stream (which can only be read once) feeds all trackers. Detection
+    and tracking work in decoded-frame coordinates; boxes are scaled back to full resolution when
+    written, so results stay comparable with ground truth. Returns one timing result per tracker,
+    like track_sequence, each with the shared decode and detect times and the source's decode
+    throughput; wall_s is the tracker's own pipeline time (decode + detect + its track and write).
+    """
+    source = open_source(uri, stride=stride, scale=scale)
+    name = (source.info or {}).get("name") or os.path.basename(os.path.normpath(uri))
+
+    tracker_registry.reset_track_ids()
+    units = []
+    for spec in specs:
+        tracker = tracker_registry.build_tracker(spec, device)
+        reid = getattr(tracker, "model", None)
+        has_reid = hasattr(reid, "get_features")
+        timer = StageTimer(stages=[s for s in STAGES if s != "embed" or has_reid], nested={"embed": "track"})
+        if has_reid:
+            reid.get_features = timed(reid.get_features, timer, "embed")
+        writer = mot_io.MOTWriter(mot_io.result_file(spec["folder"], name, results_dir))
+        units.append((spec, tracker, timer, writer))
+
+    n_frames = 0
+    frames = iter(source)
+    try:
+        while True:
+            t0 = time.perf_counter()
+            item = next(frames, None)
+            if item is None:
+                break
+            decode_s = time.perf_counter() - t0
+            fid, frame_name, img = item
+
+            t0 = time.perf_counter()
+            dets = detection_cache.predict_batch(model, [img], device, DET_CONF, DET_CLASSES)[0]
+            detect_s = time.perf_counter() - t0
+
+            for spec, tracker, timer, writer in units:
+                timer.add("decode", decode_s)
+                timer.add("detect", detect_s)
+                with timer.time("track"):
+                    tracks = tracker.update(dets.copy(), img)
+                with timer.time("write"):
+                    if len(tracks) > 0:
+                        if scale != 1.0:
+                            tracks = np.array(tracks, dtype=np.float64)
+                            tracks[:, :4] /= scale
+                        writer.write_frame(fid, tracks)
+                timer.end_frame()
+            n_frames += 1
+    finally:
+        for _, _, _, writer in units:
+            writer.close()
+
+    return [{"tracker": spec["name"], "seq": name, "frames": n_frames,
+             "wall_s": sum(sum(values) for values in timer.samples.values()),
+             "samples": timer.samples, "source": source.stats()}
+            for spec, _, timer, _ in units]
+
+def _init_worker():
+    """Keeps each worker on one core so N workers do not oversubscribe the CPU."""
+    torch.set_num_threads(1)
+    cv2.setNumThreads(1)
+
+def _run_job(job):
+    return track_sequence(*job)
+
+def run_parallel(jobs, workers, on_done):
+    """Shards (tracker, sequence) jobs across a process pool.
+
+    Every job writes only to its own output file, so the output does not depend on which worker
+    picks up which job or in what order they finish. `on_done` is called in this process for
+    each finished job.
+    """
+    print(f"🧵 Running {len(jobs)} (tracker, sequence) jobs on {workers} worker processes")
+    failed = []
+    # 'spawn' keeps CUDA usable inside the workers
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker) as pool:
+        futures = {pool.submit(_run_job, job): job for job in jobs}
+        with tqdm(total=len(jobs), desc="Tracking") as pbar:
+            for future in as_completed(futures):
+                unit_name, seq = futures[future][0]["name"], futures[future][1]
+                try:
+                    on_done(future.result())
+                except Exception as e:
+                    failed.append((unit_name, seq, e))
+                pbar.update(1)
+                pbar.set_postfix_str(f"{unit_name}/{seq}")
+
+    for unit_name, seq, e in sorted(failed, key=lambda x: x[:2]):
+        print(f"❌ Error for {unit_name} on {seq}: {e}")
+
+def prepare_detections(device, data_dir=VAL_DATA_DIR):
+    """Detection stage shared by benchmark runs and sweeps. Returns (det_key, sequences)."""
+    if not os.path.exists(data_dir):
+        print(f"❌ Dataset not found at {data_dir}. Please download the dataset (e.g. DanceTrack Val) and extract it there.")
+        sys.exit(1)
+
+    sequences = sorted([d for d in os.listdir(data_dir) if os.path.isdir(os.path.join(data_dir, d))])
+
+    # YOLO runs once per frame, every tracker replays from the cache. The model is only
+    # loaded if some sequence is missing from the cache.
+    key = detection_cache.cache_key(MODEL_WEIGHTS, DET_CONF, DET_CLASSES)
+    if not all(os.path.exists(detection_cache.cache_file(seq, key)) for seq in sequences):
+        model = YOLO(MODEL_WEIGHTS)
+        batch_size = DET_BATCH_SIZE if device != "cpu" else DET_BATCH_SIZE_CPU
+        key = detection_cache.build_cache(model, data_dir, sequences, device,
+                                          MODEL_WEIGHTS, DET_CONF, DET_CLASSES, batch_size)
+        del model
+
+    # Detections table of the results store, written once per cache entry
+    stored = {values["seq"] for _, values in results_store.partitions("detections", [("det_key", "==", key)])}
+    for seq in sequences:
+        if seq not in stored:
+            results_store.write_detections(key, seq, detection_cache.load_detections(seq, key))
+    return key, sequences
+
+def prepare_embeddings(det_key, sequences, device, data_dir=VAL_DATA_DIR):
+    """Embedding stage: ReID features for every cached detection, shared by all appearance
+    trackers. Returns the embedding cache name."""
+    return reid_cache.build_reid_cache(data_dir, sequences, det_key, device, REID_WEIGHTS, REID_HALF)
+
+def run_units(specs, sequences, det_key, device, workers=1, legacy_labels=False,
+              run_dir=OUTPUT_DIR, results_dir=RESULTS_DIR, reid_name=None, profile_memory=False,
+              data_dir=VAL_DATA_DIR):
+    """Runs every (tracker spec, sequence) unit that is not already up to date.
+
+    Completed units are recorded in <run_dir>/manifest.json. Returns the timing results of all
+    units, including the ones skipped because they were already done.
+    """
+    manifest = run_manifest.RunManifest(os.path.join(run_dir, run_manifest.MANIFEST_NAME))
+    hashes = {spec["name"]: unit_hash(spec, det_key, legacy_labels,
+                                      reid_name if tracker_registry.uses_reid(spec) else None)
+              for spec in specs}
+    jobs = []
+    for spec in specs:
+        for seq in sequences:
+            key = manifest.key(spec["name"], seq)
+            out_path = unit_paths(spec, seq, legacy_labels, run_dir, results_dir)[0]
+            if not manifest.is_complete(key, hashes[spec["name"]], out_path):
+                manifest.invalidate(key)
+                jobs.append((spec, seq, det_key, device, legacy_labels, hashes[spec["name"]], run_dir, results_dir,
+                             reid_name, profile_memory, data_dir))
+    print(f"📋 Manifest: {len(specs) * len(sequences) - len(jobs)} units up to date, {len(jobs)} to run")
+
+    specs_by_name = {spec["name"]: spec for spec in specs}
+    def on_done(result):
+        spec = specs_by_name[result["tracker"]]
+        save_result(result, timing_path(run_dir, spec["name"], result["seq"]))
+        manifest.mark_complete(manifest.key(spec["name"], result["seq"]), hashes[spec["name"]],
+                               unit_paths(spec, result["seq"], legacy_labels, run_dir, results_dir)[0],
+                               frames=result["frames"])
+
+    if workers > 1:
+        run_parallel(jobs, workers, on_done)
+    else:
+        for spec in specs:
+            spec_jobs = [job for job in jobs if job[0]["name"] == spec["name"]]
+            if not spec_jobs:
+                continue
+            print(f"\n🏎️  RUNNING: {spec['name'].upper()}")
+            for job in tqdm(spec_jobs, desc=f"Processing {spec['name']}"):
+                try:
+                    on_done(track_sequence(*job))
+                except Exception as e:
+                    print(f"❌ Error for {spec['name']} on {job[1]}: {e}")
+                    break
+
+    results = [load_result(timing_path(run_dir, spec["name"], seq)) for spec in specs for seq in sequences]
+    return [r for r in results if r is not None]
+
+def run_benchmark(workers=1, legacy_labels=False, fresh=False, config=tracker_registry.TRACKERS_FILE,
+                  reid=False, profile_memory=False, data_dir=VAL_DATA_DIR, results_dir=RESULTS_DIR,
+                  run_dir=OUTPUT_DIR, seqmap=mot_io.SEQMAP_NAME):
+    """Runs the tracking benchmark for every tracker in the registry config on the sequences of
+    `data_dir`, writing MOTChallenge results (and the `seqmap` file) under `results_dir` and the
+    manifest and timing report under `run_dir` (one set of folders per dataset, configs/datasets.json).
+
+    Completed (tracker, sequence, config-hash) units are recorded in <run_dir>/manifest.json and
+    skipped on the next run; `fresh` discards all previous results first. With `reid` the
+    appearance trackers replay embeddings from the ReID cache. With `profile_memory` every unit
+    that runs samples its memory and <run_dir>/memory.csv|json report peak and steady-state RSS per
+    (tracker, sequence), growth across sequences and a worker-count suggestion.
+    """
     device = 0 if torch.cuda.is_available() else "cpu"
     device_name = torch.cuda.get_device_name(0) if torch.cuda.is_available() else "CPU"
     print(f"🚀 Starting Benchmark on: {device_name}")
     
     # 1. Setup
     download_weights()
-    model = YOLO(MODEL_WEIGHTS)
+    specs = list(tracker_registry.load_registry(config).values())
     
-    if os.path.exists(OUTPUT_DIR): 
-        shutil.rmtree(OUTPUT_DIR)
+    if fresh and os.path.exists(run_dir): 
+        shutil.rmtree(run_dir)
 
-    if not os.path.exists(VAL_DATA_DIR):
-        print(f"❌ Dataset not found at {VAL_DATA_DIR}. Please download DanceTrack Val set and extract it there.")
-        sys.exit(1)
+    # Detection Stage
+    det_key, sequences = prepare_detections(device, data_dir)
+    reid_name = prepare_embeddings(det_key, sequences, device, data_dir) if reid else None
 
-    sequences = sorted([d for d in os.listdir(VAL_DATA_DIR) if os.path.isdir(os.path.join(VAL_DATA_DIR, d))])
-
-    # 2. Tracker Config
-    TRACKER_CONFIGS = {
-        "deepocsort": {
-            "class": DeepOcSort,
-            "args": {"reid_weights": REID_WEIGHTS, "device": device, "half": True, "det_thresh": 0.3}
-        },
-        "strongsort": {
-            "class": StrongSort,
-            "args": {"reid_weights": REID_WEIGHTS, "device": device, "half": True, "det_thresh": 0.3}
-        },
-        "bytetrack": {
-            "class": ByteTrack,
-            "args": {"track_thresh": 0.25, "match_thresh": 0.8, "track_buffer": 30, "frame_rate": 30}
-        }
-    }
+    # 2. Output Layout
+    if not legacy_labels:
+        if fresh:
+            for spec in specs:
+                tracker_dir = mot_io.tracker_dir(spec["folder"], results_dir)
+                if os.path.exists(tracker_dir):
+                    shutil.rmtree(tracker_dir)
+        mot_io.write_seqmap(data_dir, results_dir, name=seqmap)
 
     # 3. Execution Loop
-    for tracker_name, config in TRACKER_CONFIGS.items():
-        print(f"\n🏎️  RUNNING: {tracker_name.upper()}")
-        tracker_class = config["class"]
-        tracker_args = config["args"]
-        
-        for seq in tqdm(sequences, desc=f"Processing {tracker_name}"):
-            try:
-                # Re-initialize tracker for each sequence to clear memory/state
-                tracker = tracker_class(**tracker_args)
-            except Exception as e:
-                print(f"❌ Init Error for {tracker_name}: {e}")
-                break
-            
-            seq_path = os.path.join(VAL_DATA_DIR, seq, "img1")
-            save_dir = os.path.join(OUTPUT_DIR, tracker_name, seq, "labels")
-            os.makedirs(save_dir, exist_ok=True)
-            
-            frames = sorted([f for f in os.listdir(seq_path) if f.endswith('.jpg')])
-            
-            for frame_name in frames:
-                img_path = os.path.join(seq_path, frame_name)
-                img = cv2.imread(img_path)
-                
-                # Detect
-                results = model.predict(img, classes=[0], verbose=False, conf=0.3, device=device)[0]
-                dets = results.boxes.data.cpu().numpy() if results.boxes else np.empty((0, 6))
-                
-                # Update Tracker
-                # BoxMOT trackers expect dets and the image
-                tracks = tracker.update(dets, img)
-                
-                # Save Results in MOT format (for now storing normalized YOLO-like lines, will be stitched later)
-                if len(tracks) > 0:
-                    out_file = os.path.join(save_dir, f"{frame_name.replace('.jpg', '.txt')}")
-                    h, w, _ = img.shape
-                    with open(out_file, 'w') as f:
-                        for t in tracks:
-                            # Format: x1, y1, x2, y2, id, conf, class_id, ...
-                            x1, y1, x2, y2 = t[:4]
-                            tid = int(t[4])
-                            
-                            # Normalize for intermediate storage (optional, but consistent with your previous flow)
-                            x_c = ((x1 + x2)/2) / w
-                            y_c = ((y1 + y2)/2) / h
-                            w_n = (x2 - x1) / w
-                            h_n = (y2 - y1) / h
-                            
-                            # class_id is usually 0 for pedestrian
-                            f.write(f"0 {x_c:.6f} {y_c:.6f} {w_n:.6f} {h_n:.6f} {tid}\n")
+    results = run_units(specs, sequences, det_key, device, workers, legacy_labels, run_dir, results_dir,
+                        reid_name=reid_name, profile_memory=profile_memory, data_dir=data_dir)
+
+    # 4. Measured speed report (per-stage latency percentiles and FPS)
+    json_path, csv_path = write_report(build_report(results), run_dir)
+    print(f"⏱️  Timing report saved to {json_path} and {csv_path}")
+
+    # 5. Memory report (units profiled with --profile-memory, in this or earlier runs)
+    if profile_memory:
+        mem_path = mem_monitor.write_memory_report(results, run_dir)
+        print(f"🧠 Memory report saved to {mem_path}" if mem_path else
+              "🧠 No unit ran with memory profiling (all up to date); use --fresh to profile them.")
 
     print("\n✅✅ BENCHMARK COMPLETE!")
 
+def run_source(uri, stride=1, scale=1.0, config=tracker_registry.TRACKERS_FILE):
+    """Runs every tracker in the registry on one frame source with online YOLO detection and
+    reports per-stage latency plus the source's decode throughput. The source is decoded and
+    detected once and shared by all trackers."""
+    device = 0 if torch.cuda.is_available() else "cpu"
+    download_weights()
+    specs = list(tracker_registry.load_registry(config).values())
+    model = YOLO(MODEL_WEIGHTS)
+
+    print(f"\n🏎️  RUNNING: {', '.join(spec['name'].upper() for spec in specs)} on {uri}")
+    results = track_source(specs, uri, model, device, stride, scale)
+    src = results[0]["source"]
+    print(f"🎞️  {src['source']} decode: {src['frames']} frames at {src['decode_fps']} fps "
+          f"(stride {src['stride']}, scale {src['scale']}, {src['dropped']} dropped)")
+
+    json_path, csv_path = write_report(build_report(results), OUTPUT_DIR, name="timing_source")
+    print(f"⏱️  Timing report saved to {json_path} and {csv_path}")
+    print(f"✅ Tracks saved under {SOURCE_RESULTS_DIR}/")
+
 if __name__ == "__main__":
-    run_benchmark()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Runs DeepOCSORT, StrongSORT and ByteTrack on the validation set.")
+    parser.add_argument("--dataset", choices=sorted(DATASETS), default=dataset_config.DEFAULT_DATASET,
+                        help="Dataset whose folders from configs/datasets.json are used (data, results, runs).")
+    parser.add_argument("--data-dir", help="Sequence folders to track (default: the dataset's data folder).")
+    parser.add_argument("--results-dir", help="MOTChallenge results folder (default: the dataset's results folder).")
+    parser.add_argument("--run-dir", help="Manifest, checkpoints and timing report (default: the dataset's runs folder).")
+    parser.add_argument("--config", default=tracker_registry.TRACKERS_FILE,
+                        help="Tracker registry JSON (default: configs/trackers.json).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for (tracker, sequence) jobs. 1 runs everything in this process.")
+    parser.add_argument("--legacy-labels", action="store_true",
+                        help="Write the old per-frame YOLO-style label files to runs/ (convert with stitch_results.py).")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Delete previous results and the run manifest instead of resuming.")
+    parser.add_argument("--reid-cache", action="store_true",
+                        help="Compute ReID embeddings once per detection and feed them to DeepOCSORT and StrongSORT.")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Sample RSS (and CUDA allocator stats) per frame; writes runs/memory.csv|json.")
+    parser.add_argument("--source",
+                        help="Track a video file, frame directory or tcp://host:port stream with online detection "
+                             "instead of replaying the validation set.")
+    parser.add_argument("--stride", type=int, default=1, help="--source: keep every N-th frame.")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="--source: decode resolution relative to the input (0.5, 0.25 and 0.125 decode JPEGs directly).")
+    args = parser.parse_args()
+    if args.source:
+        run_source(args.source, stride=args.stride, scale=args.scale, config=args.config)
+        sys.exit(0)
+    dataset = DATASETS[args.dataset]
+    run_benchmark(workers=args.workers, legacy_labels=args.legacy_labels, fresh=args.fresh, config=args.config,
+                  reid=args.reid_cache, profile_memory=args.profile_memory,
+                  data_dir=args.data_dir or dataset["data"], results_dir=args.results_dir or dataset["results"],
+                  run_dir=args.run_dir or dataset["runs"], seqmap=dataset["seqmap"])
@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURATION ---
+SAMPLE_EVERY = 1  # frames between memory samples
+STEADY_FRACTION = 0.5  # steady state: the last half of a sequence's samples
+LEAK_MB_PER_UNIT = 2.0  # median memory a tracker leaves behind per finished sequence before it is flagged
+NODE_HEADROOM = 0.8  # fraction of node RAM the worker-count suggestion may plan for
+MB = 1024 * 1024
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# Identifies this process across runs (PIDs are reused): units are only compared within one process
+PROCESS_ID = f"{os.getpid()}-{time.time_ns()}"
+
+
+def rss_bytes():
+    """Current resident set size of this process (None if it cannot be read on this platform)."""
+    try:
+        with open("/proc/self/statm", 'rb') as f:  # Linux: a few microseconds per read
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def process_peak_bytes():
+    """Peak RSS of this process so far, as tracked by the kernel (between samples too)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KB on Linux
+
+
+def node_memory_bytes():
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def live_tracks(tracker, output=()):
+    """Tracks held in a BoxMOT tracker's state (active and lost), falling back to its output rows."""
+    for attr in ("active_tracks", "trackers"):  # OC-SORT family
+        tracks = getattr(tracker, attr, None)
+        if isinstance(tracks, list):
+            return len(tracks)
+    if hasattr(tracker, "tracked_stracks"):  # ByteTrack
+        return len(tracker.tracked_stracks) + len(getattr(tracker, "lost_stracks", []))
+    tracks = getattr(getattr(tracker, "tracker", None), "tracks", None)  # StrongSORT
+    if isinstance(tracks, list):
+        return len(tracks)
+    return len(output)
+
+
+class MemoryMonitor:
+    """Samples process RSS (and torch's CUDA allocator, if in use) once every `every` frames of one
+    (tracker, sequence) unit, together with the live tracks and detections of that frame."""
+
+    def __init__(self, device=None, every=SAMPLE_EVERY):
+        self.every = every
+        self.pid = os.getpid()
+        self.started = time.time()
+        self.start_rss = rss_bytes()
+        self.samples = []  # (frame, rss, torch_allocated, tracks, dets)
+        self._cuda = None
+        if device not in (None, "cpu"):
+            import torch
+            if torch.cuda.is_available():
+                self._cuda = torch.cuda
+                torch.cuda.reset_peak_memory_stats()
+
+    def sample(self, n_frames, fid, tracks, dets):
+        if n_frames % self.every:
+            return
+        allocated = self._cuda.memory_allocated() if self._cuda is not None else None
+        self.samples.append((fid, rss_bytes(), allocated, tracks, dets))
+
+    def summary(self):
+        """Start, peak and steady-state memory of the unit (MB) and the tracks/detections live at the peak."""
+        out = {"pid": self.pid, "process": PROCESS_ID, "started": self.started,
+               "start_rss_mb": _mb(self.start_rss), "process_peak_mb": _mb(process_peak_bytes())}
+        if self._cuda is not None:
+            out["torch_peak_mb"] = _mb(self._cuda.max_memory_allocated())
+            out["torch_reserved_peak_mb"] = _mb(self._cuda.max_memory_reserved())
+        samples = [s for s in self.samples if s[1] is not None]
+        if not samples:
+            return out
+        frames, rss, _, tracks, dets = (np.array(col, dtype=np.float64) for col in zip(*samples))
+        peak = int(np.argmax(rss))
+        steady = slice(int(len(rss) * (1 - STEADY_FRACTION)), None)
+        slope = np.polyfit(frames[steady], rss[steady], 1)[0] if len(rss[steady]) >= 2 else 0.0
+        out.update({
+            "samples": len(rss),
+            "peak_rss_mb": _mb(rss[peak]), "peak_frame": int(frames[peak]),
+            "tracks_at_peak": int(tracks[peak]), "dets_at_peak": int(dets[peak]),
+            "steady_rss_mb": _mb(np.median(rss[steady])), "end_rss_mb": _mb(rss[-1]),
+            "growth_mb_per_1k_frames": round(float(slope) * 1000 / MB, 2),
+            "max_tracks": int(tracks.max()),
+        })
+        return out
+
+
+def _mb(value):
+    return None if value is None else round(float(value) / MB, 1)
+
+
+def build_memory_report(results):
+    """Per-unit memory rows and a per-tracker summary from timing results carrying a "memory" summary.
+
+    Memory a unit leaves behind is the RSS difference to the start of the next unit in the same
+    process (its tracker has been dropped by then); units are matched by PROCESS_ID, so results kept
+    from earlier runs are never differenced against a later process that reused the PID. Each process's first unit also pays one-off
+    loading, so a tracker is flagged as leaking when the median of its later units exceeds
+    LEAK_MB_PER_UNIT.
+    """
+    units = pd.DataFrame([{"tracker": r["tracker"], "seq": r["seq"], "frames": r["frames"], **r["memory"]}
+                          for r in results if r.get("memory")])
+    if units.empty:
+        return units, units
+    if "process" not in units:
+        units["process"] = None
+    # Units without a process id cannot be matched to their neighbours: each forms its own group
+    units["process"] = units["process"].fillna(units["pid"].astype(str) + "@" + units["started"].astype(str))
+    units = units.sort_values(["process", "started"]).reset_index(drop=True)
+    units["retained_mb"] = (units.groupby("process")["start_rss_mb"].shift(-1) - units["start_rss_mb"]).round(1)
+    units["first_in_process"] = units.groupby("process").cumcount() == 0
+
+    trackers = []
+    for tracker, group in units.groupby("tracker"):
+        later = group.loc[~group["first_in_process"], "retained_mb"].dropna()
+        at_peak = group.loc[group["peak_rss_mb"].idxmax()] if group["peak_rss_mb"].notna().any() else group.iloc[0]
+        retained = round(float(later.median()), 1) if len(later) else None
+        trackers.append({
+            "tracker": tracker, "units": len(group),
+            "peak_rss_mb": at_peak.get("peak_rss_mb"), "peak_seq": at_peak["seq"],
+            "tracks_at_peak": at_peak.get("tracks_at_peak"), "dets_at_peak": at_peak.get("dets_at_peak"),
+            "steady_rss_mb": round(float(group["steady_rss_mb"].median()), 1) if "steady_rss_mb" in group else None,
+            "process_peak_mb": group["process_peak_mb"].max(),
+            "retained_mb_per_unit": retained,
+            "leak_suspected": retained is not None and retained > LEAK_MB_PER_UNIT,
+        })
+    trackers = pd.DataFrame(trackers)
+    units = units.drop(columns=["first_in_process"]).sort_values(["tracker", "seq"])
+    return units, trackers
+
+
+def workers_per_node(peak_mb, node_bytes=None):
+    """Worker processes that fit in NODE_HEADROOM of the node's RAM at a given per-process peak."""
+    node_bytes = node_bytes or node_memory_bytes()
+    if not node_bytes or peak_mb is None or pd.isna(peak_mb) or peak_mb <= 0:
+        return None
+    return max(1, int(node_bytes * NODE_HEADROOM / (peak_mb * MB)))
+
+
+def write_memory_report(results, out_dir, name="memory"):
+    """Writes <out_dir>/<name>.csv (per unit) and <out_dir>/<name>.json (units and per-tracker
+    summary) and prints the summary. Returns the JSON path, or None without profiled units."""
+    units, trackers = build_memory_report(results)
+    if units.empty:
+        return None
+    os.makedirs(out_dir, exist_ok=True)
+    units.to_csv(os.path.join(out_dir, f"{name}.csv"), index=False)
+    worst = trackers["process_peak_mb"].max()
+    summary = {"units": units.to_dict("records"), "trackers": trackers.to_dict("records"),
+               "node_mb": _mb(node_memory_bytes()), "workers_per_node": workers_per_node(worst)}
+    json_path = os.path.join(out_dir, f"{name}.json")
+    with open(json_path, 'w') as f:
+        json.dump(summary, f, indent=2, default=lambda v: v.item() if hasattr(v, "item") else str(v))
+
+    for row in trackers.to_dict("records"):
+        flag = "  ⚠️ memory grows across sequences (possible leak)" if row["leak_suspected"] else ""
+        print(f"🧠 {row['tracker']:<12} peak {row['peak_rss_mb']} MB on {row['peak_seq']} "
+              f"({row['tracks_at_peak']} tracks, {row['dets_at_peak']} dets live), steady {row['steady_rss_mb']} MB, "
+              f"retained/sequence {row['retained_mb_per_unit']} MB{flag}")
+    if summary["workers_per_node"]:
+        print(f"🧠 Process peak {worst} MB: about {summary['workers_per_node']} workers fit in "
+              f"{NODE_HEADROOM:.0%} of this node's {summary['node_mb']:.0f} MB")
+    return json_path
@@ -0,0 +1,85 @@
+import os
+
+# --- CONFIGURATION ---
+RESULTS_DIR = "tracker_results"
+SEQMAP_NAME = "dancetrack-val.txt"
+
+
+def paper_name(tracker_folder):
+    """Maps run folder names to paper names (e.g. 'deepocsort' -> 'DeepOCSORT'), None if unknown."""
+    if "deepoc" in tracker_folder: return "DeepOCSORT"
+    if "strong" in tracker_folder: return "StrongSORT"
+    if "byte" in tracker_folder: return "ByteTrack"
+    return None
+
+
+def tracker_dir(folder, results_dir=RESULTS_DIR):
+    """Folder holding one tracker's MOTChallenge files: <results_dir>/<folder>/data"""
+    return os.path.join(results_dir, folder, "data")
+
+
+def result_file(folder, seq, results_dir=RESULTS_DIR):
+    """MOTChallenge result file of one (tracker, sequence)."""
+    return os.path.join(tracker_dir(folder, results_dir), f"{seq}.txt")
+
+
+class MOTWriter:
+    """Buffered writer for one MOTChallenge result file.
+
+    Rows are kept in memory and written in blocks of roughly `flush_rows` lines. Blocks always end on a
+    frame boundary, so an interrupted run leaves only complete frames on disk.
+    Format: <frame>, <id>, <bb_left>, <bb_top>, <bb_width>, <bb_height>, <conf>, <x>, <y>, <z>
+    """
+
+    def __init__(self, path, flush_rows=4096, mode='w'):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.flush_rows = flush_rows
+        self.rows = 0
+        self._buffer = []
+        self._f = open(path, mode)
+
+    def write_frame(self, frame_id, tracks):
+        """Appends one frame of tracker output ([x1, y1, x2, y2, id, conf, ...] rows, absolute pixels)."""
+        for t in tracks:
+            x1, y1, x2, y2 = t[:4]
+            self._buffer.append(f"{frame_id},{int(t[4])},{x1:.2f},{y1:.2f},{x2 - x1:.2f},{y2 - y1:.2f},{t[5]:.4f},-1,-1,-1\n")
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+
+    def offset(self):
+        """Flushes and returns the byte size written so far (a whole-frame boundary)."""
+        self.flush()
+        return self._f.tell()
+
+    def flush(self):
+        if self._buffer:
+            self._f.writelines(self._buffer)
+            self.rows += len(self._buffer)
+            self._buffer = []
+        self._f.flush()
+
+    def close(self):
+        if not self._f.closed:
+            self.flush()
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_seqmap(dataset_dir, results_dir=RESULTS_DIR, name=SEQMAP_NAME, sequences=None):
+    """Writes the TrackEval seqmap listing every sequence folder of the dataset (or just
+    `sequences`). Returns its path."""
+    os.makedirs(os.path.join(results_dir, "seqmaps"), exist_ok=True)
+    seqmap_path = os.path.join(results_dir, "seqmaps", name)
+    if sequences is None:
+        sequences = [seq for seq in os.listdir(dataset_dir) if os.path.isdir(os.path.join(dataset_dir, seq))]
+    with open(seqmap_path, "w") as f:
+        f.write("name\n")
+        for seq in sorted(sequences):
+            f.write(f"{seq}\n")
+    return seqmap_path
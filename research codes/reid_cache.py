@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import numpy as np
+from tqdm import tqdm
+
+import detection_cache
+from frame_source import PrefetchFrameSource
+
+# Embeddings live next to the detections they were computed from:
+# det_cache/<det key>/reid_<weights>[_fp16]/<seq>.npy, row i = embedding of detection row i
+
+
+def reid_name(weights, half):
+    """Folder name of one ReID setup inside a detection cache entry."""
+    stem = os.path.splitext(os.path.basename(str(weights)))[0]
+    return f"reid_{stem}_fp16" if half else f"reid_{stem}"
+
+
+def reid_file(seq, det_key, name, cache_dir=detection_cache.DET_CACHE_DIR):
+    """Path of the cached embedding array for one sequence."""
+    return os.path.join(cache_dir, det_key, name, f"{seq}.npy")
+
+
+def timing_file(seq, det_key, name, cache_dir=detection_cache.DET_CACHE_DIR):
+    """Path of the per-frame embedding latency recorded when the cache entry was built."""
+    return os.path.join(cache_dir, det_key, name, f"{seq}.timing.npy")
+
+
+def load_reid_model(weights, device, half):
+    """The same ReID backend the appearance trackers build internally."""
+    from boxmot.appearance.reid_auto_backend import ReidAutoBackend
+    rab = ReidAutoBackend(weights=weights, device=device, half=half)
+    return rab.get_backend() if hasattr(rab, "get_backend") else rab.model
+
+
+def embed_sequence(model, seq_dir, dets):
+    """Computes one embedding per cached detection row of a sequence.
+
+    Returns an (N, D) float32 array aligned row-for-row with `dets` and the per-frame embedding
+    latency in seconds.
+    """
+    index = detection_cache.frame_index(dets)
+    embs = None
+    timings = []
+    for fid, _, img in PrefetchFrameSource(seq_dir):
+        if fid not in index:
+            timings.append(0.0)
+            continue
+        lo, hi = index[fid]
+        t0 = time.perf_counter()
+        feats = np.asarray(model.get_features(np.array(dets[lo:hi, 1:5]), img), dtype=np.float32)
+        timings.append(time.perf_counter() - t0)
+        if embs is None:
+            embs = np.zeros((len(dets), feats.shape[1]), dtype=np.float32)
+        embs[lo:hi] = feats
+
+    if embs is None:
+        embs = np.zeros((len(dets), 0), dtype=np.float32)
+    return embs, np.asarray(timings, dtype=np.float32)
+
+
+def build_reid_cache(data_dir, sequences, det_key, device, weights, half=True,
+                     cache_dir=detection_cache.DET_CACHE_DIR):
+    """Embedding stage: computes ReID features once per cached detection and stores them on disk.
+
+    Sequences already embedded for this (detections, weights, precision) setup are skipped and the
+    ReID model is only loaded if something is missing. Returns the embedding cache name.
+    """
+    # CPU-only replays reuse embeddings computed on the GPU instead of recomputing them in fp32
+    if half and device == "cpu":
+        gpu_name = reid_name(weights, True)
+        if all(os.path.exists(reid_file(seq, det_key, gpu_name, cache_dir)) for seq in sequences):
+            return gpu_name
+
+    half = bool(half) and device != "cpu"
+    name = reid_name(weights, half)
+    out_dir = os.path.join(cache_dir, det_key, name)
+    os.makedirs(out_dir, exist_ok=True)
+
+    meta_path = os.path.join(out_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        with open(meta_path, 'w') as f:
+            json.dump({"weights": str(weights), "half": half, "det_key": det_key}, f, indent=2)
+
+    todo = [seq for seq in sequences if not os.path.exists(reid_file(seq, det_key, name, cache_dir))]
+    print(f"🧬 Embedding cache '{det_key}/{name}': {len(sequences) - len(todo)} cached, {len(todo)} to embed")
+    if not todo:
+        return name
+
+    model = load_reid_model(weights, device, half)
+    for seq in tqdm(todo, desc="Embedding"):
+        dets = detection_cache.load_detections(seq, det_key, cache_dir)
+        embs, timings = embed_sequence(model, os.path.join(data_dir, seq), dets)
+        np.save(timing_file(seq, det_key, name, cache_dir), timings)
+
+        # Write to a temp file first so an interrupted run never leaves a truncated cache entry
+        out_path = reid_file(seq, det_key, name, cache_dir)
+        tmp_path = out_path + ".tmp.npy"
+        np.save(tmp_path, embs)
+        os.replace(tmp_path, out_path)
+
+    del model
+    return name
+
+
+def load_embeddings(seq, det_key, name, cache_dir=detection_cache.DET_CACHE_DIR):
+    """Memory-maps the cached embeddings of one sequence."""
+    return np.load(reid_file(seq, det_key, name, cache_dir), mmap_mode='r')
+
+
+def load_embed_timing(seq, det_key, name, cache_dir=detection_cache.DET_CACHE_DIR):
+    """Per-frame embedding latency (seconds) of one sequence, or None if it was never recorded."""
+    path = timing_file(seq, det_key, name, cache_dir)
+    return np.load(path) if os.path.exists(path) else None
+
+
+def frame_embeddings(embs, index, fid):
+    """Returns the embeddings of one frame's detections, in detection order."""
+    if fid not in index:
+        return np.empty((0, embs.shape[1]), dtype=np.float32)
+    lo, hi = index[fid]
+    return np.array(embs[lo:hi], dtype=np.float32)
@@ -0,0 +1,238 @@
+import os
+import time
+import shutil
+import argparse
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import cv2
+import numpy as np
+
+import mot_io
+from dataset_index import parse_mot_text
+from eval_cache import file_digest
+from frame_source import ImageDirSource, read_seqinfo
+from run_manifest import config_hash
+
+# --- CONFIGURATION ---
+DATA_DIR = "dancetrack_val_local"
+RENDERS_DIR = "renders"
+RENDER_SCALE = 0.5  # JPEGs are decoded directly at this scale
+MAX_FRAMES = 1200  # frame window rendered per video
+TRAIL_LENGTH = 30  # frames of box-centre history drawn per ID (0 disables trails)
+DEFAULT_FPS = 20
+# H.264 through an ffmpeg executable (PATH or the imageio-ffmpeg package) when available, else the
+# browser-playable codecs of this OpenCV build, in order of preference
+FFMPEG_ARGS = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "26", "-pix_fmt", "yuv420p", "-movflags", "+faststart"]
+CODECS = (("mp4", "avc1"), ("webm", "VP80"))
+RENDER_VERSION = 1  # bump when the drawing changes
+
+
+def id_color(track_id):
+    """Stable, well-separated BGR colour per track ID (golden-ratio hue steps)."""
+    hue = int((track_id * 0.618033988749895 % 1.0) * 180)
+    hsv = np.uint8([[[hue, 220, 255]]])
+    return tuple(int(c) for c in cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)[0, 0])
+
+
+def load_tracks(mot_file):
+    """MOT rows sorted by frame, plus the sorted frame column for searchsorted lookups."""
+    rows = parse_mot_text(mot_file)
+    frames = rows[:, 0].astype(np.int64) if len(rows) else np.zeros(0, dtype=np.int64)
+    order = np.argsort(frames, kind="stable")
+    return rows[order], frames[order]
+
+
+def render_key(seq, tracker, mot_file, settings):
+    """Cache key of one render: (sequence, tracker, hash of its result file and the render settings)."""
+    return config_hash({"seq": seq, "tracker": tracker, "tracks": file_digest(mot_file),
+                        "version": RENDER_VERSION, **settings})
+
+
+def find_render(seq, tracker, key, renders_dir=RENDERS_DIR):
+    """Path of a finished render with this key, or None."""
+    for ext, _ in CODECS:
+        path = os.path.join(renders_dir, seq, tracker, f"{key}.{ext}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def find_ffmpeg():
+    """Path of an ffmpeg executable, or None."""
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return None
+
+
+class FFmpegWriter:
+    """Streams BGR frames into an ffmpeg process (same write/release interface as cv2.VideoWriter)."""
+
+    def __init__(self, ffmpeg, path, fps, size):
+        cmd = [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "bgr24",
+               "-s", f"{size[0]}x{size[1]}", "-r", str(fps), "-i", "-", *FFMPEG_ARGS, path]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def write(self, img):
+        self._proc.stdin.write(np.ascontiguousarray(img).tobytes())
+
+    def release(self):
+        if self._proc.stdin and not self._proc.stdin.closed:
+            self._proc.stdin.close()
+        if self._proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self._proc.returncode}")
+
+
+def open_writer(stem, fps, size):
+    """Video writer for `stem` with the fastest available encoder. Returns (writer, path)."""
+    ffmpeg = find_ffmpeg()
+    if ffmpeg:
+        path = f"{stem}.mp4"
+        return FFmpegWriter(ffmpeg, path, fps, size), path
+    for ext, fourcc in CODECS:
+        path = f"{stem}.{ext}"
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), fps, size)
+        if writer.isOpened():
+            return writer, path
+        writer.release()
+        if os.path.exists(path):
+            os.remove(path)
+    raise RuntimeError(f"None of the codecs {[c for _, c in CODECS]} is available in this OpenCV build")
+
+
+def draw_frame(img, rows, scale, trails, fid, trail_length, label):
+    """Draws boxes, IDs and trails of one frame's MOT rows onto `img` (in place)."""
+    for row in rows:
+        tid = int(row[1])
+        x, y, w, h = (row[2:6] * scale).astype(int)
+        color = id_color(tid)
+        cv2.rectangle(img, (x, y), (x + w, y + h), color, 2)
+        cv2.putText(img, str(tid), (x, max(y - 4, 10)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
+        if trail_length:
+            trail = trails.setdefault(tid, [deque(maxlen=trail_length), fid])
+            trail[0].append((x + w // 2, y + h))
+            trail[1] = fid
+
+    if trail_length:
+        for tid in [t for t, (_, last) in trails.items() if fid - last > trail_length]:
+            del trails[tid]
+        for tid, (points, _) in trails.items():
+            if len(points) > 1:
+                cv2.polylines(img, [np.array(points, dtype=np.int32)], False, id_color(tid), 2, cv2.LINE_AA)
+
+    cv2.rectangle(img, (0, 0), (min(img.shape[1], 320), 26), (0, 0, 0), -1)
+    cv2.putText(img, f"{label}  #{fid}", (6, 18), cv2.FONT_HERSHEY_SIMPLEX, 0.55, (255, 255, 255), 1, cv2.LINE_AA)
+
+
+def render_sequence(seq_dir, mot_file, out_stem, label, start=1, max_frames=MAX_FRAMES, scale=RENDER_SCALE,
+                    trail_length=TRAIL_LENGTH):
+    """Streams one tracker's overlay video for frames [start, start + max_frames) of a sequence.
+
+    Frames are decoded ahead on worker threads at `scale`, drawn and encoded one at a time, so memory
+    stays bounded whatever the window. The video is written to a hidden temp file (.<key>.partial.<ext>,
+    ignored by the dashboard) and moved into place when complete; a failed render leaves nothing behind.
+    Returns the output path, frames rendered and wall time.
+    """
+    t0 = time.perf_counter()
+    fps = read_seqinfo(seq_dir).get("frameRate", DEFAULT_FPS)
+    source = ImageDirSource(seq_dir, after_frame=start - 1, scale=scale)
+    source.frames = source.frames[:max_frames]
+    rows, frames = load_tracks(mot_file)
+
+    os.makedirs(os.path.dirname(out_stem), exist_ok=True)
+    tmp_stem = os.path.join(os.path.dirname(out_stem), f".{os.path.basename(out_stem)}.partial")
+    writer, path, final_path = None, None, None
+    trails = {}
+    n = 0
+    try:
+        for fid, _, img in source:
+            if writer is None:
+                writer, path = open_writer(tmp_stem, fps, (img.shape[1], img.shape[0]))
+            lo, hi = np.searchsorted(frames, fid, "left"), np.searchsorted(frames, fid, "right")
+            draw_frame(img, rows[lo:hi], scale, trails, fid, trail_length, label)
+            writer.write(img)
+            n += 1
+        if writer is not None:
+            writer.release()
+            writer = None
+            final_path = out_stem + os.path.splitext(path)[1]
+            os.replace(path, final_path)
+    finally:
+        if writer is not None:
+            writer.release()
+        if final_path is None and path is not None and os.path.exists(path):
+            os.remove(path)
+    if path is None:
+        raise RuntimeError(f"No frames found in {seq_dir} from frame {start}")
+
+    elapsed = time.perf_counter() - t0
+    return {"path": final_path, "frames": n, "seconds": round(elapsed, 3), "fps": round(n / elapsed, 1)}
+
+
+def _render_job(job):
+    return render_sequence(*job)
+
+
+def render_trackers(seq, trackers, results_dir=mot_io.RESULTS_DIR, data_dir=DATA_DIR, renders_dir=RENDERS_DIR,
+                    start=1, max_frames=MAX_FRAMES, scale=RENDER_SCALE, trail_length=TRAIL_LENGTH, workers=None,
+                    force=False):
+    """Renders one sequence for several trackers, one process per tracker, for side-by-side playback.
+
+    Renders are cached in <renders_dir>/<seq>/<tracker>/<key>.<ext>, keyed by the tracker's result file
+    contents and the render settings, so unchanged (sequence, tracker, config) renders are reused.
+    Returns {tracker: path}.
+    """
+    settings = {"start": start, "max_frames": max_frames, "scale": scale, "trail": trail_length}
+    paths, jobs = {}, {}
+    for tracker in trackers:
+        mot_file = mot_io.result_file(tracker, seq, results_dir)
+        if not os.path.exists(mot_file):
+            print(f"⚠️  {tracker}: no result file for {seq}, skipped")
+            continue
+        key = render_key(seq, tracker, mot_file, settings)
+        cached = None if force else find_render(seq, tracker, key, renders_dir)
+        if cached:
+            paths[tracker] = cached
+        else:
+            jobs[tracker] = (os.path.join(data_dir, seq), mot_file, os.path.join(renders_dir, seq, tracker, key),
+                             tracker, start, max_frames, scale, trail_length)
+    print(f"🎬 {seq}: {len(paths)} renders cached, {len(jobs)} to render")
+
+    workers = min(workers or len(jobs) or 1, len(jobs) or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_render_job, job): tracker for tracker, job in jobs.items()}
+            results = {futures[f]: f.result() for f in as_completed(futures)}
+    else:
+        results = {tracker: render_sequence(*job) for tracker, job in jobs.items()}
+
+    for tracker, res in sorted(results.items()):
+        print(f"   {tracker}: {res['frames']} frames in {res['seconds']:.1f}s ({res['fps']} fps) -> {res['path']}")
+        paths[tracker] = res["path"]
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Renders tracked-overlay videos of one sequence for the dashboard.")
+    parser.add_argument("seq", help="Sequence name, e.g. dancetrack0004")
+    parser.add_argument("--trackers", nargs="+", help="Result folders under --results-dir (default: all with this sequence).")
+    parser.add_argument("--results-dir", default=mot_io.RESULTS_DIR)
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--start", type=int, default=1, help="First frame of the window.")
+    parser.add_argument("--frames", type=int, default=MAX_FRAMES, help="Frames per render.")
+    parser.add_argument("--scale", type=float, default=RENDER_SCALE, help="Output resolution relative to the input.")
+    parser.add_argument("--trail", type=int, default=TRAIL_LENGTH, help="Trail length in frames (0: no trails).")
+    parser.add_argument("--workers", type=int, help="Parallel renders (default: one per tracker).")
+    parser.add_argument("--force", action="store_true", help="Re-render even if a cached render exists.")
+    args = parser.parse_args()
+
+    trackers = args.trackers or sorted(t for t in os.listdir(args.results_dir)
+                                       if os.path.exists(mot_io.result_file(t, args.seq, args.results_dir)))
+    render_trackers(args.seq, trackers, args.results_dir, args.data_dir, start=args.start, max_frames=args.frames,
+                    scale=args.scale, trail_length=args.trail, workers=args.workers, force=args.force)
+    print(f"✅ Renders saved under {RENDERS_DIR}/{args.seq}/")
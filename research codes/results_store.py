@@ -0,0 +1,288 @@
+import os
+import json
+import time
+import shutil
+import argparse
+from urllib.parse import quote, unquote
+import numpy as np
+import pandas as pd
+
+from dataset_index import parse_mot_text
+from run_manifest import MANIFEST_NAME, RunManifest
+
+# --- CONFIGURATION ---
+RESULTS_STORE_DIR = "results_store"
+RUN_MANIFEST = os.path.join("runs", MANIFEST_NAME)  # main_benchmark.py's record of completed units
+
+# Table schemas: partition keys (folder levels) and column dtypes (one .npy file per column)
+# Layout: <store>/<table>/<key>=<value>/.../part-<ns>-<pid>/<column>.npy
+TABLES = {
+    "detections": {"partition": ("det_key", "seq"),
+                   "columns": {"frame": np.int32, "x1": np.float32, "y1": np.float32, "x2": np.float32,
+                               "y2": np.float32, "conf": np.float32, "cls": np.int16}},
+    "tracks": {"partition": ("tracker", "config", "seq"),
+               "columns": {"frame": np.int32, "id": np.int32, "x": np.float32, "y": np.float32,
+                           "w": np.float32, "h": np.float32, "conf": np.float32}},
+    "metrics": {"partition": ("tracker",),
+                "columns": None},  # seq plus every summary field of the evaluator
+}
+
+OPS = {"==": np.equal, "!=": np.not_equal, "<": np.less, "<=": np.less_equal,
+       ">": np.greater, ">=": np.greater_equal, "in": lambda a, b: np.isin(a, list(b))}
+
+
+def _partition_dir(table, partition, root):
+    keys = TABLES[table]["partition"]
+    missing = [k for k in keys if k not in partition]
+    if missing:
+        raise ValueError(f"{table}: missing partition keys {missing}")
+    return os.path.join(root, table, *(f"{k}={quote(str(partition[k]), safe='')}" for k in keys))
+
+
+def _current_part(partition_dir):
+    """Newest complete part of a partition (temp parts start with '.'), or None."""
+    parts = [d for d in os.listdir(partition_dir) if d.startswith("part-")] if os.path.isdir(partition_dir) else []
+    return os.path.join(partition_dir, max(parts)) if parts else None
+
+
+def write_partition(table, partition, columns, root=RESULTS_STORE_DIR):
+    """Writes (or replaces) one partition of a table from {column: array}.
+
+    The columns are written into a temp folder that is renamed into place once complete, so parallel
+    workers can each write their own partitions and readers never see a half-written one. Older parts of
+    the same partition are removed afterwards. Returns the part folder.
+    """
+    schema = TABLES[table]["columns"]
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"{table}: columns have different lengths {sorted(lengths)}")
+
+    partition_dir = _partition_dir(table, partition, root)
+    os.makedirs(partition_dir, exist_ok=True)
+    name = f"part-{time.time_ns():020d}-{os.getpid()}"
+    tmp_dir = os.path.join(partition_dir, f".tmp-{name}")
+    os.makedirs(tmp_dir)
+    for col, values in columns.items():
+        values = np.asarray(values, dtype=schema[col]) if schema else np.asarray(values)
+        np.save(os.path.join(tmp_dir, f"{col}.npy"), values, allow_pickle=False)
+    with open(os.path.join(tmp_dir, "meta.json"), 'w') as f:
+        json.dump({"columns": list(columns), "rows": lengths.pop() if lengths else 0}, f)
+
+    part_dir = os.path.join(partition_dir, name)
+    os.rename(tmp_dir, part_dir)
+    for old in os.listdir(partition_dir):
+        if old.startswith("part-") and old < name:
+            shutil.rmtree(os.path.join(partition_dir, old), ignore_errors=True)
+    return part_dir
+
+
+def _match(values, op, value):
+    if op not in OPS:
+        raise ValueError(f"Unknown filter operator '{op}' (use one of {', '.join(OPS)})")
+    return OPS[op](values, value)
+
+
+def _key_matches(value, op, target):
+    """Compares a partition value (a folder name) with a filter value of any type."""
+    sample = next(iter(target)) if op == "in" else target
+    cast = type(sample) if isinstance(sample, (int, float)) and not isinstance(sample, bool) else str
+    try:
+        value = cast(value)
+    except ValueError:
+        return False
+    target = [cast(t) for t in target] if op == "in" else cast(target)
+    return bool(_match(np.asarray(value), op, target))
+
+
+def partitions(table, filters=None, root=RESULTS_STORE_DIR):
+    """Current parts of a table as (part folder, {key: value}), pruned by filters on partition keys.
+
+    Partition values are compared as strings, or as numbers when the filter value is a number.
+    """
+    keys = TABLES[table]["partition"]
+    key_filters = [(c, op, v) for c, op, v in (filters or []) if c in keys]
+    found = []
+    dirs = [(os.path.join(root, table), {})]
+    for key in keys:
+        next_dirs = []
+        for path, values in dirs:
+            if not os.path.isdir(path):
+                continue
+            for d in sorted(os.listdir(path)):
+                if not d.startswith(f"{key}="):
+                    continue
+                value = unquote(d.split("=", 1)[1])
+                keep = all(_key_matches(value, op, v) for c, op, v in key_filters if c == key)
+                if keep:
+                    next_dirs.append((os.path.join(path, d), {**values, key: value}))
+        dirs = next_dirs
+    for path, values in dirs:
+        part = _current_part(path)
+        if part is not None:
+            found.append((part, values))
+    return found
+
+
+def scan(table, columns=None, filters=None, root=RESULTS_STORE_DIR):
+    """Yields ({partition key: value}, {column: array}) per matching partition.
+
+    Only the projected `columns` (default: all) and the columns used by `filters` are opened, each
+    memory-mapped. Filters are (column, op, value) tuples with op in ==, !=, <, <=, >, >=, in; filters
+    on partition keys skip whole partitions without opening them. Partitions where every row matches
+    are returned as the memory-mapped arrays themselves.
+    """
+    filters = filters or []
+    keys = TABLES[table]["partition"]
+    row_filters = [(c, op, v) for c, op, v in filters if c not in keys]
+    for part, values in partitions(table, filters, root):
+        with open(os.path.join(part, "meta.json"), 'r') as f:
+            available = json.load(f)["columns"]
+        wanted = [c for c in (columns or available) if c not in keys]
+        unknown = [c for c in wanted + [c for c, _, _ in row_filters] if c not in available]
+        if unknown:
+            raise KeyError(f"{table}: unknown columns {unknown}")
+
+        arrays = {c: np.load(os.path.join(part, f"{c}.npy"), mmap_mode='r')
+                  for c in set(wanted) | {c for c, _, _ in row_filters}}
+        if row_filters:
+            mask = np.logical_and.reduce([_match(arrays[c], op, v) for c, op, v in row_filters])
+            if not mask.all():
+                arrays = {c: a[mask] for c, a in arrays.items()}
+        yield values, {c: arrays[c] for c in wanted}
+
+
+def read_table(table, columns=None, filters=None, root=RESULTS_STORE_DIR):
+    """Reads matching rows of a table into one DataFrame (partition keys become columns)."""
+    keys = TABLES[table]["partition"]
+    frames = []
+    for values, arrays in scan(table, columns, filters, root):
+        df = pd.DataFrame(arrays)
+        for key in keys:
+            if columns is None or key in columns:
+                df[key] = values[key]
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=list(columns or keys))
+    return pd.concat(frames, ignore_index=True)
+
+
+# --- TABLE WRITERS ---
+
+def write_detections(det_key, seq, dets, root=RESULTS_STORE_DIR):
+    """Stores one cached detection array (frame, x1, y1, x2, y2, conf, class_id rows)."""
+    dets = np.asarray(dets).reshape(-1, 7)
+    cols = TABLES["detections"]["columns"]
+    return write_partition("detections", {"det_key": det_key, "seq": seq},
+                           {c: dets[:, i] for i, c in enumerate(cols)}, root)
+
+
+def write_tracks(tracker, config, seq, mot_file, root=RESULTS_STORE_DIR):
+    """Stores one MOTChallenge result file (frame, id, bb_left, bb_top, bb_width, bb_height, conf).
+    `tracker` is the results folder name, the same key the metrics table uses."""
+    rows = parse_mot_text(mot_file)
+    cols = TABLES["tracks"]["columns"]
+    return write_partition("tracks", {"tracker": tracker, "config": config or "none", "seq": seq},
+                           {c: rows[:, i] for i, c in enumerate(cols)}, root)
+
+
+def write_metrics(metrics, root=RESULTS_STORE_DIR):
+    """Stores per-sequence evaluation rows (a DataFrame with 'tracker', 'seq' and metric columns),
+    one partition per tracker."""
+    for tracker, rows in metrics.groupby("tracker", sort=True):
+        columns = {"seq": rows["seq"].to_numpy(dtype=str)}
+        for col in rows.columns:
+            if col not in ("tracker", "seq"):
+                columns[col] = pd.to_numeric(rows[col]).to_numpy()
+        write_partition("metrics", {"tracker": tracker}, columns, root)
+
+
+def manifest_configs(manifest_path=RUN_MANIFEST):
+    """{result file: config hash} of the units a run manifest records as complete and unchanged."""
+    manifest = RunManifest(manifest_path)
+    configs = {}
+    for key, entry in manifest.units.items():
+        output = entry.get("output")
+        if output and manifest.is_complete(key, entry["config_hash"], output):
+            configs[os.path.normpath(output)] = entry["config_hash"]
+    return configs
+
+
+def ingest(results_dir="tracker_results", det_cache_dir="det_cache", root=RESULTS_STORE_DIR,
+           manifest_path=RUN_MANIFEST):
+    """Imports existing outputs into the store: cached detections, MOTChallenge result files and
+    <results_dir>/metrics.csv. Result files get the config hash the run manifest recorded for
+    them (as written during a benchmark run), "none" if the manifest does not know them."""
+    counts = {"detections": 0, "tracks": 0, "metrics": 0}
+    if os.path.isdir(det_cache_dir):
+        for det_key in sorted(os.listdir(det_cache_dir)):
+            key_dir = os.path.join(det_cache_dir, det_key)
+            if not os.path.isdir(key_dir):
+                continue
+            for name in sorted(os.listdir(key_dir)):
+                if name.endswith(".npy") and not name.endswith((".timing.npy", ".tmp.npy")):
+                    write_detections(det_key, name[:-4], np.load(os.path.join(key_dir, name)), root)
+                    counts["detections"] += 1
+    if os.path.isdir(results_dir):
+        configs = manifest_configs(manifest_path)
+        for tracker in sorted(os.listdir(results_dir)):
+            data_dir = os.path.join(results_dir, tracker, "data")
+            if not os.path.isdir(data_dir):
+                continue
+            for name in sorted(os.listdir(data_dir)):
+                if name.endswith(".txt"):
+                    path = os.path.join(data_dir, name)
+                    write_tracks(tracker, configs.get(os.path.normpath(path)), name[:-4], path, root)
+                    counts["tracks"] += 1
+        metrics_path = os.path.join(results_dir, "metrics.csv")
+        if os.path.exists(metrics_path):
+            metrics = pd.read_csv(metrics_path)
+            write_metrics(metrics, root)
+            counts["metrics"] = metrics["tracker"].nunique()
+    return counts
+
+
+def parse_filter(text):
+    """'seq==dancetrack0004', 'frame>=100' or 'tracker in ByteTrack,StrongSORT' -> (column, op, value)."""
+    if " in " in text:
+        col, values = text.split(" in ", 1)
+        return col.strip(), "in", [_literal(v.strip()) for v in values.split(",")]
+    for op in ("==", "!=", "<=", ">=", "<", ">"):
+        if op in text:
+            col, value = text.split(op, 1)
+            return col.strip(), op, _literal(value.strip())
+    raise ValueError(f"Cannot parse filter '{text}'")
+
+
+def _literal(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Columnar store of detections, tracks and per-sequence metrics.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_ingest = sub.add_parser("ingest", help="Import det_cache/, tracker_results/ and metrics.csv into the store.")
+    p_ingest.add_argument("--results-dir", default="tracker_results")
+    p_ingest.add_argument("--det-cache-dir", default="det_cache")
+    p_ingest.add_argument("--manifest", default=RUN_MANIFEST, help="Run manifest with the results' config hashes.")
+    p_query = sub.add_parser("query", help="Print rows of a table.")
+    p_query.add_argument("table", choices=sorted(TABLES))
+    p_query.add_argument("--columns", help="Comma-separated columns to read (default: all).")
+    p_query.add_argument("--filter", action="append", default=[],
+                         help="e.g. 'seq==dancetrack0004', 'frame>=100', 'tracker in ByteTrack,StrongSORT'")
+    parser.add_argument("--root", default=RESULTS_STORE_DIR)
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        counts = ingest(args.results_dir, args.det_cache_dir, args.root, args.manifest)
+        print(f"✅ Stored {counts['detections']} detection, {counts['tracks']} track and "
+              f"{counts['metrics']} metrics partitions in '{args.root}/'")
+    else:
+        columns = args.columns.split(",") if args.columns else None
+        df = read_table(args.table, columns, [parse_filter(f) for f in args.filter], args.root)
+        print(df.to_string(index=False) if len(df) <= 50 else df)
+        print(f"📊 {len(df)} rows")
@@ -0,0 +1,132 @@
+import os
+import json
+import pickle
+import hashlib
+import importlib
+
+# --- CONFIGURATION ---
+MANIFEST_NAME = "manifest.json"
+CHECKPOINT_EVERY = 300  # frames between tracker-state checkpoints inside a sequence
+
+# Process-global track ID counters that are part of a tracker's state: (module, class, attribute)
+ID_COUNTERS = [
+    ("boxmot.trackers.bytetrack.basetrack", "BaseTrack", "_count"),
+    ("boxmot.trackers.deepocsort.deepocsort", "KalmanBoxTracker", "count"),
+]
+
+
+def config_hash(config):
+    """Short, stable hash of a JSON-serialisable config (Paths, devices etc. are stringified)."""
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+def checksum(path):
+    """SHA-256 of a file, or of every file (names and contents) below a directory."""
+    h = hashlib.sha256()
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                h.update(os.path.relpath(file_path, path).encode())
+                with open(file_path, 'rb') as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        h.update(block)
+    else:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+class RunManifest:
+    """Records every completed unit of work (e.g. one tracker on one sequence).
+
+    Each entry stores the config hash the unit was produced with and the checksum of its output.
+    A unit counts as done only if both still match, so config changes and deleted or edited
+    outputs are recomputed while everything else is skipped on a rerun.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.units = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.units = json.load(f).get("units", {})
+
+    @staticmethod
+    def key(*parts):
+        return "/".join(str(p) for p in parts)
+
+    def is_complete(self, key, chash, output):
+        entry = self.units.get(key)
+        if entry is None or entry["config_hash"] != chash:
+            return False
+        if not os.path.exists(output):
+            return False
+        return checksum(output) == entry["checksum"]
+
+    def mark_complete(self, key, chash, output, **info):
+        self.units[key] = {"config_hash": chash, "output": output, "checksum": checksum(output), **info}
+        self.save()
+
+    def invalidate(self, key):
+        if self.units.pop(key, None) is not None:
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"units": self.units}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def _id_counters():
+    counters = {}
+    for module_name, cls_name, attr in ID_COUNTERS:
+        try:
+            cls = getattr(importlib.import_module(module_name), cls_name)
+        except (ImportError, AttributeError):
+            continue
+        counters[(module_name, cls_name, attr)] = getattr(cls, attr)
+    return counters
+
+
+def save_checkpoint(path, tracker, chash, frame, offset=None):
+    """Pickles a tracker's state (without its ReID model) after `frame` has been fully written.
+
+    `offset` is the byte size of the output file at that point. Returns False if the state
+    cannot be pickled, in which case an interrupted sequence is simply restarted.
+    """
+    state = {k: v for k, v in tracker.__dict__.items() if k != "model"}
+    try:
+        payload = pickle.dumps({"config_hash": chash, "frame": frame, "offset": offset,
+                                "state": state, "counters": _id_counters()})
+    except Exception:
+        return False
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return True
+
+
+def load_checkpoint(path, tracker, chash):
+    """Restores a checkpoint into a freshly built tracker. Returns (frame, offset) or None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            ckpt = pickle.load(f)
+    except Exception:
+        return None
+    if ckpt.get("config_hash") != chash:
+        return None
+
+    tracker.__dict__.update(ckpt["state"])
+    for (module_name, cls_name, attr), value in ckpt["counters"].items():
+        setattr(getattr(importlib.import_module(module_name), cls_name), attr, value)
+    return ckpt["frame"], ckpt["offset"]
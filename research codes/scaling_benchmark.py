@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import torch
+
+import hota_eval
+import mot_io
+import tracker_registry
+from frame_source import read_seqinfo
+from stage_timer import StageTimer, summarize
+from synthetic_workload import SYNTH_DIR
+
+# --- CONFIGURATION ---
+SCALING_DIR = os.path.join("runs", "scaling")
+WARMUP_FRAMES = 10  # first frames of every run are not timed (lazy init, allocator warm-up)
+THREADS = 1  # torch CPU threads: per-core numbers, comparable across machines
+
+
+def list_sequences(data_dir=SYNTH_DIR):
+    """Synthetic sequences (synthetic_workload.py) of a folder, by increasing object count."""
+    seqs = []
+    for seq in os.listdir(data_dir):
+        meta = os.path.join(data_dir, seq, "synth.json")
+        if os.path.exists(meta) and os.path.exists(os.path.join(data_dir, seq, "det", "det.npy")):
+            with open(meta, 'r') as f:
+                seqs.append((json.load(f)["objects"], seq))
+    return [seq for _, seq in sorted(seqs)]
+
+
+def load_workload(seq_dir):
+    """Detections (DET_COLUMNS), embeddings or None, per-frame row offsets and sequence metadata."""
+    dets = np.load(os.path.join(seq_dir, "det", "det.npy"))
+    emb_path = os.path.join(seq_dir, "det", "emb.npy")
+    embs = np.load(emb_path) if os.path.exists(emb_path) else None
+    with open(os.path.join(seq_dir, "synth.json"), 'r') as f:
+        params = json.load(f)
+    offsets = np.searchsorted(dets[:, 0].astype(np.int64), np.arange(1, params["frames"] + 2))
+    return dets, embs, offsets, params
+
+
+def replay(spec, seq_dir, results_dir=None, warmup=WARMUP_FRAMES):
+    """Drives one tracker's update() over a synthetic sequence on CPU, timing every frame.
+
+    Stages: detect (slicing the frame's replayed detections), track (the update() call) and write
+    (MOT output, only with `results_dir`). Appearance trackers get the sequence's synthetic
+    embeddings (as with --reid-cache), so no ReID network runs and the timing isolates association
+    cost. The image argument is a blank frame of the sequence's size.
+    Returns (per-stage samples without the warm-up frames, detections per timed frame, parameters).
+    """
+    seq = os.path.basename(seq_dir)
+    dets, embs, offsets, params = load_workload(seq_dir)
+    info = read_seqinfo(seq_dir)
+    img = np.zeros((int(info.get("imHeight", 1080)), int(info.get("imWidth", 1920)), 3), dtype=np.uint8)
+
+    use_embs = embs is not None and tracker_registry.uses_reid(spec)
+    if tracker_registry.uses_reid(spec) and not use_embs:
+        raise ValueError(f"{seq} has no embeddings; regenerate it with --emb-dim > 0 to benchmark {spec['name']}")
+    tracker = tracker_registry.build_tracker(spec, "cpu")
+    tracker_registry.reset_track_ids()
+    det_thresh = getattr(tracker, "det_thresh", None)
+    writer = mot_io.MOTWriter(mot_io.result_file(spec["folder"], seq, results_dir)) if results_dir else None
+
+    timer = StageTimer(stages=("detect", "track", "write") if writer else ("detect", "track"))
+    n_dets = 0
+    for fid in range(1, params["frames"] + 1):
+        with timer.time("detect"):
+            lo, hi = offsets[fid - 1], offsets[fid]
+            frame_dets = np.array(dets[lo:hi, 1:], dtype=np.float32)
+            frame_embs = None
+            if use_embs:
+                frame_embs = np.array(embs[lo:hi], dtype=np.float32)
+                if det_thresh is not None:
+                    keep = frame_dets[:, 4] > det_thresh
+                    frame_dets, frame_embs = frame_dets[keep], frame_embs[keep]
+        with timer.time("track"):
+            if frame_embs is None:
+                tracks = tracker.update(frame_dets, img)
+            else:
+                tracks = tracker.update(frame_dets, img, embs=frame_embs)
+        if writer is not None:
+            with timer.time("write"):
+                if len(tracks) > 0:
+                    writer.write_frame(fid, tracks)
+        timer.end_frame()
+        if fid > warmup:
+            n_dets += len(frame_dets)
+    if writer is not None:
+        writer.close()
+
+    samples = {stage: values[warmup:] for stage, values in timer.samples.items()}
+    return samples, n_dets / max(1, params["frames"] - warmup), params
+
+
+def bench_unit(spec, seq_dir, results_dir=None, warmup=WARMUP_FRAMES):
+    """Latency and throughput of one tracker's update() on one synthetic sequence."""
+    samples, dets_per_frame, params = replay(spec, seq_dir, results_dir, warmup)
+    stats = next(row for row in summarize(samples, len(samples["track"])) if row["stage"] == "track")
+    return {"tracker": spec["name"], "seq": os.path.basename(seq_dir), "objects": params["objects"],
+            "dets_per_frame": round(dets_per_frame, 1),
+            **{k: stats[k] for k in ("frames", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "fps")}}
+
+
+def scaling_exponent(rows):
+    """Fitted b of latency ~ a * objects^b per tracker (least squares in log-log space)."""
+    exponents = {}
+    for tracker, group in rows.groupby("tracker"):
+        group = group[group["mean_ms"] > 0]
+        if group["objects"].nunique() >= 2:
+            exponents[tracker] = round(float(np.polyfit(np.log(group["objects"]), np.log(group["mean_ms"]), 1)[0]), 2)
+    return exponents
+
+
+def run_scaling(trackers=None, data_dir=SYNTH_DIR, sequences=None, out_dir=SCALING_DIR,
+                config=tracker_registry.TRACKERS_FILE, evaluate=False, threads=THREADS):
+    """Benchmarks every (tracker, synthetic sequence) pair serially (so runs do not compete for
+    cores) and writes the scaling table to <out_dir>/scaling.csv and .json."""
+    torch.set_num_threads(threads)
+    registry = tracker_registry.load_registry(config)
+    specs = [registry[name] for name in (trackers or registry)]
+    if any(tracker_registry.uses_reid(spec) for spec in specs) and not tracker_registry.REID_WEIGHTS.exists():
+        import main_benchmark  # appearance trackers load their ReID weights even when fed embeddings
+        main_benchmark.download_weights()
+    sequences = sequences or list_sequences(data_dir)
+    results_dir = os.path.join(out_dir, "results") if evaluate else None
+    print(f"📈 Scaling benchmark: {len(specs)} trackers x {len(sequences)} sequences on CPU ({threads} thread(s))")
+
+    rows = []
+    for spec in specs:
+        for seq in sequences:
+            row = bench_unit(spec, os.path.join(data_dir, seq), results_dir)
+            rows.append(row)
+            print(f"   {row['tracker']:<12} {row['objects']:>5} objects ({row['dets_per_frame']:>6.1f} dets/frame): "
+                  f"{row['mean_ms']:>8.2f} ms/frame, p95 {row['p95_ms']:>8.2f} ms, {row['fps']} FPS")
+    table = pd.DataFrame(rows)
+
+    if evaluate:
+        metrics = hota_eval.evaluate(data_dir, results_dir, [spec["folder"] for spec in specs], sequences,
+                                     write_summaries=False)
+        metrics = metrics[metrics["seq"] != "COMBINED"][["tracker", "seq", "HOTA", "IDF1", "IDSW"]]
+        folder_to_name = {spec["folder"]: spec["name"] for spec in specs}
+        metrics["tracker"] = metrics["tracker"].map(folder_to_name)
+        table = table.merge(metrics, on=["tracker", "seq"], how="left")
+
+    os.makedirs(out_dir, exist_ok=True)
+    table.to_csv(os.path.join(out_dir, "scaling.csv"), index=False)
+    exponents = scaling_exponent(table)
+    with open(os.path.join(out_dir, "scaling.json"), 'w') as f:
+        json.dump({"rows": table.to_dict("records"), "exponents": exponents, "threads": threads,
+                   "created": time.strftime("%Y-%m-%dT%H:%M:%S")}, f, indent=2)
+    for tracker, b in exponents.items():
+        print(f"   {tracker}: latency grows as objects^{b}")
+    return table, exponents
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tracker CPU cost vs objects per frame on synthetic sequences.")
+    parser.add_argument("--trackers", nargs="+", help="Registry names (default: all in --config).")
+    parser.add_argument("--data-dir", default=SYNTH_DIR, help="Folder of synthetic_workload.py sequences.")
+    parser.add_argument("--sequences", nargs="+")
+    parser.add_argument("--config", default=tracker_registry.TRACKERS_FILE)
+    parser.add_argument("--out", default=SCALING_DIR)
+    parser.add_argument("--eval", action="store_true", help="Also score the tracks against the synthetic GT (HOTA, IDF1, IDSW).")
+    parser.add_argument("--threads", type=int, default=THREADS, help="torch CPU threads.")
+    args = parser.parse_args()
+
+    table, _ = run_scaling(args.trackers, args.data_dir, args.sequences, args.out, args.config, args.eval, args.threads)
+    print(table.to_string(index=False))
+    print(f"✅ Scaling report saved to {args.out}/scaling.csv")
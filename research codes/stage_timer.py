@@ -0,0 +1,166 @@
+import os
+import csv
+import json
+import time
+from contextlib import contextmanager
+import numpy as np
+
+# Pipeline stages timed per frame, in execution order
+STAGES = ("decode", "detect", "embed", "track", "write")
+
+
+class StageTimer:
+    """Collects per-frame latency of each pipeline stage.
+
+    Stage times are accumulated within a frame and committed by `end_frame()`. Every stage in
+    `stages` gets one sample per frame (zero if it did not run). `nested` maps a stage to the
+    stage it runs inside of (e.g. ReID embedding happens inside the tracker update), so the outer
+    stage only keeps its own time.
+    """
+
+    def __init__(self, stages=STAGES, nested=None):
+        self.stages = tuple(stages)
+        self.nested = nested or {}
+        self.samples = {}
+        self._frame = {}
+
+    @contextmanager
+    def time(self, stage):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - t0)
+
+    def add(self, stage, seconds):
+        self._frame[stage] = self._frame.get(stage, 0.0) + seconds
+
+    def end_frame(self):
+        for stage in self.stages:
+            self._frame.setdefault(stage, 0.0)
+        for inner, outer in self.nested.items():
+            if inner in self._frame and outer in self._frame:
+                self._frame[outer] = max(0.0, self._frame[outer] - self._frame[inner])
+        for stage, seconds in self._frame.items():
+            self.samples.setdefault(stage, []).append(seconds)
+        self._frame = {}
+
+
+def timed(fn, timer, stage):
+    """Wraps a callable so every call is charged to `stage` on `timer`."""
+    def wrapper(*args, **kwargs):
+        with timer.time(stage):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def summarize(samples, n_frames):
+    """Per-stage latency percentiles (ms) and throughput for one set of frame samples.
+
+    `samples` maps stage -> list of per-frame seconds. A 'pipeline' row sums all stages per frame,
+    counting frames in which a stage did not run as zero for that stage.
+    """
+    rows = []
+    total = np.zeros(n_frames)
+    for stage in [s for s in STAGES if s in samples] + sorted(set(samples) - set(STAGES)):
+        values = np.asarray(samples[stage], dtype=np.float64)
+        if len(values) == 0:
+            continue
+        if len(values) == n_frames:
+            total += values
+        rows.append(_stats_row(stage, values, n_frames))
+    if n_frames > 0:
+        rows.append(_stats_row("pipeline", total, n_frames))
+    return rows
+
+
+def _stats_row(stage, values, n_frames):
+    ms = values * 1000.0
+    total_s = float(values.sum())
+    return {
+        "stage": stage,
+        "frames": int(n_frames),
+        "total_s": round(total_s, 4),
+        "mean_ms": round(float(ms.mean()), 3),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "fps": round(n_frames / total_s, 2) if total_s > 0 else None,
+    }
+
+
+def build_report(results):
+    """Timing rows per (tracker, sequence) plus one combined 'ALL' entry per tracker.
+
+    `results` is a list of dicts with keys tracker, seq, frames, wall_s and samples, and optionally
+    the frame source's decode stats under "source" (reported as a 'source_decode' row).
+    """
+    rows = []
+    by_tracker = {}
+    for res in sorted(results, key=lambda r: (r["tracker"], r["seq"])):
+        for row in summarize(res["samples"], res["frames"]):
+            rows.append({"tracker": res["tracker"], "seq": res["seq"], **row})
+        rows.append({"tracker": res["tracker"], "seq": res["seq"], "stage": "wall",
+                     "frames": res["frames"], "total_s": round(res["wall_s"], 4),
+                     "fps": round(res["frames"] / res["wall_s"], 2) if res["wall_s"] > 0 else None})
+        if res.get("source"):
+            rows.append(_source_row(res["tracker"], res["seq"], res["source"]["frames"], res["source"]["decode_s"]))
+
+        merged = by_tracker.setdefault(res["tracker"], {"frames": 0, "wall_s": 0.0, "samples": {},
+                                                        "decoded": 0, "decode_s": 0.0, "has_source": False})
+        merged["frames"] += res["frames"]
+        merged["wall_s"] += res["wall_s"]
+        if res.get("source"):
+            merged["has_source"] = True
+            merged["decoded"] += res["source"]["frames"]
+            merged["decode_s"] += res["source"]["decode_s"]
+        for stage, values in res["samples"].items():
+            merged["samples"].setdefault(stage, []).extend(values)
+
+    for tracker, merged in by_tracker.items():
+        for row in summarize(merged["samples"], merged["frames"]):
+            rows.append({"tracker": tracker, "seq": "ALL", **row})
+        rows.append({"tracker": tracker, "seq": "ALL", "stage": "wall", "frames": merged["frames"],
+                     "total_s": round(merged["wall_s"], 4),
+                     "fps": round(merged["frames"] / merged["wall_s"], 2) if merged["wall_s"] > 0 else None})
+        if merged["has_source"]:
+            rows.append(_source_row(tracker, "ALL", merged["decoded"], merged["decode_s"]))
+    return rows
+
+
+def _source_row(tracker, seq, frames, decode_s):
+    """Decode throughput of the frame source: frames per second of decode work."""
+    return {"tracker": tracker, "seq": seq, "stage": "source_decode", "frames": frames,
+            "total_s": round(decode_s, 4), "fps": round(frames / decode_s, 2) if decode_s > 0 else None}
+
+
+def save_result(result, path):
+    """Stores one (tracker, sequence) timing result so later runs can report it without rerunning."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(result, f)
+
+
+def load_result(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def write_report(rows, out_dir, name="timing"):
+    """Writes timing rows to <out_dir>/<name>.json and <out_dir>/<name>.csv."""
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, f"{name}.json")
+    csv_path = os.path.join(out_dir, f"{name}.csv")
+
+    with open(json_path, 'w') as f:
+        json.dump(rows, f, indent=2)
+
+    fields = ["tracker", "seq", "stage", "frames", "total_s", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "fps"]
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: row.get(k, "") for k in fields})
+    return json_path, csv_path
@@ -1,95 +1,157 @@
 import os
-import glob
-import configparser
+import argparse
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
 from tqdm import tqdm
 import shutil
 
+import dataset_index
+from mot_io import paper_name, write_seqmap
+from run_manifest import MANIFEST_NAME, RunManifest, config_hash
+
 RUNS_DIR = "runs"
 OUTPUT_DIR = "tracker_results"
 DATASET_DIR = "dancetrack_val_local"
+WRITE_BLOCK_ROWS = 65536  # rows formatted and written per block
+# MOT Challenge Format: <frame>, <id>, <bb_left>, <bb_top>, <bb_width>, <bb_height>, <conf>, <x>, <y>, <z>
+MOT_ROW = "%d,%d,%.2f,%.2f,%.2f,%.2f,1,-1,-1,-1\n"
 
+@lru_cache(maxsize=None)
 def get_resolution(seq_name):
-    """Reads sequence resolution from seqinfo.ini."""
-    ini_path = os.path.join(DATASET_DIR, seq_name, "seqinfo.ini")
-    if os.path.exists(ini_path):
-        config = configparser.ConfigParser()
-        config.read(ini_path)
-        try:
-            return int(config['Sequence']['imWidth']), int(config['Sequence']['imHeight'])
-        except KeyError:
-            pass
+    """Sequence resolution from the dataset index (built from seqinfo.ini on first use)."""
+    if os.path.isdir(os.path.join(DATASET_DIR, seq_name)):
+        img_w, img_h = dataset_index.open_sequence(DATASET_DIR, seq_name).resolution
+        if img_w and img_h:
+            return int(img_w), int(img_h)
     return 1920, 1080  # Default fallback
 
-def stitch():
-    print("🧵 Starting Data Standardization...")
-    if os.path.exists(OUTPUT_DIR): 
-        shutil.rmtree(OUTPUT_DIR)
+def labels_signature(labels_dir, img_w, img_h):
+    """Cheap fingerprint of a label folder (file names, sizes, mtimes) and the target resolution."""
+    entries = sorted((e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in os.scandir(labels_dir))
+    return config_hash({"files": entries, "resolution": [img_w, img_h]})
+
+def read_label_files(labels_dir):
+    """Reads every per-frame label file of a sequence at once.
+
+    Returns (frame_ids, rows): one frame id per label line and an (N, 6) float array of
+    [class, xc, yc, w, h, id] rows. Lines with fewer than six values are skipped.
+    """
+    names, texts = [], []
+    for name in sorted(os.listdir(labels_dir)):
+        if not name.endswith(".txt"): continue
+        try:
+            frame_id = int(name.split('.')[0])
+        except ValueError:
+            continue
+        with open(os.path.join(labels_dir, name), 'r') as f:
+            names.append(frame_id)
+            texts.append(f.read())
+
+    # Lines are split per file, so values of one file can never run into the next; the kept rows
+    # (first six values of lines with at least six) are converted to floats in one array call
+    frame_ids, rows = [], []
+    for frame_id, text in zip(names, texts):
+        file_rows = [parts[:6] for parts in map(str.split, text.splitlines()) if len(parts) >= 6]
+        frame_ids.append(np.full(len(file_rows), frame_id, dtype=np.int64))
+        rows += file_rows
+    frame_ids = np.concatenate(frame_ids) if frame_ids else np.zeros(0, dtype=np.int64)
+    return frame_ids, np.array(rows, dtype=np.float64).reshape(-1, 6)
+
+def stitch_sequence(labels_dir, output_file, img_w, img_h):
+    """Converts one sequence's normalized labels to a MOTChallenge file. Returns the row count."""
+    frame_ids, rows = read_label_files(labels_dir)
+
+    # Convert back to absolute coordinates for MOT format
+    xc, yc, w, h = rows[:, 1], rows[:, 2], rows[:, 3], rows[:, 4]
+    table = np.column_stack([frame_ids, np.trunc(rows[:, 5]),
+                             (xc - w / 2) * img_w, (yc - h / 2) * img_h, w * img_w, h * img_h])
+
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, 'w') as out_f:
+        for start in range(0, len(table), WRITE_BLOCK_ROWS):
+            block = table[start:start + WRITE_BLOCK_ROWS]
+            out_f.write((MOT_ROW * len(block)) % tuple(block.ravel().tolist()))
+    os.replace(tmp_file, output_file)
+    return len(table)
+
+def _stitch_job(job):
+    return stitch_sequence(*job)
 
+def stitch(fresh=False, workers=1):
+    """Converts legacy per-frame label folders (main_benchmark.py --legacy-labels) to MOT files.
+
+    Runs written directly in MOT format are already in place and are left untouched. Sequences
+    whose label folder is unchanged since the last stitch are skipped (see manifest.json). Each
+    sequence is parsed and converted as whole arrays; with `workers` > 1 the (tracker, sequence)
+    conversions run on a process pool.
+    """
+    print("🧵 Starting Data Standardization...")
     if not os.path.exists(RUNS_DIR):
         print(f"❌ Runs directory '{RUNS_DIR}' not found. Did you run main_benchmark.py?")
         return
 
-    for tracker_folder in os.listdir(RUNS_DIR):
-        # Map folder names to paper names
-        if "deepoc" in tracker_folder: paper_name = "DeepOCSORT"
-        elif "strong" in tracker_folder: paper_name = "StrongSORT"
-        elif "byte" in tracker_folder: paper_name = "ByteTrack"
-        else: continue 
-        
-        save_path = os.path.join(OUTPUT_DIR, paper_name, "data")
-        os.makedirs(save_path, exist_ok=True)
-        
+    manifest_path = os.path.join(OUTPUT_DIR, MANIFEST_NAME)
+    if fresh and os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    manifest = RunManifest(manifest_path)
+
+    jobs = {}
+    for tracker_folder in sorted(os.listdir(RUNS_DIR)):
+        name = paper_name(tracker_folder)
+        if name is None: continue
+
         source_path = os.path.join(RUNS_DIR, tracker_folder)
+        if not os.path.isdir(source_path): continue
         video_folders = sorted(os.listdir(source_path))
+        if not any(os.path.isdir(os.path.join(source_path, seq, "labels")) for seq in video_folders):
+            print(f"⏭️  {name}: no legacy label folders, results already in MOT format.")
+            continue
         
-        print(f"📂 Formatting data for: {paper_name}...")
+        save_path = os.path.join(OUTPUT_DIR, name, "data")
+        if fresh and os.path.exists(save_path):
+            shutil.rmtree(save_path)
+        os.makedirs(save_path, exist_ok=True)
         
-        for seq in tqdm(video_folders):
+        for seq in video_folders:
             labels_dir = os.path.join(source_path, seq, "labels")
             if not os.path.exists(labels_dir): continue
                 
             img_w, img_h = get_resolution(seq)
             output_file = os.path.join(save_path, f"{seq}.txt")
-            
-            with open(output_file, 'w') as out_f:
-                files = sorted(glob.glob(os.path.join(labels_dir, "*.txt")))
-                for f_path in files:
-                    try:
-                        frame_id = int(os.path.basename(f_path).split('.')[0])
-                        # Handle potential leading zeros in filenames if they match frame number
-                    except ValueError:
-                         continue
-
-                    with open(f_path, 'r') as in_f:
-                        for line in in_f:
-                            parts = line.strip().split()
-                            if len(parts) < 6: continue
-                            
-                            # Read normalized values
-                            xc, yc, w, h = map(float, parts[1:5])
-                            tid = int(float(parts[5]))
-                            
-                            # Convert back to absolute coordinates for MOT format
-                            x1 = (xc - w/2) * img_w
-                            y1 = (yc - h/2) * img_h
-                            ww = w * img_w
-                            hh = h * img_h
-                            
-                            # MOT Challenge Format: <frame>, <id>, <bb_left>, <bb_top>, <bb_width>, <bb_height>, <conf>, <x>, <y>, <z>
-                            out_f.write(f"{frame_id},{tid},{x1:.2f},{y1:.2f},{ww:.2f},{hh:.2f},1,-1,-1,-1\n")
+            unit_key = manifest.key("stitch", name, seq)
+            signature = labels_signature(labels_dir, img_w, img_h)
+            if manifest.is_complete(unit_key, signature, output_file): continue
+            jobs[unit_key] = ((labels_dir, output_file, img_w, img_h), signature)
+
+    print(f"📂 Formatting {len(jobs)} sequences on {workers} worker(s)...")
+    def done(unit_key):
+        (_, output_file, _, _), signature = jobs[unit_key]
+        manifest.mark_complete(unit_key, signature, output_file)
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_stitch_job, job): key for key, (job, _) in jobs.items()}
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                future.result()
+                done(futures[future])
+    else:
+        for unit_key, (job, _) in tqdm(jobs.items()):
+            stitch_sequence(*job)
+            done(unit_key)
 
     # Generate Seqmap for evaluation
     if os.path.exists(DATASET_DIR):
-        os.makedirs(os.path.join(OUTPUT_DIR, "seqmaps"), exist_ok=True)
-        with open(os.path.join(OUTPUT_DIR, "seqmaps", "dancetrack-val.txt"), "w") as f:
-            f.write("name\n")
-            for seq in sorted(os.listdir(DATASET_DIR)):
-                if os.path.isdir(os.path.join(DATASET_DIR, seq)):
-                    f.write(f"{seq}\n")
+        write_seqmap(DATASET_DIR, OUTPUT_DIR)
     else:
         print(f"⚠️ Dataset directory '{DATASET_DIR}' not found. Skipping seqmap generation.")
 
     print("✅ Data Standardized.")
 
 if __name__ == "__main__":
-    stitch()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Converts legacy per-frame label folders to MOTChallenge files.")
+    parser.add_argument("--fresh", action="store_true", help="Re-stitch every sequence, ignoring the manifest.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Processes for (tracker, sequence) conversions.")
+    args = parser.parse_args()
+    stitch(fresh=args.fresh, workers=args.workers)
\ No newline at end of file
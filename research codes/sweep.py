@@ -0,0 +1,85 @@
+import os
+import argparse
+import json
+import pandas as pd
+import torch
+
+import evaluate_results
+import main_benchmark
+import mot_io
+import tracker_registry
+from stage_timer import build_report
+
+# --- CONFIGURATION ---
+SWEEPS_DIR = "sweeps"
+
+
+def load_sweep(path):
+    """Reads a sweep file: {"name": ..., "tracker": <registry name>, "grid": {arg: [values]},
+    optional "sequences": [...], "config": <registry file> and "reid_cache": true}."""
+    with open(path, 'r') as f:
+        sweep = json.load(f)
+    sweep.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    return sweep
+
+
+def speed_by_unit(results):
+    """Measured FPS per unit from the timing results: end-to-end 'pipeline' and wall-clock."""
+    speed = {}
+    for row in build_report(results):
+        if row["seq"] == "ALL" and row["stage"] in ("pipeline", "wall"):
+            speed.setdefault(row["tracker"], {})[f"{row['stage']}_fps"] = row["fps"]
+    return speed
+
+
+def run_sweep(sweep_file, workers=1):
+    """Expands a parameter grid into tracker configs, runs them in parallel over the shared
+    detection cache, evaluates them and collects speed and accuracy into one table."""
+    sweep = load_sweep(sweep_file)
+    registry = tracker_registry.load_registry(sweep.get("config", tracker_registry.TRACKERS_FILE))
+    variants = tracker_registry.expand_grid(registry[sweep["tracker"]], sweep["grid"])
+
+    run_dir = os.path.join(SWEEPS_DIR, sweep["name"])
+    results_dir = os.path.join(run_dir, "results")
+    print(f"🧪 Sweep '{sweep['name']}': {len(variants)} {sweep['tracker']} configs")
+
+    device = 0 if torch.cuda.is_available() else "cpu"
+    main_benchmark.download_weights()
+    det_key, sequences = main_benchmark.prepare_detections(device)
+    if sweep.get("sequences"):
+        sequences = [seq for seq in sequences if seq in sweep["sequences"]]
+    # Appearance-tracker sweeps can share one set of ReID embeddings across every config
+    reid_name = main_benchmark.prepare_embeddings(det_key, sequences, device) if sweep.get("reid_cache") else None
+
+    # Tracking: (config, sequence) jobs replay the same cached detections; finished ones are skipped
+    timing = main_benchmark.run_units(variants, sequences, det_key, device, workers,
+                                      run_dir=run_dir, results_dir=results_dir, reid_name=reid_name)
+
+    # Accuracy: one in-process evaluation over every config folder
+    seqmap_file = mot_io.write_seqmap(main_benchmark.VAL_DATA_DIR, results_dir, sequences=sequences)
+    evaluate_results.run_eval(results_dir, trackers=[v["folder"] for v in variants],
+                              seqmap_file=seqmap_file, gt_folder=main_benchmark.VAL_DATA_DIR, workers=workers)
+
+    speed = speed_by_unit(timing)
+    rows = []
+    for v in variants:
+        metrics = evaluate_results.read_summary(results_dir, v["folder"]) or {}
+        rows.append({"config": v["name"], **v["params"],
+                     **{k: metrics.get(k) for k in ("HOTA", "DetA", "AssA", "LocA", "IDF1")},
+                     **speed.get(v["name"], {})})
+
+    table = pd.DataFrame(rows).sort_values("HOTA", ascending=False, na_position="last")
+    table_path = os.path.join(run_dir, "results.csv")
+    table.to_csv(table_path, index=False)
+    print(table.to_string(index=False))
+    print(f"\n✅ Sweep table saved to {table_path}")
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs a tracker hyperparameter sweep over cached detections.")
+    parser.add_argument("sweep_file", help="Sweep JSON, e.g. configs/sweep_bytetrack.json")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Processes for (config, sequence) jobs.")
+    args = parser.parse_args()
+    run_sweep(args.sweep_file, workers=args.workers)
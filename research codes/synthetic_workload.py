@@ -0,0 +1,209 @@
+import os
+import json
+import argparse
+import numpy as np
+
+from run_manifest import config_hash
+
+# --- CONFIGURATION ---
+SYNTH_DIR = "synthetic_local"  # MOTChallenge-style dataset folder, like 'dancetrack_val_local'
+FRAMES = 600
+FRAME_RATE = 20
+IM_WIDTH, IM_HEIGHT = 1920, 1080
+OBJECT_HEIGHT = (0.05, 0.2)  # person height as a fraction of the image height (MOT17/MOT20-like)
+NONLINEARITY = 0.5  # 0: constant velocity, 1: dance-like (oscillation, sudden turns, speed changes)
+OCCLUSION_RATE = 0.2  # expected fraction of object-frames inside an occlusion episode
+OCCLUSION_LENGTH = (5, 40)  # frames per occlusion episode (uniform)
+BOX_NOISE = 0.05  # detection jitter, as a fraction of the box size
+MISS_RATE = 0.05  # chance of missing a fully visible object
+FP_RATE = 0.02  # false positives per frame, per object in the scene
+MIN_VISIBILITY = 0.3  # objects less visible than this are never detected
+EMB_DIM = 128  # per-detection appearance embedding (0: none)
+EMB_NOISE = 0.3  # embedding noise relative to the per-ID appearance vector
+
+# Column layout of det/det.npy (same as detection_cache.CACHE_COLUMNS)
+DET_COLUMNS = ("frame", "x1", "y1", "x2", "y2", "conf", "cls")
+
+
+def seq_name(objects, seed=0):
+    return f"synth-{objects:04d}obj-s{seed}"
+
+
+def simulate_motion(rng, objects, frames, nonlinearity, width=IM_WIDTH, height=IM_HEIGHT):
+    """Box trajectories of `objects` people over `frames` frames: (frames, objects, 4) [x, y, w, h].
+
+    Every object stays in the scene for the whole sequence, so the object count per frame is exact.
+    Motion is a random walk of velocity plus, scaled by `nonlinearity`, a sinusoidal sway with
+    per-object frequency/phase and occasional sudden turns and speed changes (DanceTrack-like).
+    """
+    h = rng.uniform(*OBJECT_HEIGHT, objects) * height
+    w = h * rng.uniform(0.35, 0.5, objects)
+    pos = np.stack([rng.uniform(0, width - w), rng.uniform(0, height - h)], axis=1)
+    speed = rng.uniform(1.0, 6.0, objects)
+    angle = rng.uniform(0, 2 * np.pi, objects)
+    sway_amp = nonlinearity * rng.uniform(2.0, 10.0, (objects, 2))
+    sway_freq = rng.uniform(0.05, 0.3, (objects, 2))
+    sway_phase = rng.uniform(0, 2 * np.pi, (objects, 2))
+
+    boxes = np.empty((frames, objects, 4))
+    for t in range(frames):
+        turn = rng.random(objects) < 0.02 * nonlinearity
+        angle = np.where(turn, rng.uniform(0, 2 * np.pi, objects), angle + rng.normal(0, 0.05, objects))
+        speed = np.clip(np.where(turn, rng.uniform(0.5, 8.0, objects), speed), 0.5, 8.0)
+        vel = np.stack([np.cos(angle), np.sin(angle)], axis=1) * speed[:, None]
+        vel += sway_amp * sway_freq * np.cos(sway_freq * t + sway_phase)
+        pos += vel
+
+        # Bounce off the image borders
+        for axis, limit in ((0, width - w), (1, height - h)):
+            low, high = pos[:, axis] < 0, pos[:, axis] > limit
+            pos[:, axis] = np.clip(pos[:, axis], 0, limit)
+            angle = np.where(low | high, np.pi - angle if axis == 0 else -angle, angle)
+
+        boxes[t, :, :2] = pos
+        boxes[t, :, 2] = w
+        boxes[t, :, 3] = h
+    return boxes
+
+
+def mutual_visibility(boxes):
+    """Visible fraction of each box given the boxes in front of it (larger bottom edge = closer)."""
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    iw = np.clip(np.minimum(x2[:, None], x2[None]) - np.maximum(x1[:, None], x1[None]), 0, None)
+    ih = np.clip(np.minimum(y2[:, None], y2[None]) - np.maximum(y1[:, None], y1[None]), 0, None)
+    in_front = y2[None] > y2[:, None]  # [i, j]: j is in front of i
+    covered = (iw * ih * in_front).sum(axis=1)
+    return np.clip(1 - covered / (boxes[:, 2] * boxes[:, 3]), 0, 1)
+
+
+def occlusion_episodes(rng, objects, frames, rate, length=OCCLUSION_LENGTH):
+    """(frames, objects) visibility multiplier from occluders outside the crowd (pillars, props).
+
+    Episodes start with a probability chosen so that on average `rate` of all object-frames are
+    inside one; visibility inside an episode is 0-0.3.
+    """
+    vis = np.ones((frames, objects))
+    if rate <= 0:
+        return vis
+    mean_len = sum(length) / 2
+    p_start = min(1.0, rate / (mean_len * max(1e-6, 1 - rate)))
+    for t in range(frames):
+        starts = np.nonzero((rng.random(objects) < p_start) & (vis[t] == 1))[0]
+        for i in starts:
+            n = int(rng.integers(length[0], length[1] + 1))
+            vis[t:t + n, i] = np.minimum(vis[t:t + n, i], rng.uniform(0, MIN_VISIBILITY))
+    return vis
+
+
+def generate_sequence(objects, frames=FRAMES, nonlinearity=NONLINEARITY, occlusion_rate=OCCLUSION_RATE,
+                      box_noise=BOX_NOISE, miss_rate=MISS_RATE, fp_rate=FP_RATE, emb_dim=EMB_DIM, seed=0):
+    """Simulates one sequence. Returns (gt, dets, embs): MOT GT rows, DET_COLUMNS rows (sorted by
+    frame) and row-aligned embeddings (None if `emb_dim` is 0)."""
+    rng = np.random.default_rng([seed, objects])
+    boxes = simulate_motion(rng, objects, frames, nonlinearity)
+    episodes = occlusion_episodes(rng, objects, frames, occlusion_rate)
+    appearance = rng.normal(0, 1, (objects, max(emb_dim, 1)))
+    appearance /= np.linalg.norm(appearance, axis=1, keepdims=True)
+
+    gt, dets, embs = [], [], []
+    ids = np.arange(1, objects + 1)
+    for t in range(frames):
+        fid = t + 1
+        b = boxes[t]
+        vis = np.minimum(mutual_visibility(b), episodes[t])
+        gt.append(np.column_stack([np.full(objects, fid), ids, b, np.ones(objects), np.ones(objects), vis]))
+
+        # True positives: likelier the more visible, jittered boxes, confidence tracks visibility
+        p_detect = (1 - miss_rate) * np.clip((vis - MIN_VISIBILITY) / (1 - MIN_VISIBILITY) * 2, 0, 1)
+        hit = rng.random(objects) < p_detect
+        jitter = rng.normal(0, box_noise, (objects, 4)) * np.column_stack([b[:, 2:], b[:, 2:]])
+        x1y1 = b[:, :2] + jitter[:, :2]
+        x2y2 = b[:, :2] + b[:, 2:] + jitter[:, 2:]
+        conf = np.clip(rng.normal(0.45 + 0.5 * vis, 0.08), 0.05, 1.0)
+        tp = np.column_stack([np.full(objects, fid), x1y1, x2y2, conf, np.zeros(objects)])[hit]
+        tp_embs = appearance[hit] + rng.normal(0, EMB_NOISE / np.sqrt(appearance.shape[1]), (hit.sum(), appearance.shape[1]))
+
+        # False positives: random person-sized boxes with low confidence and random appearance
+        n_fp = rng.poisson(fp_rate * objects)
+        fh = rng.uniform(*OBJECT_HEIGHT, n_fp) * IM_HEIGHT
+        fw = fh * rng.uniform(0.35, 0.5, n_fp)
+        fx, fy = rng.uniform(0, IM_WIDTH - fw), rng.uniform(0, IM_HEIGHT - fh)
+        fp = np.column_stack([np.full(n_fp, fid), fx, fy, fx + fw, fy + fh, rng.uniform(0.1, 0.6, n_fp), np.zeros(n_fp)])
+        fp_embs = rng.normal(0, 1, (n_fp, appearance.shape[1]))
+
+        dets += [tp, fp]
+        embs += [tp_embs, fp_embs]
+
+    gt = np.concatenate(gt)
+    dets = np.concatenate(dets).astype(np.float32)
+    embs = np.concatenate(embs)
+    embs = (embs / np.linalg.norm(embs, axis=1, keepdims=True)).astype(np.float32) if emb_dim else None
+    return gt, dets, embs
+
+
+def write_sequence(out_dir, name, gt, dets, embs, params, frame_rate=FRAME_RATE):
+    """Writes one sequence in MOTChallenge layout: seqinfo.ini, gt/gt.txt, det/det.txt, plus
+    det/det.npy (DET_COLUMNS), det/emb.npy (row-aligned embeddings) and synth.json (parameters)."""
+    seq_dir = os.path.join(out_dir, name)
+    os.makedirs(os.path.join(seq_dir, "gt"), exist_ok=True)
+    os.makedirs(os.path.join(seq_dir, "det"), exist_ok=True)
+    with open(os.path.join(seq_dir, "seqinfo.ini"), 'w') as f:
+        f.write(f"[Sequence]\nname={name}\nimDir=img1\nframeRate={frame_rate}\nseqLength={params['frames']}\n"
+                f"imWidth={IM_WIDTH}\nimHeight={IM_HEIGHT}\nimExt=.jpg\n")
+    np.savetxt(os.path.join(seq_dir, "gt", "gt.txt"), gt, fmt="%d,%d,%.2f,%.2f,%.2f,%.2f,%d,%d,%.3f")
+    mot_dets = np.column_stack([dets[:, 0], np.full(len(dets), -1), dets[:, 1:3], dets[:, 3:5] - dets[:, 1:3],
+                                dets[:, 5], np.full((len(dets), 3), -1)])
+    np.savetxt(os.path.join(seq_dir, "det", "det.txt"), mot_dets, fmt="%d,%d,%.2f,%.2f,%.2f,%.2f,%.3f,%d,%d,%d")
+    np.save(os.path.join(seq_dir, "det", "det.npy"), dets)
+    if embs is not None:
+        np.save(os.path.join(seq_dir, "det", "emb.npy"), embs)
+    with open(os.path.join(seq_dir, "synth.json"), 'w') as f:
+        json.dump({**params, "key": config_hash(params)}, f, indent=2)
+    return seq_dir
+
+
+def generate(object_counts, out_dir=SYNTH_DIR, frames=FRAMES, nonlinearity=NONLINEARITY,
+             occlusion_rate=OCCLUSION_RATE, box_noise=BOX_NOISE, miss_rate=MISS_RATE, fp_rate=FP_RATE,
+             emb_dim=EMB_DIM, seed=0, force=False):
+    """Generates one sequence per object count. Sequences whose parameters did not change are kept.
+    Returns the sequence names."""
+    names = []
+    for objects in object_counts:
+        params = {"objects": objects, "frames": frames, "nonlinearity": nonlinearity, "occlusion_rate": occlusion_rate,
+                  "box_noise": box_noise, "miss_rate": miss_rate, "fp_rate": fp_rate, "emb_dim": emb_dim, "seed": seed}
+        name = seq_name(objects, seed)
+        names.append(name)
+        meta_path = os.path.join(out_dir, name, "synth.json")
+        if not force and os.path.exists(meta_path):
+            with open(meta_path, 'r') as f:
+                if json.load(f).get("key") == config_hash(params):
+                    continue
+        gt, dets, embs = generate_sequence(objects, frames, nonlinearity, occlusion_rate, box_noise, miss_rate,
+                                           fp_rate, emb_dim, seed)
+        write_sequence(out_dir, name, gt, dets, embs, params)
+        occluded = float(np.mean(gt[:, 8] < 0.5))
+        print(f"   {name}: {frames} frames, {len(dets) / frames:.1f} dets/frame, {occluded:.0%} of GT boxes <50% visible")
+    return names
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generates synthetic crowd sequences (MOT GT + noisy detections).")
+    parser.add_argument("--objects", type=int, nargs="+", default=[10, 25, 50, 100, 200],
+                        help="Objects per frame; one sequence per value.")
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--nonlinearity", type=float, default=NONLINEARITY, help="0 (linear) .. 1 (dance-like).")
+    parser.add_argument("--occlusion-rate", type=float, default=OCCLUSION_RATE)
+    parser.add_argument("--box-noise", type=float, default=BOX_NOISE)
+    parser.add_argument("--miss-rate", type=float, default=MISS_RATE)
+    parser.add_argument("--fp-rate", type=float, default=FP_RATE)
+    parser.add_argument("--emb-dim", type=int, default=EMB_DIM, help="Embedding size for appearance trackers (0: none).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=SYNTH_DIR)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    print(f"🧪 Generating {len(args.objects)} synthetic sequences...")
+    generate(args.objects, args.out, args.frames, args.nonlinearity, args.occlusion_rate, args.box_noise,
+             args.miss_rate, args.fp_rate, args.emb_dim, args.seed, args.force)
+    print(f"✅ Synthetic sequences saved to {args.out}/")
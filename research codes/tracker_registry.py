@@ -0,0 +1,98 @@
+import os
+import sys
+import json
+import copy
+import itertools
+from pathlib import Path
+
+from mot_io import paper_name
+from run_manifest import config_hash
+
+# --- DYNAMIC IMPORTS ---
+try:
+    from boxmot.trackers.bytetrack.bytetrack import ByteTrack
+    from boxmot.trackers.deepocsort.deepocsort import DeepOcSort
+    from boxmot.trackers.strongsort.strongsort import StrongSort
+except ImportError:
+    print("⚠️ Standard import failed. Trying fallback to top-level boxmot...")
+    try:
+        from boxmot import ByteTrack, DeepOcSort, StrongSort
+    except ImportError:
+         print("❌ Critical: Could not import trackers from boxmot. Ensure 'boxmot' is installed.")
+         sys.exit(1)
+
+# --- CONFIGURATION ---
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs")
+TRACKERS_FILE = os.path.join(CONFIG_DIR, "trackers.json")
+REID_WEIGHTS = Path("weights/osnet_x0_25_msmt17.pt")
+
+# Class names usable in the "class" field of a tracker config
+TRACKER_CLASSES = {"DeepOcSort": DeepOcSort, "StrongSort": StrongSort, "ByteTrack": ByteTrack}
+
+
+def load_registry(path=TRACKERS_FILE):
+    """Loads tracker specs from a JSON config: {name: {"class": ..., "args": {...}}}.
+
+    Each returned spec also carries "name" (the unit name used for runs and the manifest),
+    "tracker" (the registry entry it derives from) and "folder" (its results folder, the paper
+    name for the standard trackers).
+    """
+    with open(path, 'r') as f:
+        raw = json.load(f)
+
+    specs = {}
+    for name, entry in raw.items():
+        if entry["class"] not in TRACKER_CLASSES:
+            raise ValueError(f"Unknown tracker class '{entry['class']}' for '{name}' in {path}")
+        specs[name] = {"name": name, "tracker": name, "folder": entry.get("folder") or paper_name(name) or name,
+                       "class": entry["class"], "args": dict(entry.get("args", {}))}
+    return specs
+
+
+def resolve_args(args, device):
+    """Substitutes ${DEVICE} and ${REID_WEIGHTS} placeholders in constructor arguments."""
+    resolved = {}
+    for k, v in args.items():
+        if v == "${DEVICE}":
+            v = device
+        elif v == "${REID_WEIGHTS}":
+            v = REID_WEIGHTS
+        resolved[k] = v
+    return resolved
+
+
+def uses_reid(spec):
+    """True for appearance trackers (configs with ReID weights)."""
+    return "reid_weights" in spec["args"]
+
+
+def build_tracker(spec, device):
+    """Instantiates the tracker described by a spec."""
+    return TRACKER_CLASSES[spec["class"]](**resolve_args(spec["args"], device))
+
+
+def reset_track_ids():
+    """Restarts ByteTrack's process-global ID counter so IDs only depend on the sequence itself."""
+    try:
+        from boxmot.trackers.bytetrack.basetrack import BaseTrack
+        BaseTrack.clear_count()
+    except ImportError:
+        pass
+
+
+def expand_grid(base_spec, grid):
+    """Expands a parameter grid ({arg: [values]}) into one spec per combination.
+
+    Variants are named '<tracker>-<hash of args>' and use that name as their results folder, so the
+    same combination always maps to the same outputs across sweeps.
+    """
+    keys = sorted(grid)
+    variants = []
+    for values in itertools.product(*(grid[k] for k in keys)):
+        spec = copy.deepcopy(base_spec)
+        spec["args"].update(dict(zip(keys, values)))
+        spec["params"] = dict(zip(keys, values))
+        spec["name"] = f"{base_spec['tracker']}-{config_hash(spec['args'])[:8]}"
+        spec["folder"] = spec["name"]
+        variants.append(spec)
+    return variants
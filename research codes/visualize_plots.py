@@ -1,60 +1,424 @@
+import os
+import json
+import time
+import glob
+import fnmatch
+import argparse
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+matplotlib.use("Agg")  # figures are only ever written to files, also from worker processes
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
-import os
 
-# Create assets folder if not exists
-os.makedirs("assets", exist_ok=True)
-
-# Data from Experiment (Updated with thesis results)
-data = {
-    'Tracker': ['StrongSORT', 'DeepOCSORT', 'ByteTrack'],
-    'HOTA': [42.20, 39.39, 38.21],
-    'DetA': [66.71, 65.71, 61.87],
-    'AssA': [27.04, 23.82, 23.81],
-    'IDF1': [40.44, 37.15, 39.48],
-    'FPS': [6.5, 18.5, 43.5],
-    'ID Switches': [2580, 1686, 2241]
+from dataset_config import load_datasets
+from eval_cache import file_digest
+from run_manifest import config_hash
+
+# --- CONFIGURATION ---
+OUTPUT_DIR = os.path.join("assets", "v2.0")  # the names the dashboard loads
+FIGURE_CACHE_FILE = "figure_cache.json"  # {figure: hash of its inputs, style and plotting code}
+DPI = 150  # the dashboard shows figures at most 1440 px wide; use --dpi 300 for print
+TRACKERS = ["StrongSORT", "DeepOCSORT", "ByteTrack"]
+METRICS_FILE = "metrics.csv"
+
+# Benchmark/evaluation outputs per dataset (results of evaluate_results.py, timing of main_benchmark.py),
+# the folders main_benchmark.py/evaluate_results.py --dataset write (configs/datasets.json)
+DATASETS = load_datasets()
+DATASET_SUFFIX = {"DanceTrack": "", "MOT17": "b", "MOT20": "c"}  # Figure_13.png, Figure_13b_..._MOT17.png, ...
+
+# Published thesis results, used for the summary figures of datasets without local evaluation output
+THESIS_RESULTS = {
+    "DanceTrack": {'Tracker': TRACKERS, 'HOTA': [42.20, 39.39, 38.21], 'DetA': [66.71, 65.71, 61.87],
+                   'AssA': [27.04, 23.82, 23.81], 'IDF1': [40.44, 37.15, 39.48], 'IDSW': [2580, 1686, 2241],
+                   'FPS': [6.5, 18.5, 43.5]},
+    "MOT17": {'Tracker': TRACKERS, 'HOTA': [42.8, 40.4, 39.7], 'DetA': [35.4, 34.1, 34.8], 'AssA': [52.0, 48.1, 45.6],
+              'IDF1': [51.3, 47.6, 46.9], 'IDSW': [2943, 2355, 2949], 'FPS': [14.5, 22.0, 28.0]},
+    "MOT20": {'Tracker': TRACKERS, 'HOTA': [14.5, 14.0, 14.3], 'DetA': [7.8, 7.0, 7.9], 'AssA': [27.0, 27.9, 25.9],
+              'IDF1': [14.7, 13.7, 14.7], 'IDSW': [2001, 1369, 1964], 'FPS': [5.0, 8.5, 11.0]},
 }
-df = pd.DataFrame(data)
 
-# Style
-sns.set_style("whitegrid")
-# Colors: Blue for StrongSORT, Red/Orange for DeepOCSORT, Green for ByteTrack
-colors = {'StrongSORT': '#2e86de', 'DeepOCSORT': '#e17055', 'ByteTrack': '#00b894'}
+# Style: Blue for StrongSORT, Red/Orange for DeepOCSORT, Green for ByteTrack
+SEABORN_STYLE = "whitegrid"
+COLORS = {'StrongSORT': '#2e86de', 'DeepOCSORT': '#e17055', 'ByteTrack': '#00b894'}
+STYLE = {"seaborn": SEABORN_STYLE, "colors": COLORS, "thesis": THESIS_RESULTS}
+sns.set_style(SEABORN_STYLE)
+
+
+# --- INPUTS ---
+# Loaders are memoised per process: a worker building several figures reads each file once.
+
+@lru_cache(maxsize=None)
+def load_metrics(dataset):
+    """Per-sequence evaluation table of a dataset (evaluate_results.py), or None."""
+    path = os.path.join(DATASETS[dataset]["results"], METRICS_FILE)
+    return pd.read_csv(path) if os.path.exists(path) else None
+
+
+@lru_cache(maxsize=None)
+def load_summary(dataset):
+    """One row per tracker (Tracker, HOTA, DetA, AssA, IDF1, IDSW, FPS, ...): the dataset's COMBINED
+    evaluation rows with the measured pipeline FPS when available, else the thesis numbers."""
+    metrics = load_metrics(dataset)
+    thesis = pd.DataFrame(THESIS_RESULTS[dataset])
+    if metrics is None:
+        return thesis
+    df = metrics[metrics["seq"] == "COMBINED"].rename(columns={"tracker": "Tracker"}).reset_index(drop=True)
+    fps = dict(zip(thesis["Tracker"], thesis["FPS"]))
+    timing_path = DATASETS[dataset]["timing"]
+    if os.path.exists(timing_path):
+        timing = pd.read_csv(timing_path)
+        rows = timing[(timing["seq"] == "ALL") & (timing["stage"] == "pipeline")]
+        measured = {str(t).lower(): v for t, v in zip(rows["tracker"], rows["fps"])}
+        fps = {t: measured.get(t.lower(), f) for t, f in fps.items()}
+    df["FPS"] = [fps.get(t, np.nan) for t in df["Tracker"]]
+    return df
+
+
+@lru_cache(maxsize=None)
+def load_tracks(dataset):
+    """All MOT result rows of a dataset: DataFrame with tracker, seq, frame, id, x, y, w, h."""
+    frames = []
+    for tracker in TRACKERS:
+        for path in sorted(glob.glob(os.path.join(DATASETS[dataset]["results"], tracker, "data", "*.txt"))):
+            rows = pd.read_csv(path, header=None, usecols=range(6), names=["frame", "id", "x", "y", "w", "h"])
+            frames.append(rows.assign(tracker=tracker, seq=os.path.splitext(os.path.basename(path))[0]))
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+
+def input_files(kind, datasets):
+    """Files a figure of this kind is drawn from ('summary', 'metrics' or 'tracks')."""
+    files = []
+    for dataset in datasets:
+        cfg = DATASETS[dataset]
+        if kind in ("summary", "metrics"):
+            files.append(os.path.join(cfg["results"], METRICS_FILE))
+        if kind == "summary":
+            files.append(cfg["timing"])
+        if kind == "tracks":
+            for tracker in TRACKERS:
+                files += sorted(glob.glob(os.path.join(cfg["results"], tracker, "data", "*.txt")))
+    return files
+
+
+def has_data(kind, datasets, fallback=False):
+    """Whether a figure has local outputs to draw from. Summary figures can also be drawn from the thesis
+    fallback alone (`fallback`), which only re-renders the committed figures, so that needs --force."""
+    if kind == "summary":
+        return fallback or bool(measured(datasets))
+    return any(os.path.exists(f) for f in input_files(kind, datasets))
+
+
+def measured(datasets):
+    return [ds for ds in datasets if load_metrics(ds) is not None]
+
+
+# --- FIGURE REGISTRY ---
+# name -> {"plot": function(datasets) -> Figure, "kind": input kind, "datasets": tuple}
+
+FIGURES = {}
+
+
+def figure(name, kind, datasets=tuple(DATASETS)):
+    def register(plot):
+        FIGURES[name] = {"plot": plot, "kind": kind, "datasets": tuple(datasets)}
+        return plot
+    return register
+
+
+def per_dataset(number, title, kind):
+    """Registers one figure per dataset (Figure_10_X.png, Figure_10b_X_MOT17.png, Figure_10c_X_MOT20.png)."""
+    def register(plot):
+        for dataset, suffix in DATASET_SUFFIX.items():
+            tag = "" if dataset == "DanceTrack" else f"_{dataset}"
+            FIGURES[f"Figure_{number}{suffix}_{title}{tag}.png"] = {"plot": plot, "kind": kind, "datasets": (dataset,)}
+        return plot
+    return register
+
+
+def _summaries(datasets):
+    return pd.concat([load_summary(ds).assign(Dataset=ds) for ds in datasets], ignore_index=True)
+
+
+def _metric_bars(datasets, metric, title, fmt="%.1f"):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    sns.barplot(data=_summaries(datasets), x="Dataset", y=metric, hue="Tracker", hue_order=TRACKERS,
+                palette=COLORS, ax=ax)
+    for container in ax.containers:
+        ax.bar_label(container, fmt=fmt, fontsize=8)
+    ax.set_title(title)
+    fig.tight_layout()
+    return fig
+
+
+@figure("Figure_1_HOTA_Comparison.png", "summary")
+def plot_hota(datasets):
+    return _metric_bars(datasets, "HOTA", "HOTA per Dataset (Higher is Better)")
+
+
+@figure("Figure_2_IDF1_Analysis.png", "summary")
+def plot_idf1(datasets):
+    return _metric_bars(datasets, "IDF1", "IDF1: Identity Preservation per Dataset")
+
+
+@figure("Figure_7_ID_Switches.png", "summary")
+def plot_id_switches(datasets):
+    return _metric_bars(datasets, "IDSW", "Identity Switches (Lower is Better)", fmt="%d")
+
 
-def generate_plots():
+@figure("Figure_3_Component_Analysis.png", "summary")
+def plot_components(datasets):
+    fig, axes = plt.subplots(1, len(datasets), figsize=(5 * len(datasets), 5), sharey=True, squeeze=False)
+    for ax, dataset in zip(axes[0], datasets):
+        melted = load_summary(dataset).melt(id_vars=["Tracker"], value_vars=["DetA", "AssA"],
+                                            var_name="Component", value_name="Score (%)")
+        sns.barplot(data=melted, x="Component", y="Score (%)", hue="Tracker", hue_order=TRACKERS, palette=COLORS, ax=ax)
+        ax.set_title(dataset)
+        ax.set_ylim(0, 100)
+        if ax is not axes[0][-1]:
+            ax.get_legend().remove()
+    fig.suptitle("Detection vs Association Accuracy (DetA / AssA)")
+    fig.tight_layout(rect=(0, 0, 1, 0.95))
+    return fig
+
+
+@figure("Figure_4_Radar_Charts.png", "summary")
+def plot_radar(datasets):
+    axes_labels = ["HOTA", "DetA", "AssA", "IDF1", "FPS", "Stability"]
+    angles = np.linspace(0, 2 * np.pi, len(axes_labels), endpoint=False).tolist()
+    fig, axes = plt.subplots(1, len(datasets), figsize=(5 * len(datasets), 5), subplot_kw={"polar": True}, squeeze=False)
+    for ax, dataset in zip(axes[0], datasets):
+        df = load_summary(dataset).set_index("Tracker")
+        values = df[["HOTA", "DetA", "AssA", "IDF1", "FPS"]].assign(Stability=1 / df["IDSW"].clip(lower=1))
+        values = values / values.max()  # each axis relative to the best tracker on this dataset
+        for tracker in [t for t in TRACKERS if t in values.index]:
+            v = values.loc[tracker].tolist()
+            ax.plot(angles + angles[:1], v + v[:1], color=COLORS[tracker], label=tracker)
+            ax.fill(angles + angles[:1], v + v[:1], color=COLORS[tracker], alpha=0.15)
+        ax.set_xticks(angles)
+        ax.set_xticklabels(axes_labels)
+        ax.set_yticklabels([])
+        ax.set_title(dataset, pad=15)
+    axes[0][-1].legend(loc="upper right", bbox_to_anchor=(1.35, 1.1))
+    fig.tight_layout()
+    return fig
+
+
+@figure("Figure_12_Efficiency_Frontier.png", "summary")
+def plot_efficiency(datasets):
+    fig, ax = plt.subplots(figsize=(9, 7))
+    sns.scatterplot(data=_summaries(datasets), x="FPS", y="HOTA", hue="Tracker", hue_order=TRACKERS, style="Dataset",
+                    s=300, palette=COLORS, ax=ax)
+    ax.set_xscale("log")
+    ax.set_title("Speed (FPS) vs Accuracy (HOTA)")
+    ax.grid(True, which="both", ls="--", linewidth=0.5)
+    fig.tight_layout()
+    return fig
+
+
+@figure("Figure_6_Correlation_Heatmap.png", "metrics")
+def plot_correlation(datasets):
+    per_seq = pd.concat([load_metrics(ds) for ds in measured(datasets)])
+    per_seq = per_seq[per_seq["seq"] != "COMBINED"]
+    columns = ["HOTA", "DetA", "AssA", "IDF1", "MOTA", "IDSW", "Frag", "GT_IDs"]
+    fig, ax = plt.subplots(figsize=(9, 7))
+    sns.heatmap(per_seq[columns].corr(), annot=True, fmt=".2f", cmap="coolwarm", vmin=-1, vmax=1, ax=ax)
+    ax.set_title("Metric Correlation across Sequences")
+    fig.tight_layout()
+    return fig
+
+
+@figure("Figure_8_Precision_Recall.png", "metrics")
+def plot_precision_recall(datasets):
+    fig, ax = plt.subplots(figsize=(9, 7))
+    rows = pd.concat([load_summary(ds).assign(Dataset=ds) for ds in measured(datasets)], ignore_index=True)
+    sns.scatterplot(data=rows, x="DetRe", y="DetPr", hue="Tracker", hue_order=TRACKERS, style="Dataset", s=300,
+                    palette=COLORS, ax=ax)
+    ax.set_title("Detection Precision vs Recall")
+    fig.tight_layout()
+    return fig
+
+
+@figure("Figure_9_Error_Donut.png", "metrics", datasets=("DanceTrack",))
+def plot_error_donut(datasets):
+    df = load_summary(datasets[0]).set_index("Tracker")
+    trackers = [t for t in TRACKERS if t in df.index]
+    fig, axes = plt.subplots(1, len(trackers), figsize=(5 * len(trackers), 5), squeeze=False)
+    for ax, tracker in zip(axes[0], trackers):
+        errors = df.loc[tracker, ["CLR_FP", "CLR_FN", "IDSW"]]
+        ax.pie(np.log10(errors.astype(float).clip(lower=1)) + 1, labels=[f"FP\n{errors['CLR_FP']:,}",
+               f"FN\n{errors['CLR_FN']:,}", f"IDSW\n{errors['IDSW']:,}"], colors=["#fdcb6e", "#d63031", "#6c5ce7"],
+               wedgeprops={"width": 0.4}, startangle=90)
+        ax.set_title(tracker)
+    fig.suptitle(f"Error Distribution on {datasets[0]} (Log Scale)")
+    fig.tight_layout(rect=(0, 0, 1, 0.95))
+    return fig
+
+
+@figure("Figure_11_Density_Analysis.png", "metrics")
+def plot_density(datasets):
+    per_seq = pd.concat([load_metrics(ds).assign(Dataset=ds) for ds in measured(datasets)])
+    per_seq = per_seq[per_seq["seq"] != "COMBINED"]
+    fig, ax = plt.subplots(figsize=(9, 7))
+    sns.scatterplot(data=per_seq, x="GT_IDs", y="HOTA", hue="tracker", hue_order=TRACKERS, style="Dataset",
+                    palette=COLORS, s=80, ax=ax)
+    ax.set_xlabel("Ground-truth identities per sequence")
+    ax.set_title("HOTA vs Scene Density")
+    fig.tight_layout()
+    return fig
+
+
+@per_dataset(10, "Temporal_Stability", "metrics")
+def plot_temporal_stability(datasets):
+    per_seq = load_metrics(datasets[0])
+    per_seq = per_seq[per_seq["seq"] != "COMBINED"].pivot(index="seq", columns="tracker", values="HOTA")
+    fig, ax = plt.subplots(figsize=(12, 5))
+    for tracker in [t for t in TRACKERS if t in per_seq.columns]:
+        ax.plot(range(len(per_seq)), per_seq[tracker], marker="o", color=COLORS[tracker], label=tracker)
+    ax.set_xticks(range(len(per_seq)))
+    ax.set_xticklabels(per_seq.index, rotation=60, ha="right", fontsize=8)
+    ax.set_ylabel("HOTA")
+    ax.set_title(f"Per-Sequence HOTA on {datasets[0]}")
+    ax.legend()
+    fig.tight_layout()
+    return fig
+
+
+@per_dataset(13, "Trajectories", "tracks")
+def plot_trajectories(datasets):
+    tracks = load_tracks(datasets[0])
+    trackers = [t for t in TRACKERS if t in set(tracks["tracker"])]
+    common = set.intersection(*(set(tracks.loc[tracks["tracker"] == t, "seq"]) for t in trackers))
+    seq = min(common) if common else tracks["seq"].min()
+    fig, axes = plt.subplots(1, len(trackers), figsize=(6 * len(trackers), 5), sharex=True, sharey=True, squeeze=False)
+    for ax, tracker in zip(axes[0], trackers):
+        rows = tracks[(tracks["tracker"] == tracker) & (tracks["seq"] == seq)].sort_values("frame")
+        cmap = plt.get_cmap("tab20")
+        for tid, track in rows.groupby("id"):
+            ax.plot(track["x"] + track["w"] / 2, track["y"] + track["h"], color=cmap(int(tid) % 20), linewidth=1)
+        ax.set_title(f"{tracker} ({rows['id'].nunique()} IDs)")
+    axes[0][0].invert_yaxis()
+    fig.suptitle(f"Trajectories on {seq}")
+    fig.tight_layout(rect=(0, 0, 1, 0.95))
+    return fig
+
+
+@per_dataset(14, "Track_Lifespan", "tracks")
+def plot_lifespan(datasets):
+    tracks = load_tracks(datasets[0])
+    lifespans = tracks.groupby(["tracker", "seq", "id"]).size().rename("Frames").reset_index()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    sns.histplot(data=lifespans, x="Frames", hue="tracker", hue_order=TRACKERS, palette=COLORS, element="step",
+                 log_scale=(True, False), ax=ax)
+    ax.set_title(f"Track Lifespan on {datasets[0]} (Longer is Better)")
+    fig.tight_layout()
+    return fig
+
+
+# --- BUILD ---
+
+@lru_cache(maxsize=None)
+def code_digest():
+    """Digest of this module's source and the plotting library versions. Plot functions share helpers
+    and loaders, so any edit to the module invalidates every figure."""
+    return config_hash({"module": file_digest(os.path.abspath(__file__)),
+                        "matplotlib": matplotlib.__version__, "seaborn": sns.__version__})
+
+
+def figure_key(name, digests, dpi=DPI):
+    """Hash of everything a figure depends on: its input files, the style and the plotting code."""
+    spec = FIGURES[name]
+    inputs = {}
+    for path in input_files(spec["kind"], spec["datasets"]):
+        if path not in digests:
+            digests[path] = file_digest(path) if os.path.exists(path) else None
+        inputs[path] = digests[path]
+    return config_hash({"name": name, "inputs": inputs, "style": STYLE, "dpi": dpi,
+                        "code": code_digest()})
+
+
+def build_figure(name, out_dir=OUTPUT_DIR, dpi=DPI):
+    """Draws one registered figure and writes it atomically. Returns seconds taken."""
+    t0 = time.perf_counter()
+    spec = FIGURES[name]
+    fig = spec["plot"](list(spec["datasets"]))
+    tmp_path = os.path.join(out_dir, f".{name}.tmp.png")
+    fig.savefig(tmp_path, dpi=dpi)
+    plt.close(fig)
+    os.replace(tmp_path, os.path.join(out_dir, name))
+    return time.perf_counter() - t0
+
+
+def _build_job(job):
+    return build_figure(*job)
+
+
+def generate_plots(names=None, out_dir=OUTPUT_DIR, dpi=DPI, workers=None, force=False, cache_file=FIGURE_CACHE_FILE):
+    """Builds the registered figures whose inputs, style or code changed since their last build,
+    in parallel worker processes. Figures without local outputs are skipped; with `force` summary
+    figures are also drawn from the thesis numbers alone. Returns {figure: 'built' | 'cached' | 'no data'}."""
     print("📊 Generating Figures...")
-    
-    # Fig 1: Performance Comparison (Bar Chart)
-    plt.figure(figsize=(10, 6))
-    df_melted = df.melt(id_vars=['Tracker'], value_vars=['HOTA', 'DetA', 'AssA'], var_name='Metric', value_name='Score (%)')
-    sns.barplot(x='Metric', y='Score (%)', hue='Tracker', data=df_melted, palette=colors)
-    plt.title("Performance Comparison (HOTA, DetA, AssA)")
-    plt.ylim(0, 100)
-    plt.tight_layout()
-    plt.savefig('assets/Fig1_Performance_Comparison.png', dpi=300)
-    print("Saved Fig 1")
-    
-    # Fig 4: Trade-off (Scatter Plot)
-    plt.figure(figsize=(9, 7))
-    sns.scatterplot(data=df, x='FPS', y='HOTA', hue='Tracker', style='Tracker', s=400, palette=colors)
-    plt.xscale('log')
-    plt.title("Speed (FPS) vs Accuracy (HOTA)")
-    plt.grid(True, which="both", ls="--", linewidth=0.5)
-    plt.tight_layout()
-    plt.savefig('assets/Fig4_Speed_vs_Accuracy.png', dpi=300)
-    print("Saved Fig 4")
-
-    # Fig 6: Errors (Bar Chart for ID Switches)
-    plt.figure(figsize=(8, 6))
-    sns.barplot(x='Tracker', y='ID Switches', data=df, palette=colors)
-    plt.title("Identity Switches (Lower is Better)")
-    plt.tight_layout()
-    plt.savefig('assets/Fig6_Error_Analysis.png', dpi=300)
-    print("Saved Fig 6")
-    
-    print("✅ All Figures saved to 'assets/' folder.")
+    t0 = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    cache = {}
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+
+    status, todo, digests = {}, {}, {}
+    for name in names or FIGURES:
+        spec = FIGURES[name]
+        if not has_data(spec["kind"], spec["datasets"], fallback=force):
+            status[name] = "no data"
+            continue
+        key = figure_key(name, digests, dpi)
+        if not force and cache.get(name) == key and os.path.exists(os.path.join(out_dir, name)):
+            status[name] = "cached"
+        else:
+            todo[name] = key
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_build_job, (name, out_dir, dpi)): name for name in todo}
+            for future in as_completed(futures):
+                name = futures[future]
+                print(f"   Saved {name} ({future.result():.1f}s)")
+                status[name], cache[name] = "built", todo[name]
+    else:
+        for name in todo:
+            print(f"   Saved {name} ({build_figure(name, out_dir, dpi):.1f}s)")
+            status[name], cache[name] = "built", todo[name]
+
+    tmp_path = cache_file + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, cache_file)
+
+    counts = {s: sum(v == s for v in status.values()) for s in ("built", "cached", "no data")}
+    print(f"✅ {counts['built']} figures built, {counts['cached']} unchanged, {counts['no data']} without data "
+          f"in {time.perf_counter() - t0:.1f}s ({workers} workers) -> '{out_dir}/'")
+    return status
+
 
 if __name__ == "__main__":
-    generate_plots()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Builds the thesis/dashboard figures from the evaluation outputs.")
+    parser.add_argument("--only", nargs="+", help="Figure names or glob patterns (default: all registered figures).")
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    parser.add_argument("--dpi", type=int, default=DPI)
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores).")
+    parser.add_argument("--force", action="store_true", help="Rebuild figures even if their inputs are unchanged, summary figures also "
+                             "from the thesis numbers alone (overwrites the committed figures).")
+    parser.add_argument("--list", action="store_true", help="List the registered figures and exit.")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, spec in FIGURES.items():
+            print(f"{name:<45} {spec['kind']:<8} {', '.join(spec['datasets'])}")
+    else:
+        names = None
+        if args.only:
+            names = [n for n in FIGURES if any(fnmatch.fnmatch(n, p) or n == p for p in args.only)]
+        generate_plots(names, args.out, args.dpi, args.workers, args.force)